@@ -0,0 +1,144 @@
+"""Tạo tải cho community server và đo số tap/giây nó nhận được.
+
+Server chạy trong một tiến trình riêng (một luồng asyncio, tức một core);
+tiến trình này mở nhiều kết nối client, mỗi client gửi lô tap theo chu kỳ,
+và một kết nối theo dõi đọc tổng được phát ra để tính tốc độ nạp thật.
+
+Trước phần đo tải, một server trong tiến trình này nhận lô gian lận (``taps``
+cực lớn, tap dồn nhanh hơn người); server cộng chúng vào tổng hoặc không ngắt
+kết nối lô quá cỡ thì thoát mã 1.
+
+    python -m benchmarks.bench_community --clients 3000 --tps 20 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+from cong_duc.community import MAX_TAPS_PER_FRAME, TAP_BATCH, TOTALS, CommunityServer
+
+
+async def run_client(host: str, port: int, taps_per_second: float, batch_ms: int, stop: asyncio.Event) -> None:
+    _, writer = await asyncio.open_connection(host, port)
+    loop = asyncio.get_running_loop()
+    per_batch = taps_per_second * batch_ms / 1000
+    owed = 0.0
+    # Lệch pha giữa các client để tải không dồn cùng một lúc.
+    next_at = loop.time() + (id(writer) % batch_ms) / 1000
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, next_at - loop.time()))
+        next_at += batch_ms / 1000
+        owed += per_batch
+        taps = int(owed)
+        if taps:
+            owed -= taps
+            writer.write(TAP_BATCH.pack(taps, taps + taps // 5))
+    writer.close()
+
+
+async def monitor(host: str, port: int, seconds: float) -> list[tuple[float, int, int]]:
+    reader, writer = await asyncio.open_connection(host, port)
+    samples = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            data = await asyncio.wait_for(reader.readexactly(TOTALS.size), timeout=1.0)
+        except asyncio.TimeoutError:
+            continue
+        merit, taps = TOTALS.unpack(data)
+        samples.append((time.perf_counter(), merit, taps))
+    writer.close()
+    return samples
+
+
+async def abuse(host: str, port: int) -> list[str]:
+    """Gửi lô gian lận tới một ``CommunityServer`` riêng; trả về danh sách lỗi."""
+    server = CommunityServer()
+    listener = await server.start(host, port)
+    failures = []
+    async with listener:
+        # Lô 2**32-1 tap: merit vẫn hợp lệ theo taps * 2 nhưng không tay nào bấm nổi.
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(TAP_BATCH.pack(2**32 - 1, 2**31 - 1))
+        try:
+            closed = await asyncio.wait_for(reader.read(), timeout=2.0) == b""
+        except asyncio.TimeoutError:
+            closed = False
+        writer.close()
+        if not closed:
+            failures.append("lô taps cực lớn không bị ngắt kết nối")
+        if server.totals() != (0, 0):
+            failures.append(f"lô taps cực lớn được cộng vào tổng: {server.totals()}")
+
+        # Hai lô đầy thùng liền nhau: lô thứ hai vượt tốc độ người nên bị bỏ.
+        _, writer = await asyncio.open_connection(host, port)
+        writer.write(TAP_BATCH.pack(MAX_TAPS_PER_FRAME, MAX_TAPS_PER_FRAME) * 2)
+        await writer.drain()
+        await asyncio.sleep(0.2)
+        writer.close()
+        if server.totals() != (MAX_TAPS_PER_FRAME, MAX_TAPS_PER_FRAME):
+            failures.append(f"lô vượt tốc độ người được cộng vào tổng: {server.totals()}")
+        if server.rejected != 2 or server.kicked != 1:
+            failures.append(f"rejected={server.rejected}, kicked={server.kicked}, mong đợi 2 và 1")
+        await server.close()
+    return failures
+
+
+async def load(args: argparse.Namespace) -> list[tuple[float, int, int]]:
+    stop = asyncio.Event()
+    clients = []
+    for _ in range(args.clients):
+        clients.append(asyncio.create_task(run_client(args.host, args.port, args.tps, args.batch_ms, stop)))
+    # Bỏ giai đoạn mở kết nối khỏi phần đo.
+    await asyncio.sleep(1.0)
+    samples = await monitor(args.host, args.port, args.seconds)
+    stop.set()
+    await asyncio.gather(*clients, return_exceptions=True)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7399)
+    parser.add_argument("--clients", type=int, default=3000)
+    parser.add_argument("--tps", type=float, default=20.0, help="tap mỗi giây của mỗi client")
+    parser.add_argument("--batch-ms", type=int, default=250)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    failures = asyncio.run(abuse(args.host, args.port + 1))
+    if failures:
+        print("\n".join(["server nhận lô gian lận:", *failures]))
+        sys.exit(1)
+    print("ok: lô taps cực lớn bị ngắt kết nối, lô vượt tốc độ người bị bỏ")
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "cong_duc.community", "--host", args.host, "--port", str(args.port)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        server.stdout.readline()  # chờ server in dòng sẵn sàng
+        samples = asyncio.run(load(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    if len(samples) < 2:
+        print("không nhận được đủ bản tin tổng từ server")
+        return
+    (t0, _, taps0), (t1, merit1, taps1) = samples[0], samples[-1]
+    rate = (taps1 - taps0) / (t1 - t0)
+    print(f"clients:      {args.clients} x {args.tps:g} tap/s, lô mỗi {args.batch_ms} ms")
+    print(f"offered:      {args.clients * args.tps:,.0f} tap/s")
+    print(f"ingested:     {rate:,.0f} tap/s ({len(samples) / (t1 - t0):.1f} bản tin tổng/s)")
+    print(f"totals:       {taps1:,} tap, {merit1:,} công đức")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Đo độ khó thích ứng: chi phí cập nhật kỹ năng mỗi tap và tỉ lệ qua màn theo nhóm người chơi.
+
+Mỗi nhóm là một kiểu người chơi giả lập (tỉ lệ trúng, tap/giây, phản xạ);
+mỗi người chơi ``--games`` ván liên tiếp với cùng một ``SkillModel`` (vài ván
+đầu để làm nóng, không tính). Với luật cố định, tỉ lệ qua màn chênh nhau rất
+xa giữa các nhóm; với ``AdaptiveRules`` thì mọi nhóm nên quanh ``--pass-rate``.
+
+    python -m benchmarks.bench_difficulty --players 40 --games 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from cong_duc.difficulty import AdaptiveRules, SkillModel
+from cong_duc.engine import TAP_IGNORED, GameEngine, LevelRules, simulated_player
+
+# (tên, tỉ lệ trúng, tap/giây, phản xạ ms)
+PROFILES = (
+    ("mới chơi", 0.62, 3.5, 450),
+    ("trung bình", 0.8, 5.0, 300),
+    ("khá", 0.9, 7.0, 220),
+    ("giỏi", 0.97, 10.0, 150),
+)
+
+
+def play_game(engine: GameEngine, skill: SkillModel | None, rng: random.Random, profile: tuple) -> None:
+    _, hit_rate, tps, reaction = profile
+    engine.start_game(0, rng.randrange(1 << 32))
+    for t, x, y in simulated_player(engine, rng, tps, hit_rate, reaction):
+        engine.advance(t)
+        # Nhịp Mỏ của level mà tap được chấm (tap lên level sẽ đổi nhịp).
+        moved_at = engine.last_move_at
+        move_ms = engine.move_interval_ms
+        result = engine.tap(x, y, t)
+        if skill is not None and result != TAP_IGNORED:
+            skill.observe(engine.last_gain > 0, engine.now, moved_at, move_ms)
+
+
+def pass_rate(profile: tuple, adaptive: float | None, players: int, games: int, warmup: int, seed: int) -> float:
+    reached = cleared = 0
+    for p in range(players):
+        rng = random.Random(seed * 1000 + p)
+        skill = SkillModel() if adaptive is not None else None
+        rules = AdaptiveRules(skill, pass_rate=adaptive) if adaptive is not None else LevelRules()
+        engine = GameEngine(rules=rules, rng=random.Random(p))
+        for game in range(games):
+            play_game(engine, skill, rng, profile)
+            if game >= warmup:
+                # Ván dừng ở level L: đã vào L level, qua L - 1 level.
+                reached += engine.level
+                cleared += engine.level - 1
+    return cleared / reached if reached else 0.0
+
+
+def observe_cost(taps: int) -> float:
+    skill = SkillModel()
+    rng = random.Random(1)
+    outcomes = [(rng.random() < 0.85, i * 150, i * 150 - rng.randrange(600)) for i in range(taps)]
+    observe = skill.observe
+    start = time.perf_counter()
+    for hit, now, moved_at in outcomes:
+        observe(hit, now, moved_at, 600)
+    return (time.perf_counter() - start) / taps * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=40, help="số người chơi mỗi nhóm")
+    parser.add_argument("--games", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--pass-rate", type=float, default=0.7)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"SkillModel.observe: {observe_cost(1_000_000):.0f} ns/tap\n")
+    print(f"{'nhóm':<12}{'cố định':>10}{'thích ứng':>11}   (tỉ lệ qua màn, mục tiêu {args.pass_rate:.0%})")
+    for profile in PROFILES:
+        fixed = pass_rate(profile, None, args.players, args.games, args.warmup, args.seed)
+        adaptive = pass_rate(profile, args.pass_rate, args.players, args.games, args.warmup, args.seed)
+        print(f"{profile[0]:<12}{fixed:>10.1%}{adaptive:>11.1%}")
+
+
+if __name__ == "__main__":
+    main()
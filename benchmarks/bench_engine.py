@@ -0,0 +1,66 @@
+"""Đo thông lượng GameEngine chạy headless (không cần màn hình).
+
+    python -m benchmarks.bench_engine --sessions 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from cong_duc.engine import GameEngine, simulated_player
+
+
+def record_sessions(count: int, taps_per_second: float) -> list[tuple[int, list[tuple[int, float, float]]]]:
+    # Ghi lại luồng tap của từng ván để phần đo chỉ còn chi phí của engine.
+    sessions = []
+    for seed in range(count):
+        engine = fresh_engine(seed)
+        taps: list[tuple[int, float, float]] = []
+        player = simulated_player(engine, random.Random(seed + 1), taps_per_second, 0.92, 150)
+        engine.run(taps.append(tap) or tap for tap in player)
+        sessions.append((seed, taps))
+    return sessions
+
+
+def fresh_engine(seed: int) -> GameEngine:
+    engine = GameEngine(rng=random.Random(seed))
+    engine.start_game(0)
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--tps", type=float, default=12.0, help="tap mỗi giây của người chơi giả lập")
+    args = parser.parse_args()
+
+    sessions = record_sessions(args.sessions, args.tps)
+    total_taps = sum(len(taps) for _, taps in sessions)
+
+    # Tạo engine trước để chỉ đo phần xử lý tap.
+    engines = [fresh_engine(seed) for seed, _ in sessions]
+    start = time.perf_counter()
+    for engine, (_, taps) in zip(engines, sessions):
+        engine.run(taps)
+    elapsed = time.perf_counter() - start
+
+    engines = [fresh_engine(seed) for seed, _ in sessions]
+    start = time.perf_counter()
+    for engine, (_, taps) in zip(engines, sessions):
+        tap = engine.tap
+        for t, x, y in taps:
+            tap(x, y, t)
+    elapsed_tap = time.perf_counter() - start
+
+    game_ms = sum(taps[-1][0] for _, taps in sessions if taps)
+    print(f"sessions:            {len(sessions)}")
+    print(f"taps:                {total_taps}")
+    print(f"run():   taps/s      {total_taps / elapsed:,.0f}")
+    print(f"tap():   taps/s      {total_taps / elapsed_tap:,.0f}")
+    print(f"speed vs real time:  {game_ms / 1000 / elapsed:,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
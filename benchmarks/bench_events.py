@@ -0,0 +1,102 @@
+"""Đo luồng sự kiện phân tích: chi phí emit trên luồng chơi và tổng hợp offline.
+
+Phần 1 cho cùng các ván giả lập chạy qua ``GameEngine.tap`` có và không có
+``EventStream``, để thấy mỗi tap tốn thêm bao nhiêu khi ghi sự kiện (luồng nền
+xả ra đĩa song song). Phần 2 sinh ``--events`` sự kiện bằng các ván giả lập
+với tỉ lệ trúng khác nhau, ghi thành nhiều phiên, rồi chạy
+``cong_duc.analytics`` trên toàn bộ và in bảng.
+
+    python -m benchmarks.bench_events --events 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from cong_duc import analytics
+from cong_duc.engine import GameEngine, simulated_player
+from cong_duc.events import EventStream
+
+
+def record_sessions(count: int, seed: int) -> list[tuple[int, float, list[tuple[int, float, float]]]]:
+    sessions = []
+    rng = random.Random(seed)
+    for i in range(count):
+        hit_rate = rng.uniform(0.6, 0.97)
+        engine = GameEngine(rng=random.Random(i))
+        engine.start_game(0)
+        taps: list[tuple[int, float, float]] = []
+        player = simulated_player(engine, random.Random(i + 1), rng.uniform(4, 12), hit_rate, 160)
+        engine.run(taps.append(tap) or tap for tap in player)
+        sessions.append((i, hit_rate, taps))
+    return sessions
+
+
+def replay_taps(sessions: list[tuple[int, float, list[tuple[int, float, float]]]], events: EventStream | None) -> float:
+    """Chạy lại mọi ván qua ``tap``; trả về số giây đã dùng."""
+    elapsed = 0.0
+    for i, _, taps in sessions:
+        engine = GameEngine(rng=random.Random(i), events=events)
+        engine.start_game(0)
+        start = time.perf_counter()
+        for t, x, y in taps:
+            engine.tap(x, y, t)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=3000, help="số ván cho phần đo chi phí emit")
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--files", type=int, default=20, help="số phiên (file) khi sinh dữ liệu")
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    sessions = record_sessions(args.sessions, args.seed)
+    taps = sum(len(s[2]) for s in sessions)
+    with tempfile.TemporaryDirectory() as directory:
+        bare = replay_taps(sessions, None)
+        stream = EventStream(directory)
+        with_events = replay_taps(sessions, stream)
+        stream.close()
+        stats = stream.stats()
+    print(f"{taps} tap, {stats['emitted']} sự kiện, {stats['batches']} lô, bỏ {stats['dropped']}")
+    print(f"không ghi:  {bare / taps * 1e9:>8.0f} ns/tap")
+    print(f"có ghi:     {with_events / taps * 1e9:>8.0f} ns/tap  (+{(with_events - bare) / taps * 1e9:.0f} ns)")
+
+    rng = random.Random(args.seed + 1)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        produced = 0
+        game = 0
+        per_file = args.events // args.files + 1
+        for session in range(args.files):
+            stream = EventStream(directory, capacity=1 << 18, session=session)
+            while stream.emitted < per_file and produced + stream.emitted < args.events:
+                engine = GameEngine(rng=random.Random(game), events=stream)
+                engine.start_game(0)
+                engine.run(simulated_player(engine, random.Random(~game), rng.uniform(4, 12), rng.uniform(0.6, 0.97)))
+                game += 1
+            produced += stream.emitted
+            stream.close()
+        print(f"\nsinh {produced} sự kiện, {game} ván, {args.files} phiên: {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        events = analytics.load_events([Path(directory)])
+        loaded = time.perf_counter()
+        rows = analytics.level_table(events, args.levels)
+        breaks = analytics.combo_breaks(events)
+        done = time.perf_counter()
+    print(f"đọc {loaded - start:.2f} s, tổng hợp {(done - loaded) * 1000:.1f} ms")
+    print(analytics.format_table(rows))
+    print(f"combo lúc đứt (0..20+): {breaks.tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""So sánh vẽ lại Mỏ (xóa + tạo lại) với retained mode (canvas.move theo tag).
+
+Cần màn hình Tk thật; trên máy không có màn hình dùng ``xvfb-run``:
+
+    xvfb-run python -m benchmarks.bench_fish_render --moves 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from cong_duc_dien_tu12 import CyberWoodenFishApp
+
+MOVE_INTERVAL_FLOOR_MS = 260
+
+
+def measure(retained: bool, moves: int) -> dict[str, float]:
+    root = tk.Tk()
+    app = CyberWoodenFishApp(root, retained_render=retained)
+    root.update()
+    app.engine.start_game(app.now_ms())
+    app.place_fish()
+    root.update()
+
+    canvas = app.canvas
+    # Id item trên canvas tăng đơn điệu nên hiệu hai id mốc = số item đã tạo.
+    first_probe = canvas.create_line(0, 0, 0, 0)
+    frame_ms = []
+    for _ in range(moves):
+        app.engine.random_reposition_fish()
+        start = time.perf_counter()
+        app.place_fish()
+        root.update_idletasks()
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    created = canvas.create_line(0, 0, 0, 0) - first_probe - 1
+    root.destroy()
+
+    moves_per_minute = 60_000 / MOVE_INTERVAL_FLOOR_MS
+    return {
+        "items_per_minute": created / moves * moves_per_minute,
+        "frame_ms_mean": statistics.fmean(frame_ms),
+        "frame_ms_p95": statistics.quantiles(frame_ms, n=20)[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'items/min':>12}{'frame ms':>12}{'p95 ms':>12}")
+    for label, retained in (("rebuild", False), ("retained", True)):
+        result = measure(retained, args.moves)
+        print(
+            f"{label:<10}{result['items_per_minute']:>12.0f}"
+            f"{result['frame_ms_mean']:>12.3f}{result['frame_ms_p95']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Đo CPU lúc rảnh của animation glow: itemconfig từng vòng so với frame dựng sẵn.
+
+Mở bản game có level, không bấm gì, để mainloop chạy ``--seconds`` giây và đo
+CPU tiến trình đã dùng. Chế độ "hidden" thu nhỏ cửa sổ để kiểm tra glow dừng
+hẳn khi không hiển thị. Cần màn hình Tk thật; trên máy không có màn hình:
+
+    xvfb-run python -m benchmarks.bench_glow --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tkinter as tk
+
+from cong_duc_dien_tu12 import CyberWoodenFishApp
+
+
+def measure(prerendered: bool, hidden: bool, seconds: float) -> dict[str, float]:
+    root = tk.Tk()
+    app = CyberWoodenFishApp(root, prerendered_glow=prerendered)
+    root.update()
+    if hidden:
+        root.iconify()
+        root.update()
+
+    frames_before = app.scheduler.frames
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    root.after(int(seconds * 1000), root.quit)
+    root.mainloop()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    frames = app.scheduler.frames - frames_before
+    root.destroy()
+    return {"cpu_percent": cpu / wall * 100, "frames_per_s": frames / wall}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    print(f"{'mode':<22}{'CPU %':>8}{'frames/s':>10}")
+    for label, prerendered, hidden in (
+        ("itemconfig", False, False),
+        ("itemconfig, hidden", False, True),
+        ("prerendered", True, False),
+        ("prerendered, hidden", True, True),
+    ):
+        result = measure(prerendered, hidden, args.seconds)
+        print(f"{label:<22}{result['cpu_percent']:>8.2f}{result['frames_per_s']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Thời gian phân giải một tap theo số mục tiêu: lưới đều so với quét tuyến tính.
+
+    python -m benchmarks.bench_hit_test --counts 1 10 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from cong_duc.spatial import TargetField
+
+FIELD_W = 1920
+FIELD_H = 1080
+
+
+def time_taps(resolve, taps: list[tuple[float, float]]) -> float:
+    start = time.perf_counter()
+    for x, y in taps:
+        resolve(x, y)
+    return (time.perf_counter() - start) / len(taps) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 10, 100, 1000, 10000])
+    parser.add_argument("--taps", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    taps = [(rng.uniform(0, FIELD_W), rng.uniform(0, FIELD_H)) for _ in range(args.taps)]
+
+    print(f"{'targets':>8}{'grid us/tap':>14}{'linear us/tap':>15}{'move ms':>10}")
+    for count in args.counts:
+        field = TargetField(targets=count - count // 4, decoys=count // 4)
+        start = time.perf_counter()
+        field.scatter(rng, FIELD_W, FIELD_H)
+        move_ms = (time.perf_counter() - start) * 1000
+        grid = time_taps(field.hit_test, taps)
+        # Quét tuyến tính rất chậm khi nhiều mục tiêu; chỉ đo trên một phần tap.
+        linear = time_taps(field.hit_test_linear, taps[: max(200, args.taps * 10 // max(10, count))])
+        print(f"{count:>8}{grid:>14.2f}{linear:>15.2f}{move_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Phát lại luồng tap tổng hợp tốc độ cao và đo độ trễ tap → điểm.
+
+Tap được bơm vào canvas bằng ``event_generate`` theo đúng nhịp đã định;
+độ trễ là khoảng từ lúc phát sự kiện tới lúc engine chấm điểm tap đó.
+Cần màn hình Tk thật (hoặc ``xvfb-run``):
+
+    xvfb-run python -m benchmarks.bench_input --tps 60 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+import tkinter as tk
+
+from cong_duc_dien_tu12 import CyberWoodenFishApp
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def replay(coalesce: bool, tps: float, seconds: float, seed: int) -> list[float]:
+    root = tk.Tk()
+    app = CyberWoodenFishApp(root, coalesce_input=coalesce)
+    root.update()
+    app.start_game()
+
+    # Bọc engine.tap để biết chính xác lúc từng tap được chấm điểm.
+    applied: list[float] = []
+    engine_tap = app.engine.tap
+
+    def timed_tap(x: float, y: float, now: int) -> int:
+        result = engine_tap(x, y, now)
+        applied.append(time.perf_counter())
+        return result
+
+    app.engine.tap = timed_tap  # type: ignore[method-assign]
+
+    rng = random.Random(seed)
+    generated: list[float] = []
+    interval = 1.0 / tps
+    next_tap = time.perf_counter()
+    end = next_tap + seconds
+    while time.perf_counter() < end:
+        now = time.perf_counter()
+        while now >= next_tap:
+            # Giữ game luôn chạy để mọi tap đều được chấm.
+            if not app.engine.game_running:
+                app.engine.start_game(app.now_ms())
+                app.schedule_engine()
+            x = app.engine.cx + rng.randint(-60, 60)
+            y = app.engine.cy + rng.randint(-30, 30)
+            app.canvas.event_generate("<Button-1>", x=x, y=y, when="tail")
+            generated.append(time.perf_counter())
+            next_tap += interval
+        root.update()
+    # Xả nốt hàng đợi.
+    deadline = time.perf_counter() + 1.0
+    while len(applied) < len(generated) and time.perf_counter() < deadline:
+        root.update()
+    root.destroy()
+    return [(done - sent) * 1000 for sent, done in zip(generated, applied)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tps", type=float, default=60.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'taps':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for label, coalesce in (("per-event", False), ("coalesced", True)):
+        latencies = replay(coalesce, args.tps, args.seconds, args.seed)
+        print(
+            f"{label:<12}{len(latencies):>8}{statistics.fmean(latencies):>9.2f}"
+            f"{percentile(latencies, 50):>9.2f}{percentile(latencies, 95):>9.2f}"
+            f"{percentile(latencies, 99):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
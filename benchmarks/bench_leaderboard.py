@@ -0,0 +1,96 @@
+"""Đo bảng xếp hạng với hàng triệu ván: nạp lô, mở lại, ghi ván, hỏi hạng, top-K.
+
+Dữ liệu giả lập: điểm phân phối lệch (đa số ván thấp, ít ván rất cao), level
+1-30, 100 nghìn người chơi; SQLite nằm trong thư mục tạm. Hạng hỏi qua cây
+Fenwick được so với cách đếm bằng SQL (``COUNT(*) WHERE score > ?``) trên vài
+truy vấn để thấy khác biệt.
+
+    python -m benchmarks.bench_leaderboard                 # 10 triệu ván
+    python -m benchmarks.bench_leaderboard --entries 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from cong_duc.leaderboard import Leaderboard
+
+LEVELS = 30
+
+
+def generate(count: int, seed: int) -> Iterator[tuple[str, int, int, int]]:
+    rng = random.Random(seed)
+    for i in range(count):
+        level = min(LEVELS, 1 + int(rng.expovariate(1 / 4)))
+        score = int(rng.expovariate(1 / (40 * level)))
+        yield (f"p{rng.randrange(100_000)}", score, level, 1_700_000_000_000 + i)
+
+
+def timed(ops: int, op: Callable[[int], object]) -> tuple[float, float]:
+    """Chạy ``op(i)`` ``ops`` lần; trả về (trung bình, p99) tính bằng µs."""
+    samples = []
+    for i in range(ops):
+        start = time.perf_counter()
+        op(i)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.fmean(samples), statistics.quantiles(samples, n=100)[-1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10_000_000)
+    parser.add_argument("--ops", type=int, default=10_000)
+    parser.add_argument("--sql-ops", type=int, default=20, help="số lần đếm hạng bằng SQL để so sánh")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "leaderboard.sqlite3"
+        board = Leaderboard(path)
+        start = time.perf_counter()
+        board.bulk_import(generate(args.entries, args.seed))
+        import_s = time.perf_counter() - start
+        board.close()
+
+        start = time.perf_counter()
+        board = Leaderboard(path)
+        open_s = time.perf_counter() - start
+        best = board.score_at(1)
+        print(f"{board.count()} ván, điểm cao nhất {best}, {len(board.levels)} level")
+        print(f"bulk import  {import_s:>8.1f} s  ({args.entries / import_s:,.0f} ván/s)")
+        print(f"mở lại       {open_s:>8.2f} s  (dựng cây đếm từ GROUP BY)")
+
+        scores = [rng.randint(0, best) for _ in range(args.ops)]
+        levels = [rng.randint(1, LEVELS) for _ in range(args.ops)]
+        results = {
+            "rank chung": timed(args.ops, lambda i: board.rank(scores[i])),
+            "rank level": timed(args.ops, lambda i: board.rank(scores[i], levels[i])),
+            "score_at": timed(args.ops, lambda i: board.score_at(1 + i * 997 % board.count())),
+            "top 10": timed(args.ops, lambda i: board.top(10)),
+            "top 10 level": timed(args.ops, lambda i: board.top(10, levels[i])),
+            "submit": timed(args.ops, lambda i: board.submit("bench", scores[i], levels[i])),
+            "rank SQL": timed(
+                args.sql_ops,
+                lambda i: board.db.execute("SELECT COUNT(*) FROM scores WHERE score > ?", (scores[i],)).fetchone(),
+            ),
+        }
+        print(f"\n{'thao tác':<14}{'mean µs':>12}{'p99 µs':>12}")
+        for name, (mean, p99) in results.items():
+            print(f"{name:<14}{mean:>12.1f}{p99:>12.1f}")
+
+        # Kiểm tra chéo cây Fenwick với SQL trên vài điểm.
+        for score in scores[: args.sql_ops]:
+            (above,) = board.db.execute("SELECT COUNT(*) FROM scores WHERE score > ?", (score,)).fetchone()
+            assert board.rank(score) == above + 1, score
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
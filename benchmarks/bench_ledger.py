@@ -0,0 +1,77 @@
+"""Đo ảnh hưởng của MeritLedger lên thời gian frame khi tap liên tục.
+
+Mô phỏng vòng frame 60 fps với một lượng việc cố định mỗi frame, có và
+không có ledger ghi nhận tap; WAL được ghi vào thư mục tạm.
+
+    python -m benchmarks.bench_ledger --tps 50 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+
+from cong_duc.ledger import MeritLedger
+
+FRAME_MS = 16
+
+
+def busy_frame() -> None:
+    # Việc giả lập của một frame (~0.3 ms Python thuần).
+    total = 0
+    for i in range(4000):
+        total += i * i
+
+
+def run(ledger: MeritLedger | None, tps: float, seconds: float) -> list[float]:
+    frames = int(seconds * 1000 / FRAME_MS)
+    taps_per_frame = tps * FRAME_MS / 1000
+    owed = 0.0
+    frame_ms: list[float] = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        owed += taps_per_frame
+        while owed >= 1:
+            owed -= 1
+            if ledger is not None:
+                ledger.add(1)
+        busy_frame()
+        elapsed = time.perf_counter() - start
+        frame_ms.append(elapsed * 1000)
+        # Ngủ hết phần còn lại của frame để luồng ghi nền có thời gian chạy.
+        time.sleep(max(0.0, FRAME_MS / 1000 - elapsed))
+    return frame_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tps", type=float, default=50.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--compact-bytes", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    baseline = run(None, args.tps, args.seconds)
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = MeritLedger(directory, compact_bytes=args.compact_bytes)
+        with_ledger = run(ledger, args.tps, args.seconds)
+        ledger.close()
+
+        start = time.perf_counter()
+        restored = MeritLedger(directory)
+        restore_ms = (time.perf_counter() - start) * 1000
+        restored.close()
+
+    def describe(values: list[float]) -> str:
+        p95 = statistics.quantiles(values, n=20)[-1]
+        return f"mean {statistics.fmean(values):.3f} ms  p95 {p95:.3f} ms  max {max(values):.3f} ms"
+
+    print(f"no ledger:   {describe(baseline)}")
+    print(f"with ledger: {describe(with_ledger)}")
+    print(f"taps {ledger.taps}  batches {ledger.batches_written}  compactions {ledger.compactions}")
+    print(f"restore: total {restored.total_merit} in {restore_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""So sánh Mỏ nhảy chỗ với Mỏ lướt: số thao tác canvas mỗi giây và độ chính xác khi tap.
+
+Chạy bản có level trên Tk giả (``benchmarks.fake_tk``) với đồng hồ ảo, tap
+đều đặn vào đúng tâm Mỏ đang hiển thị (``fish_position``). Với Mỏ lướt, mỗi
+frame chỉ một ``canvas.move`` theo tag, không tạo item mới; tap được chấm
+theo vị trí nội suy tại đúng mốc thời gian của nó nên tap vào tâm phải trúng
+100%. Chỉ đếm ``canvas.move`` trên tag Mỏ (hạt bay không tính); Mỏ lướt có
+frame move quá một lần thì thoát mã 1. Phần cuối đo chi phí
+``GameEngine.position_at``.
+
+    python -m benchmarks.bench_motion --seconds 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from benchmarks import fake_tk
+from cong_duc.engine import MOTION_GLIDE, GameEngine
+from cong_duc.modes import load
+from cong_duc.modes.levels import FISH_TAG
+
+
+def run(glide: bool, seconds: float, interval_ms: float) -> dict[str, float]:
+    with fake_tk.installed():
+        root = fake_tk.FakeTk()
+        app = load("levels")(root, glide=glide, analytics=False)
+        canvas = app.canvas
+        engine = app.engine
+        scheduler = app.scheduler
+        # Số lần move Mỏ theo số thứ tự frame của scheduler.
+        moves: Counter[int] = Counter()
+        canvas_move = canvas.move
+
+        def counted_move(tag_or_id: object, dx: float, dy: float) -> None:
+            if tag_or_id == FISH_TAG:
+                moves[scheduler.frames] += 1
+            canvas_move(tag_or_id, dx, dy)
+
+        canvas.move = counted_move  # type: ignore[method-assign]
+        created = app.canvas_items.total_created
+        frames = scheduler.frames
+        taps = hits = 0
+        elapsed = 0.0
+        while elapsed < seconds * 1000:
+            if not engine.game_running:
+                app.start_game()
+            x, y = app.fish_position()
+            canvas.fire("<Button-1>", fake_tk.FakeEvent(x=round(x), y=round(y)))
+            root.advance(interval_ms)
+            elapsed += interval_ms
+            # Mỗi khoảng tap dài hơn một frame nên lô vừa xả chỉ có đúng tap này.
+            taps += 1
+            hits += engine.last_gain > 0
+        frames = scheduler.frames - frames
+        app.on_close()
+    return {
+        "moves_per_s": sum(moves.values()) / seconds,
+        "moves_per_frame": max(moves.values(), default=0),
+        "frames": frames,
+        "created_per_s": (app.canvas_items.total_created - created) / seconds,
+        "hit_rate": hits / taps,
+        "taps": taps,
+    }
+
+
+def position_cost(samples: int) -> float:
+    engine = GameEngine(rng=random.Random(1), motion=MOTION_GLIDE)
+    engine.start_game(0, 1)
+    engine.advance(engine.move_interval_ms + 1)
+    base = engine.now
+    times = [base + i % engine.move_interval_ms for i in range(samples)]
+    position_at = engine.position_at
+    start = time.perf_counter()
+    for t in times:
+        position_at(t)
+    return (time.perf_counter() - start) / samples * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=120.0, help="thời gian chơi (đồng hồ ảo)")
+    parser.add_argument("--interval-ms", type=float, default=97.0, help="khoảng cách giữa hai tap")
+    args = parser.parse_args()
+
+    os.environ["CONG_DUC_AUDIO"] = "null"
+    os.environ.pop("CONG_DUC_SERVER", None)
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["CONG_DUC_HOME"] = home
+        print(f"{'motion':<10}{'taps':>8}{'frames':>8}{'move/s':>9}{'max/frame':>11}{'create/s':>10}{'hit %':>8}")
+        for label, glide in (("teleport", False), ("glide", True)):
+            r = run(glide, args.seconds, args.interval_ms)
+            print(
+                f"{label:<10}{r['taps']:>8}{r['frames']:>8}{r['moves_per_s']:>9.1f}{r['moves_per_frame']:>11}"
+                f"{r['created_per_s']:>10.1f}{r['hit_rate'] * 100:>7.1f}%"
+            )
+    print(f"\nGameEngine.position_at: {position_cost(1_000_000):.0f} ns")
+    if r["moves_per_frame"] != 1:
+        print(f"Mỏ lướt move {r['moves_per_frame']} lần trong một frame, mong đợi đúng 1")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Tap liên tục vào bản tích đức tự do và theo dõi độ sâu hàng đợi ``after``.
+
+Cần màn hình Tk thật (hoặc ``xvfb-run``):
+
+    xvfb-run python -m benchmarks.bench_particles --tps 25 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tkinter as tk
+
+from cong_duc_dien_tu import CyberWoodenFishApp
+
+
+class _TapEvent:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tps", type=float, default=25.0)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    app = CyberWoodenFishApp(root)
+    root.update()
+
+    interval = 1.0 / args.tps
+    end = time.perf_counter() + args.seconds
+    cpu_start = time.process_time()
+    next_tap = time.perf_counter()
+    samples = []
+    while time.perf_counter() < end:
+        now = time.perf_counter()
+        if now >= next_tap:
+            app.on_tap(_TapEvent(450, 280))
+            next_tap += interval
+            pending = len(root.tk.splitlist(root.tk.call("after", "info")))
+            samples.append(pending)
+        root.update()
+    cpu = time.process_time() - cpu_start
+    pool = app.floating_texts
+    root.destroy()
+
+    half = len(samples) // 2
+    print(f"taps:                 {len(samples)}")
+    print(f"after queue (1st/2nd half max): {max(samples[:half])}/{max(samples[half:])}")
+    print(f"pool allocated/evicted: {pool.allocated}/{pool.evicted}")
+    print(f"cpu:                  {cpu / args.seconds * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Đo kích thước và tốc độ kiểm tra replay (headless).
+
+Ghi lại các ván của người chơi giả lập qua ReplayRecorder, mã hoá, rồi đo
+tốc độ giải mã + phát lại + so điểm, tính theo replay/phút và theo bội số
+thời gian thực.
+
+    python -m benchmarks.bench_replay --sessions 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from cong_duc.engine import GameEngine, simulated_player
+from cong_duc.replay import Replay, ReplayRecorder, verify
+
+
+def record_session(seed: int, taps_per_second: float) -> bytes:
+    engine = GameEngine()
+    recorder = ReplayRecorder(engine)
+    recorder.start(0, seed)
+    rng = random.Random(seed + 1)
+    for t, x, y in simulated_player(engine, rng, taps_per_second, 0.9, 180):
+        # Tk chỉ cho toạ độ nguyên; replay cũng lưu toạ độ nguyên.
+        x, y = int(x), int(y)
+        recorder.tap(x, y, engine.tap(x, y, t))
+    return recorder.finish().to_bytes()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--tps", type=float, default=6.0, help="tap mỗi giây của người chơi giả lập")
+    args = parser.parse_args()
+
+    blobs = [record_session(seed, args.tps) for seed in range(args.sessions)]
+    played_ms = 0
+    taps = 0
+    start = time.perf_counter()
+    for blob in blobs:
+        replay = Replay.from_bytes(blob)
+        verify(replay)
+        played_ms += replay.duration_ms
+        taps += len(replay.events)
+    elapsed = time.perf_counter() - start
+
+    size = sum(len(blob) for blob in blobs)
+    print(f"replays:        {len(blobs)} ({taps} sự kiện, {played_ms / 1000:.0f} s chơi)")
+    print(f"bytes/replay:   {size / len(blobs):.0f} ({size / max(1, taps):.2f} byte/sự kiện)")
+    print(f"verify:         {elapsed * 1000:.1f} ms, {len(blobs) / elapsed * 60:,.0f} replay/phút")
+    print(f"tốc độ:         {played_ms / 1000 / elapsed:,.0f}x thời gian thực")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Bão resize: kéo mép cửa sổ liên tục, đo số lần bố cục lại và thao tác canvas.
+
+Chạy từng bản app trên Tk giả (``benchmarks.fake_tk``), bắn ``--per-frame``
+sự kiện ``<Configure>`` giữa hai frame trong ``--frames`` frame, so ba cách:
+
+- ``rebuild/event``: xoá và vẽ lại Mỏ ở mỗi sự kiện (cách cũ của bản tự do);
+- ``scale/event``: ``canvas.scale``/``move`` theo tag ở mỗi sự kiện;
+- ``scale/frame``: như trên nhưng ``CanvasLayout`` gộp còn một lần mỗi frame.
+
+    python -m benchmarks.bench_resize --frames 600 --per-frame 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks import fake_tk
+from cong_duc.modes import MODES, load
+
+STRATEGIES = ("rebuild/event", "scale/event", "scale/frame")
+
+
+def storm(variant: str, strategy: str, frames: int, per_frame: int) -> dict[str, float]:
+    with fake_tk.installed():
+        root = fake_tk.FakeTk()
+        app = load(variant)(root)
+        canvas = app.canvas
+        layout = app.layout
+        layout.debounce = strategy == "scale/frame"
+        if strategy == "rebuild/event":
+            layout.on_change(lambda *_size: app.draw_fish())
+        calls = 0
+        for name in ("move", "scale"):
+            original = getattr(canvas, name)
+
+            def counted(*args: object, _original=original) -> None:
+                nonlocal calls
+                calls += 1
+                _original(*args)
+
+            setattr(canvas, name, counted)
+        root.advance(100)
+        created = canvas.created
+        relayouts = layout.relayouts
+        events = 0
+        start = time.perf_counter()
+        for frame in range(frames):
+            for i in range(per_frame):
+                step = frame * per_frame + i
+                width = 800 + (step * 7) % 600
+                height = 360 + (step * 5) % 320
+                canvas.width, canvas.height = width, height
+                canvas.fire("<Configure>", fake_tk.FakeEvent(width=width, height=height))
+                events += 1
+            root.advance(16)
+        elapsed = time.perf_counter() - start
+        app.on_close()
+    return {
+        "events": events,
+        "relayouts": layout.relayouts - relayouts,
+        "created": canvas.created - created,
+        "calls": calls,
+        "us_per_event": elapsed / events * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variants", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--per-frame", type=int, default=8, help="số <Configure> giữa hai frame")
+    args = parser.parse_args()
+
+    os.environ["CONG_DUC_AUDIO"] = "null"
+    os.environ.pop("CONG_DUC_SERVER", None)
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["CONG_DUC_HOME"] = home
+        print(f"{'variant':<8}{'strategy':<15}{'events':>8}{'relayout':>10}{'created':>9}{'move+scale':>12}{'µs/event':>10}")
+        for variant in args.variants:
+            for strategy in STRATEGIES:
+                r = storm(variant, strategy, args.frames, args.per_frame)
+                print(
+                    f"{variant:<8}{strategy:<15}{r['events']:>8}{r['relayouts']:>10}{r['created']:>9}"
+                    f"{r['calls']:>12}{r['us_per_event']:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Đo thời gian khởi động của từng chế độ: import, dựng app, số module đã nạp.
+
+Mỗi lần đo là một tiến trình Python mới (cache import trống), lấy trung vị
+``--runs`` lần. Mặc định dựng app trên Tk giả nên không cần màn hình; với
+``--real-tk`` thì dựng trên Tk thật và tính tới lúc vẽ xong frame đầu:
+
+    python -m benchmarks.bench_startup
+    xvfb-run python -m benchmarks.bench_startup --real-tk
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+from cong_duc.modes import MODES
+
+# Module nặng mà chỉ một số chế độ cần; in ra để thấy chế độ nào kéo theo gì.
+WATCHED = (
+    "cong_duc.engine",
+    "cong_duc.replay",
+    "cong_duc.community",
+    "cong_duc.events",
+    "cong_duc.leaderboard",
+    "cong_duc.profiler",
+    "asyncio",
+    "numpy",
+)
+
+
+# Chạy bằng ``python -c`` để đồng hồ bắt đầu trước mọi import của dự án.
+CHILD = """
+import sys, time
+started = time.perf_counter()
+from cong_duc.modes import load
+app_class = load(sys.argv[1])
+imported = time.perf_counter()
+if sys.argv[2] == "real":
+    import tkinter as tk
+    root = tk.Tk()
+    app = app_class(root)
+    root.update()
+else:
+    from benchmarks import fake_tk
+    with fake_tk.installed():
+        app = app_class(fake_tk.FakeTk())
+ready = time.perf_counter()
+modules = set(sys.modules)
+app.on_close()
+print(repr((imported - started, ready - imported, sorted(modules))))
+"""
+
+
+def run_child(mode: str, real_tk: bool, env: dict[str, str]) -> dict[str, object]:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, mode, "real" if real_tk else "fake"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    import_s, build_s, modules = ast.literal_eval(output.splitlines()[-1])
+    return {
+        "import_ms": import_s * 1000,
+        "build_ms": build_s * 1000,
+        "total_ms": (import_s + build_s) * 1000,
+        "modules": len(modules),
+        "watched": [name for name in WATCHED if name in modules],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--real-tk", action="store_true")
+    args = parser.parse_args()
+
+    env = dict(os.environ, CONG_DUC_AUDIO="null")
+    env.pop("CONG_DUC_SERVER", None)
+    print(f"{'mode':<8}{'import ms':>10}{'build ms':>10}{'total ms':>10}{'modules':>9}  nạp thêm")
+    for mode in MODES:
+        runs = [run_child(mode, args.real_tk, env) for _ in range(args.runs)]
+        median = {key: statistics.median(run[key] for run in runs) for key in ("import_ms", "build_ms", "total_ms")}
+        print(
+            f"{mode:<8}{median['import_ms']:>10.1f}{median['build_ms']:>10.1f}{median['total_ms']:>10.1f}"
+            f"{runs[0]['modules']:>9}  {', '.join(runs[0]['watched']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Kiểm tra mô phỏng vector ``cong_duc.tuning`` với GameEngine thật.
+
+Với mỗi hồ sơ người chơi cố định, chơi ``--sessions`` ván bằng
+``simulate_session`` (engine đầy đủ, từng tap) và cho ``--players`` người chơi
+cùng hồ sơ qua ``simulate_levels``, rồi so tỉ lệ qua màn từng level. Chỉ so
+các level có ít nhất ``--min-reached`` ván engine vào tới; lệch quá
+``--tolerance`` điểm phần trăm thì thoát mã 1.
+
+    python -m benchmarks.bench_tuning
+    python -m benchmarks.bench_tuning --sessions 50000 --tolerance 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from cong_duc import tuning
+from cong_duc.engine import simulate_session
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - chỉ khi thiếu NumPy
+    np = None  # type: ignore[assignment]
+
+# (tỉ lệ trúng, tap/giây, phản xạ ms)
+PROFILES = (
+    (0.85, 6.0, 180),
+    (0.7, 4.0, 300),
+    (0.95, 9.0, 150),
+)
+
+
+def engine_rows(profile: tuple[float, float, int], sessions: int, levels: int) -> list[tuple[int, int, int, float]]:
+    hit_rate, tps, reaction = profile
+    cleared = np.array(
+        [simulate_session(seed, tps, hit_rate, reaction).level - 1 for seed in range(sessions)], dtype=np.int64
+    )
+    return tuning.pass_rate_table(np.minimum(cleared, levels), levels)
+
+
+def tuner_rows(profile: tuple[float, float, int], players: int, levels: int) -> list[tuple[int, int, int, float]]:
+    hit_rate, tps, reaction = profile
+    profiles = tuning.Profiles(
+        hit_rate=np.full(players, hit_rate, dtype=np.float32),
+        taps_per_second=np.full(players, tps, dtype=np.float32),
+        reaction_ms=np.full(players, reaction, dtype=np.float32),
+    )
+    return tuning.pass_rate_table(tuning.simulate_levels(profiles, max_level=levels, seed=1), levels)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20_000, help="số ván engine mỗi hồ sơ")
+    parser.add_argument("--players", type=int, default=200_000, help="số người chơi mô phỏng mỗi hồ sơ")
+    parser.add_argument("--levels", type=int, default=12)
+    parser.add_argument("--min-reached", type=int, default=500)
+    parser.add_argument("--tolerance", type=float, default=3.0, help="độ lệch cho phép (điểm phần trăm)")
+    args = parser.parse_args()
+    tuning._require_numpy()
+
+    failures = []
+    for profile in PROFILES:
+        start = time.perf_counter()
+        engine = engine_rows(profile, args.sessions, args.levels)
+        engine_s = time.perf_counter() - start
+        start = time.perf_counter()
+        tuner = tuner_rows(profile, args.players, args.levels)
+        tuner_s = time.perf_counter() - start
+        hit_rate, tps, reaction = profile
+        print(f"\nhit {hit_rate:.2f}, {tps:g} tap/s, phản xạ {reaction} ms (engine {engine_s:.1f} s, tuner {tuner_s:.2f} s)")
+        print(f"{'level':>5}{'engine n':>10}{'engine %':>10}{'tuner %':>9}{'lệch':>7}")
+        for (level, reached, _, expected), (_, _, _, got) in zip(engine, tuner):
+            if reached < args.min_reached:
+                break
+            diff = (got - expected) * 100
+            print(f"{level:>5}{reached:>10}{expected * 100:>10.1f}{got * 100:>9.1f}{diff:>+7.1f}")
+            if abs(diff) > args.tolerance:
+                failures.append(f"hit {hit_rate:.2f} level {level}: engine {expected:.1%}, tuner {got:.1%}")
+
+    if failures:
+        print("\n".join(["", "tuner lệch engine:", *failures]))
+        sys.exit(1)
+    print(f"\nok: tuner khớp engine trong ±{args.tolerance:g} điểm")
+
+
+if __name__ == "__main__":
+    main()
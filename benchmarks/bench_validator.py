@@ -0,0 +1,142 @@
+"""Đo TapValidator trên luồng sự kiện của rất nhiều phiên xen kẽ nhau.
+
+Các phiên mẫu được sinh bằng GameEngine + người chơi giả lập, một phần được
+sửa thành gian lận (khai công đức, tap quá nhanh) và một phần bị bỏ dở giữa
+chừng, không bao giờ gửi END. Luồng được tạo theo từng khúc với ``--live``
+phiên chạy song song; validator chặn số phiên ở ``--max-sessions`` nên bộ nhớ
+phẳng dù phiên bỏ dở cứ dồn thêm. Phiên đang chơi bị bỏ nhầm, số phiên vượt
+chặn hoặc RSS nửa sau tăng quá ``--rss-slack`` thì thoát mã 1.
+
+    python -m benchmarks.bench_validator --sessions 1000000 --live 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sys
+import time
+from typing import Iterator
+
+from cong_duc.engine import TAP_IGNORED, GameEngine, simulated_player
+from cong_duc.validator import EVENT_END, EVENT_HIT, REASONS, REJECT_UNKNOWN_SESSION, TapValidator, session_events
+
+
+def play_template(seed: int) -> list[tuple[int, int, int]]:
+    rng = random.Random(seed)
+    engine = GameEngine(rng=rng)
+    engine.start_game(0)
+    taps = []
+    for t, x, y in simulated_player(engine, rng, rng.uniform(3, 10), rng.uniform(0.75, 0.97), 180):
+        if engine.tap(x, y, t) != TAP_IGNORED:
+            taps.append((t, engine.last_gain))
+    return session_events(taps)
+
+
+def cheat(events: list[tuple[int, int, int]], rng: random.Random) -> list[tuple[int, int, int]]:
+    if rng.random() < 0.5:
+        # Khai gấp đôi công đức ở một hit.
+        i = rng.choice([i for i, event in enumerate(events) if event[1] == EVENT_HIT] or [0])
+        t, kind, value = events[i]
+        events = events[:i] + [(t, kind, value * 2)] + events[i + 1 :]
+    else:
+        # Bot: cùng chuỗi tap nhưng nhanh gấp 4.
+        events = [(t // 4, kind, value) for t, kind, value in events]
+    return events
+
+
+def abandon(events: list[tuple[int, int, int]], rng: random.Random) -> list[tuple[int, int, int]]:
+    """Cắt phiên ở một điểm ngẫu nhiên, không có END."""
+    return events[: rng.randrange(1, len(events))]
+
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def stream(templates: list[list[tuple[int, int, int]]], sessions: int, live: int, chunk: int) -> Iterator[list]:
+    """Sinh luồng sự kiện xen kẽ theo từng khúc ``chunk`` sự kiện."""
+    rng = random.Random(1)
+    next_id = 0
+    slots: list[list] = []
+    out = []
+    while next_id < sessions or slots:
+        while len(slots) < live and next_id < sessions:
+            # Mỗi phiên lệch thời gian gốc để các phiên thật sự xen kẽ.
+            slots.append([next_id, rng.choice(templates), 0, rng.randrange(0, 60_000)])
+            next_id += 1
+        i = 0
+        while i < len(slots):
+            slot = slots[i]
+            sid, events, pos, base = slot
+            t, kind, value = events[pos]
+            out.append((sid, base + t, kind, value))
+            slot[2] = pos + 1
+            if kind == EVENT_END or pos + 1 == len(events):
+                slots[i] = slots[-1]
+                slots.pop()
+            else:
+                i += 1
+        if len(out) >= chunk:
+            yield out
+            out = []
+    if out:
+        yield out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1_000_000)
+    parser.add_argument("--live", type=int, default=20_000, help="số phiên mở cùng lúc")
+    parser.add_argument("--templates", type=int, default=2000)
+    parser.add_argument("--cheaters", type=float, default=0.05)
+    parser.add_argument("--abandon", type=float, default=0.1, help="tỉ lệ phiên không bao giờ gửi END")
+    parser.add_argument("--max-sessions", type=int, default=40_000)
+    parser.add_argument("--rss-slack", type=float, default=16.0, help="MB RSS nửa sau được tăng thêm")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    templates = [play_template(seed) for seed in range(args.templates)]
+    templates += [cheat(rng.choice(templates), rng) for _ in range(int(args.templates * args.cheaters))]
+    # Phiên bỏ dở chỉ lấy từ mẫu đầy đủ, để mọi phiên có END đều được chấm trọn.
+    templates += [abandon(rng.choice(templates), rng) for _ in range(int(len(templates) * args.abandon))]
+
+    validator = TapValidator(max_sessions=args.max_sessions)
+    elapsed = 0.0
+    events = 0
+    peak_sessions = 0
+    half_rss = 0.0
+    for chunk in stream(templates, args.sessions, args.live, 500_000):
+        start = time.perf_counter()
+        events += validator.feed_many(chunk)
+        elapsed += time.perf_counter() - start
+        peak_sessions = max(peak_sessions, len(validator.sessions))
+        if not half_rss and validator.accepted + sum(validator.rejected.values()) >= args.sessions // 2:
+            half_rss = max_rss_mb()
+
+    rss_mb = max_rss_mb()
+    print(f"sessions:     {args.sessions:,} ({args.live:,} mở cùng lúc, tối đa {peak_sessions:,} state)")
+    print(f"events:       {events:,} trong {elapsed:.2f} s")
+    print(f"throughput:   {events / elapsed * 60 / 1e6:,.1f} triệu sự kiện/phút")
+    print(f"accepted:     {validator.accepted:,}")
+    for reason, count in validator.rejected.items():
+        if count:
+            print(f"rejected:     {count:,} ({REASONS[reason]})")
+    print(f"evicted:      {validator.evicted:,} phiên không END ({len(validator.sessions):,} còn mở)")
+    print(f"max RSS:      {half_rss:.0f} MB ở nửa đường, {rss_mb:.0f} MB ở cuối")
+
+    failures = []
+    if peak_sessions > args.max_sessions:
+        failures.append(f"{peak_sessions:,} phiên mở, vượt chặn {args.max_sessions:,}")
+    if validator.rejected[REJECT_UNKNOWN_SESSION]:
+        failures.append(f"{validator.rejected[REJECT_UNKNOWN_SESSION]:,} sự kiện của phiên đang chơi bị bỏ nhầm")
+    if rss_mb - half_rss > args.rss_slack:
+        failures.append(f"RSS tăng {rss_mb - half_rss:.0f} MB ở nửa sau")
+    if failures:
+        print("\n".join(["", "validator không giữ bộ nhớ phẳng:", *failures]))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Tk giả, thuần Python, để chạy các app trên máy không có màn hình.
+
+Chỉ cài những gì các app trong repo dùng: cửa sổ gốc với hàng đợi ``after``
+chạy trên đồng hồ ảo, Label/Frame/Button không làm gì, Font chỉ giữ tuỳ chọn, và Canvas giữ danh
+sách item thật (id, toạ độ, tag, thứ tự vẽ) để đếm được item còn sống. Dùng
+qua ``installed()``, nó thay các lớp trong ``tkinter`` và đồng hồ của
+FrameScheduler trong phạm vi ``with``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import itertools
+import tkinter
+import tkinter.font
+from typing import Callable, Iterator
+
+from cong_duc.scheduler import FrameScheduler
+
+
+class FakeEvent:
+    def __init__(self, **fields: object) -> None:
+        self.__dict__.update(fields)
+
+
+class _FakeTkApp:
+    """Đủ cho ``root.tk.call("after", "info")`` và ``splitlist``."""
+
+    def __init__(self, root: FakeTk) -> None:
+        self.root = root
+
+    def call(self, *args: object) -> object:
+        if args[:2] == ("after", "info"):
+            return tuple(self.root._jobs)
+        return ""
+
+    def splitlist(self, value: object) -> tuple:
+        return tuple(value) if isinstance(value, (tuple, list)) else ()
+
+
+class FakeWidget:
+    def __init__(self, master: object = None, **options: object) -> None:
+        self.master = master
+        self.options = dict(options)
+        self._bindings: dict[str, list[Callable]] = {}
+
+    def pack(self, **_options: object) -> None:
+        pass
+
+    def config(self, **options: object) -> None:
+        self.options.update(options)
+
+    configure = config
+
+    def bind(self, sequence: str, func: Callable, add: str | None = None) -> None:
+        handlers = self._bindings.setdefault(sequence, [])
+        if not add:
+            handlers.clear()
+        handlers.append(func)
+
+    def fire(self, sequence: str, event: object = None) -> None:
+        for handler in list(self._bindings.get(sequence, ())):
+            handler(event)
+
+
+class FakeTk(FakeWidget):
+    clock_ms = 0.0
+
+    def __init__(self, *_args: object, **_options: object) -> None:
+        super().__init__()
+        self.tk = _FakeTkApp(self)
+        self._jobs: dict[str, tuple[float, Callable]] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._ids = itertools.count()
+        self.destroyed = False
+        # Số callback after đang chờ lớn nhất từng thấy.
+        self.after_depth_peak = 0
+
+    # ------------------------ Window ------------------------
+    def title(self, *_args: object) -> None:
+        pass
+
+    def geometry(self, *_args: object) -> None:
+        pass
+
+    def minsize(self, *_args: object) -> None:
+        pass
+
+    def protocol(self, *_args: object) -> None:
+        pass
+
+    def bell(self) -> None:
+        pass
+
+    def winfo_ismapped(self) -> int:
+        return 1
+
+    def state(self) -> str:
+        return "normal"
+
+    def focus_displayof(self) -> FakeTk:
+        return self
+
+    def destroy(self) -> None:
+        self.destroyed = True
+        self._jobs.clear()
+
+    def mainloop(self) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def update_idletasks(self) -> None:
+        pass
+
+    # ------------------------ after() ------------------------
+    def after(self, delay_ms: int, func: Callable) -> str:
+        job = f"after#{next(self._ids)}"
+        due = FakeTk.clock_ms + max(0, delay_ms)
+        self._jobs[job] = (due, func)
+        heapq.heappush(self._heap, (due, next(self._ids), job))
+        self.after_depth_peak = max(self.after_depth_peak, len(self._jobs))
+        return job
+
+    def after_cancel(self, job: str) -> None:
+        self._jobs.pop(job, None)
+
+    def advance(self, ms: float) -> int:
+        """Chạy đồng hồ ảo thêm ``ms``; trả về số callback đã chạy."""
+        target = FakeTk.clock_ms + ms
+        ran = 0
+        heap = self._heap
+        while heap and heap[0][0] <= target and not self.destroyed:
+            due, _, job = heapq.heappop(heap)
+            entry = self._jobs.pop(job, None)
+            if entry is None:
+                continue
+            FakeTk.clock_ms = max(FakeTk.clock_ms, due)
+            entry[1]()
+            ran += 1
+        FakeTk.clock_ms = max(FakeTk.clock_ms, target)
+        return ran
+
+
+class FakeFont:
+    def __init__(self, root: object = None, **options: object) -> None:
+        self.options = options
+
+    def actual(self, option: str | None = None) -> object:
+        return self.options.get(option) if option else dict(self.options)
+
+
+class FakeCanvas(FakeWidget):
+    def __init__(self, master: object = None, **options: object) -> None:
+        super().__init__(master, **options)
+        self.width = 900
+        self.height = 440
+        self._ids = itertools.count(1)
+        # id -> [kind, coords, options, tags]; dict giữ thứ tự vẽ (dưới -> trên).
+        self.items: dict[int, list] = {}
+        self.created = 0
+        self.live_peak = 0
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    # ------------------------ Items ------------------------
+    def _create(self, kind: str, coords: tuple, options: dict) -> int:
+        item = next(self._ids)
+        tags = options.pop("tags", ())
+        tags = (tags,) if isinstance(tags, str) else tuple(tags)
+        self.items[item] = [kind, [float(c) for c in coords], options, tags]
+        self.created += 1
+        self.live_peak = max(self.live_peak, len(self.items))
+        return item
+
+    def create_oval(self, *coords: float, **options: object) -> int:
+        return self._create("oval", coords, options)
+
+    def create_line(self, *coords: float, **options: object) -> int:
+        return self._create("line", coords, options)
+
+    def create_rectangle(self, *coords: float, **options: object) -> int:
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords: float, **options: object) -> int:
+        return self._create("text", coords, options)
+
+    def create_image(self, *coords: float, **options: object) -> int:
+        return self._create("image", coords, options)
+
+    def create_arc(self, *coords: float, **options: object) -> int:
+        return self._create("arc", coords, options)
+
+    def create_bitmap(self, *coords: float, **options: object) -> int:
+        return self._create("bitmap", coords, options)
+
+    def create_polygon(self, *coords: float, **options: object) -> int:
+        return self._create("polygon", coords, options)
+
+    def create_window(self, *coords: float, **options: object) -> int:
+        return self._create("window", coords, options)
+
+    def _resolve(self, tag_or_id: object) -> list[int]:
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if tag_or_id == "all":
+            return list(self.items)
+        return [item for item, entry in self.items.items() if tag_or_id in entry[3]]
+
+    def find_all(self) -> tuple[int, ...]:
+        return tuple(self.items)
+
+    def find_withtag(self, tag_or_id: object) -> tuple[int, ...]:
+        return tuple(self._resolve(tag_or_id))
+
+    def delete(self, *tags_or_ids: object) -> None:
+        for tag_or_id in tags_or_ids:
+            for item in self._resolve(tag_or_id):
+                del self.items[item]
+
+    def move(self, tag_or_id: object, dx: float, dy: float) -> None:
+        for item in self._resolve(tag_or_id):
+            coords = self.items[item][1]
+            for i in range(0, len(coords), 2):
+                coords[i] += dx
+                coords[i + 1] += dy
+
+    def scale(self, tag_or_id: object, x0: float, y0: float, sx: float, sy: float) -> None:
+        for item in self._resolve(tag_or_id):
+            coords = self.items[item][1]
+            for i in range(0, len(coords), 2):
+                coords[i] = x0 + (coords[i] - x0) * sx
+                coords[i + 1] = y0 + (coords[i + 1] - y0) * sy
+
+    def coords(self, item: object, *new: float) -> list[float]:
+        found = self._resolve(item)
+        if not found:
+            return []
+        if new:
+            self.items[found[0]][1] = [float(c) for c in new]
+        return list(self.items[found[0]][1])
+
+    def itemconfig(self, tag_or_id: object, **options: object) -> None:
+        for item in self._resolve(tag_or_id):
+            self.items[item][2].update(options)
+
+    itemconfigure = itemconfig
+
+    def tag_raise(self, tag_or_id: object, above: object = None) -> None:
+        moving = self._resolve(tag_or_id)
+        if not moving:
+            return
+        entries = [(item, self.items.pop(item)) for item in moving]
+        if above is None:
+            self.items.update(entries)
+            return
+        anchors = self._resolve(above)
+        if not anchors:
+            self.items.update(entries)
+            return
+        # Chèn ngay trên item cao nhất mang tag/ id ``above``.
+        order = list(self.items.items())
+        position = max(i for i, (item, _) in enumerate(order) if item in anchors) + 1
+        order[position:position] = entries
+        self.items = dict(order)
+
+    def tag_lower(self, tag_or_id: object) -> None:
+        moving = self._resolve(tag_or_id)
+        entries = [(item, self.items.pop(item)) for item in moving]
+        self.items = dict(entries + list(self.items.items()))
+
+
+@contextlib.contextmanager
+def installed() -> Iterator[None]:
+    """Thay tkinter bằng bản giả và dùng đồng hồ ảo cho FrameScheduler."""
+    names = ("Tk", "Label", "Frame", "Button", "Canvas")
+    saved = {name: getattr(tkinter, name) for name in names}
+    saved_font = tkinter.font.Font
+    saved_clock = FrameScheduler.default_clock
+    tkinter.Tk = FakeTk
+    tkinter.Label = tkinter.Frame = tkinter.Button = FakeWidget
+    tkinter.Canvas = FakeCanvas
+    tkinter.font.Font = FakeFont
+    FrameScheduler.default_clock = lambda: FakeTk.clock_ms / 1000
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(tkinter, name, value)
+        tkinter.font.Font = saved_font
+        FrameScheduler.default_clock = saved_clock
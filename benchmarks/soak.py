@@ -0,0 +1,110 @@
+"""Soak test: 1 triệu tap vào từng bản app, kiểm tra item canvas và bộ nhớ không tăng.
+
+Chạy trên Tk giả (``benchmarks.fake_tk``) với đồng hồ ảo nên không cần màn
+hình. Sau mỗi ``--checkpoints`` phần số tap, ghi số item còn sống theo
+``CanvasItemRegistry`` của app và số block bộ nhớ Python đang cấp phát
+(``sys.getallocatedblocks``, rẻ hơn tracemalloc nhiều).
+Bản có level tự chơi lại khi hết giờ nên bộ nhớ lên xuống theo từng ván; vì
+vậy item so đỉnh của nửa sau với đỉnh của nửa đầu các checkpoint, còn bộ nhớ
+so trung vị hai nửa (đỉnh rơi vào giữa ván hay đầu ván là ngẫu nhiên, lệch
+vài nghìn block; rò rỉ thật thì kéo cả trung vị lên). Vượt ngưỡng thì thoát
+mã 1.
+
+    python -m benchmarks.soak
+    python -m benchmarks.soak --variants free --taps 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks import fake_tk
+from cong_duc.modes import MODES, load
+
+
+def soak(variant: str, taps: int, interval_ms: float, checkpoints: int) -> list[dict[str, float]]:
+    rng = random.Random(3)
+    samples = []
+    with fake_tk.installed():
+        root = fake_tk.FakeTk()
+        app = load(variant)(root)
+        canvas = app.canvas
+        registry = app.canvas_items
+        engine = getattr(app, "engine", None)
+        step = max(1, taps // checkpoints)
+        started = time.perf_counter()
+        for i in range(1, taps + 1):
+            if engine is not None:
+                if not engine.game_running:
+                    app.start_game()
+                x, y = engine.cx, engine.cy
+            else:
+                x, y = canvas.width // 2, canvas.height // 2 + 8
+            canvas.fire("<Button-1>", fake_tk.FakeEvent(x=x + rng.randint(-40, 40), y=y + rng.randint(-20, 20)))
+            root.advance(interval_ms)
+            if i % step == 0:
+                gc.collect()
+                samples.append(
+                    {
+                        "taps": i,
+                        "items_live": registry.live_count,
+                        "items_created": registry.total_created,
+                        "blocks": sys.getallocatedblocks(),
+                        "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                        "elapsed_s": time.perf_counter() - started,
+                    }
+                )
+        app.on_close()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--variants", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--taps", type=int, default=1_000_000)
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="khoảng cách giữa hai tap (đồng hồ ảo)")
+    parser.add_argument("--checkpoints", type=int, default=20)
+    parser.add_argument("--max-block-growth", type=int, default=2000)
+    parser.add_argument("--max-item-growth", type=int, default=0)
+    args = parser.parse_args()
+
+    os.environ["CONG_DUC_AUDIO"] = "null"
+    os.environ.pop("CONG_DUC_SERVER", None)
+    failures = []
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["CONG_DUC_HOME"] = home
+        for variant in args.variants:
+            samples = soak(variant, args.taps, args.interval_ms, args.checkpoints)
+            print(f"\n{variant}")
+            print(f"{'taps':>9}{'items':>7}{'created':>10}{'blocks':>10}{'RSS MB':>8}{'time s':>8}")
+            for s in samples:
+                print(
+                    f"{s['taps']:>9}{s['items_live']:>7}{s['items_created']:>10}"
+                    f"{s['blocks']:>10}{s['rss_peak_mb']:>8.1f}{s['elapsed_s']:>8.1f}"
+                )
+            half = len(samples) // 2
+            item_growth = max(s["items_live"] for s in samples[half:]) - max(s["items_live"] for s in samples[:half])
+            block_growth = statistics.median(s["blocks"] for s in samples[half:]) - statistics.median(
+                s["blocks"] for s in samples[:half]
+            )
+            if item_growth > args.max_item_growth:
+                failures.append(f"{variant}: item canvas tăng {item_growth}")
+            if block_growth > args.max_block_growth:
+                failures.append(f"{variant}: bộ nhớ Python tăng {block_growth:.0f} block")
+
+    if failures:
+        print("\n".join(["", "không phẳng:", *failures]))
+        sys.exit(1)
+    print("\nok: item canvas và bộ nhớ phẳng")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Bộ benchmark headless cho ba bản app, so với baseline JSON.
+
+Mỗi kịch bản chạy trong một tiến trình con riêng (để RSS đỉnh là của riêng
+nó), dựng ``CyberWoodenFishApp`` trên Tk giả (``benchmarks.fake_tk``, đồng hồ
+ảo nên nhanh hơn thời gian thực rất nhiều) hoặc Tk thật với ``--real-tk``
+(chạy dưới ``xvfb-run``, tốn đúng thời gian thực). Kịch bản:
+
+- ``idle``: để yên 60 giây;
+- ``tap_storm``: tap liên tục vào Mỏ;
+- ``resize``: kéo giãn cửa sổ liên tục;
+- ``levels``: (chỉ bản có level) bot chơi từ level 1 tới khi thua.
+
+Số đo: thời gian chạy, item canvas còn sống (cuối/đỉnh), tổng item đã tạo,
+hàng đợi ``after`` sâu nhất và RSS đỉnh; mỗi kịch bản chạy ``--repeat`` lần và
+lấy trung vị. ``--update`` ghi baseline; mặc định so với baseline và thoát mã 1 nếu có số đo vượt ngưỡng.
+Ghi baseline với ``--repeat`` lớn hơn lúc so để một lần chạy nhanh bất thường
+không thành mốc.
+
+    python -m benchmarks.suite --update --repeat 7
+    python -m benchmarks.suite
+    xvfb-run python -m benchmarks.suite --real-tk --baseline benchmarks/baseline_xvfb.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cong_duc.modes import MODES, load
+
+SCENARIOS = ("idle", "tap_storm", "resize", "levels")
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+SEED = 7
+
+# Ngưỡng hồi quy: (tỉ lệ cho phép tăng, độ lệch tuyệt đối bỏ qua).
+THRESHOLDS = {
+    "wall_ms": (0.25, 20.0),
+    "items_live": (0.10, 2),
+    "items_peak": (0.10, 2),
+    "items_created": (0.10, 10),
+    "after_depth_peak": (0.50, 2),
+    "rss_peak_mb": (0.25, 4.0),
+}
+
+
+# ------------------------ Drivers ------------------------
+def make_app(mode: str, root: object) -> object:
+    """Dựng app với mọi nguồn ngẫu nhiên cố định, để số item so khớp được giữa các lần chạy."""
+    # random toàn cục: jitter chữ bay, màu bùng sáng, seed ván của bản có level.
+    random.seed(SEED)
+    app = load(mode)(root)
+    for name in ("engine", "particles", "floating_texts", "glow"):
+        part = getattr(app, name, None)
+        if part is not None:
+            part.rng.seed(SEED)
+    return app
+
+
+class FakeDriver:
+    """Tk giả + đồng hồ ảo: advance() chạy callback chứ không chờ thật."""
+
+    def __init__(self, mode: str) -> None:
+        from benchmarks import fake_tk
+
+        self._install = fake_tk.installed()
+        self._install.__enter__()
+        self.root = fake_tk.FakeTk()
+        self.app = make_app(mode, self.root)
+        # Tải cho bộ chỉnh chất lượng gồm thời gian chạy task đo bằng đồng hồ
+        # thật, nên bậc tự động (và sức chứa pool chữ bay) không tái lập được.
+        self.app.quality.pin(0)
+        self.canvas = self.app.canvas
+        self._event = fake_tk.FakeEvent
+
+    def advance(self, ms: float) -> None:
+        self.root.advance(ms)
+
+    def tap(self, x: int, y: int) -> None:
+        self.canvas.fire("<Button-1>", self._event(x=x, y=y))
+
+    def resize(self, width: int, height: int) -> None:
+        self.canvas.width = width
+        self.canvas.height = height
+        self.canvas.fire("<Configure>", self._event(width=width, height=height))
+
+    def live_items(self) -> int:
+        return len(self.canvas.items)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "items_peak": self.canvas.live_peak,
+            "items_created": self.canvas.created,
+            "after_depth_peak": self.root.after_depth_peak,
+        }
+
+    def close(self) -> None:
+        self.app.on_close()
+        self._install.__exit__(None, None, None)
+
+
+class RealDriver:
+    """Tk thật (cần màn hình, ví dụ Xvfb); advance() bơm event loop thật."""
+
+    def __init__(self, mode: str) -> None:
+        import tkinter as tk
+
+        self.root = tk.Tk()
+        self.app = make_app(mode, self.root)
+        self.canvas = self.app.canvas
+        self.root.update()
+        self._first_id = self.canvas.create_line(0, 0, 0, 0)
+        self.canvas.delete(self._first_id)
+        self._items_peak = 0
+        self._after_peak = 0
+
+    def advance(self, ms: float) -> None:
+        end = time.perf_counter() + ms / 1000
+        while True:
+            self.root.update()
+            self._items_peak = max(self._items_peak, self.live_items())
+            depth = len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+            self._after_peak = max(self._after_peak, depth)
+            if time.perf_counter() >= end:
+                return
+            time.sleep(0.001)
+
+    def tap(self, x: int, y: int) -> None:
+        self.canvas.event_generate("<Button-1>", x=x, y=y)
+
+    def resize(self, width: int, height: int) -> None:
+        self.root.geometry(f"{width}x{height + 180}")
+
+    def live_items(self) -> int:
+        return len(self.canvas.find_all())
+
+    def stats(self) -> dict[str, float]:
+        # Id item tăng đơn điệu nên id mới trừ id mốc = số item đã tạo.
+        probe = self.canvas.create_line(0, 0, 0, 0)
+        self.canvas.delete(probe)
+        return {
+            "items_peak": self._items_peak,
+            "items_created": probe - self._first_id - 1,
+            "after_depth_peak": self._after_peak,
+        }
+
+    def close(self) -> None:
+        self.app.on_close()
+
+
+# ------------------------ Scenarios ------------------------
+def fish_center(driver: FakeDriver | RealDriver) -> tuple[int, int]:
+    engine = getattr(driver.app, "engine", None)
+    if engine is not None:
+        return engine.cx, engine.cy
+    width = driver.canvas.winfo_width() or 900
+    height = driver.canvas.winfo_height() or 400
+    return width // 2, height // 2 + 8
+
+
+def scenario_idle(driver: FakeDriver | RealDriver, args: argparse.Namespace) -> dict[str, float]:
+    driver.advance(60_000)
+    return {}
+
+
+def scenario_tap_storm(driver: FakeDriver | RealDriver, args: argparse.Namespace) -> dict[str, float]:
+    rng = random.Random(1)
+    if hasattr(driver.app, "start_game"):
+        driver.app.start_game()
+    interval = 1000 / args.tap_rate
+    for _ in range(args.taps):
+        x, y = fish_center(driver)
+        driver.tap(x + rng.randint(-40, 40), y + rng.randint(-20, 20))
+        driver.advance(interval)
+    return {"taps": args.taps}
+
+
+def scenario_resize(driver: FakeDriver | RealDriver, args: argparse.Namespace) -> dict[str, float]:
+    for i in range(args.resizes):
+        driver.resize(800 + (i * 37) % 500, 380 + (i * 23) % 300)
+        driver.advance(16)
+    driver.advance(1000)
+    return {"resizes": args.resizes}
+
+
+def scenario_levels(driver: FakeDriver | RealDriver, args: argparse.Namespace) -> dict[str, float]:
+    app = driver.app
+    if not hasattr(app, "engine"):
+        return {"skipped": 1}
+    rng = random.Random(2)
+    app.start_game()
+    interval = 1000 / 8
+    elapsed = 0.0
+    while app.engine.game_running and elapsed < 600_000:
+        x, y = app.engine.cx, app.engine.cy
+        if rng.random() > 0.9:
+            x += app.engine.body_rx * 2
+        driver.tap(x, y)
+        driver.advance(interval)
+        elapsed += interval
+    return {"level": app.engine.level, "merit": app.engine.total_merit}
+
+
+def run_one(variant: str, scenario: str, args: argparse.Namespace) -> dict[str, float]:
+    driver = (RealDriver if args.real_tk else FakeDriver)(variant)
+    start = time.perf_counter()
+    extra = globals()[f"scenario_{scenario}"](driver, args)
+    wall_ms = (time.perf_counter() - start) * 1000
+    result = {"wall_ms": round(wall_ms, 2), "items_live": driver.live_items(), **driver.stats(), **extra}
+    driver.close()
+    result["rss_peak_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+# ------------------------ Compare ------------------------
+def compare(results: dict, baseline: dict) -> list[str]:
+    regressions = []
+    print(f"{'variant':<8}{'scenario':<11}{'metric':<18}{'baseline':>11}{'now':>11}{'delta':>9}")
+    for variant, scenarios in results.items():
+        for scenario, metrics in scenarios.items():
+            base = baseline.get(variant, {}).get(scenario, {})
+            for metric, (ratio, slack) in THRESHOLDS.items():
+                if metric not in metrics or metric not in base:
+                    continue
+                now, before = metrics[metric], base[metric]
+                delta = (now - before) / before * 100 if before else 0.0
+                flag = ""
+                if now > before * (1 + ratio) + slack:
+                    flag = "  REGRESSION"
+                    regressions.append(f"{variant}/{scenario}/{metric}: {before} -> {now}")
+                print(f"{variant:<8}{scenario:<11}{metric:<18}{before:>11}{now:>11}{delta:>+8.1f}%{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update", action="store_true", help="ghi kết quả làm baseline mới")
+    parser.add_argument("--real-tk", action="store_true", help="dùng Tk thật (cần màn hình/Xvfb)")
+    parser.add_argument("--variants", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--taps", type=int, default=5000)
+    parser.add_argument("--tap-rate", type=float, default=20.0)
+    parser.add_argument("--resizes", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    # Dùng nội bộ: tiến trình con chạy đúng một kịch bản và in JSON.
+    parser.add_argument("--run", nargs=2, metavar=("VARIANT", "SCENARIO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_one(*args.run, args)))
+        return
+
+    env = dict(os.environ, CONG_DUC_AUDIO="null")
+    env.pop("CONG_DUC_SERVER", None)
+    passthrough = ["--taps", str(args.taps), "--tap-rate", str(args.tap_rate), "--resizes", str(args.resizes)]
+    if args.real_tk:
+        passthrough.append("--real-tk")
+
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    with tempfile.TemporaryDirectory() as home:
+        env["CONG_DUC_HOME"] = home
+        for variant in args.variants:
+            for scenario in args.scenarios:
+                if scenario == "levels" and variant != "levels":
+                    continue
+                runs = []
+                for _ in range(args.repeat):
+                    output = subprocess.run(
+                        [sys.executable, "-m", "benchmarks.suite", "--run", variant, scenario, *passthrough],
+                        env=env,
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    ).stdout
+                    runs.append(json.loads(output.splitlines()[-1]))
+                results.setdefault(variant, {})[scenario] = {
+                    key: statistics.median(run[key] for run in runs) for key in runs[0]
+                }
+
+    if args.update or not args.baseline.exists():
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(json.dumps(results, indent=2, sort_keys=True))
+        print(f"đã ghi baseline: {args.baseline}")
+        return
+
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")))
+    if regressions:
+        print("\n".join(["", "hồi quy:", *regressions]))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
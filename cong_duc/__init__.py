@@ -0,0 +1,12 @@
+"""Lõi dùng chung cho các bản Công Đức Điện Tử (không phụ thuộc Tk)."""
+
+__all__ = ["GameEngine", "LevelRules"]
+
+
+def __getattr__(name: str) -> object:
+    # Engine chỉ được import khi cần, để chế độ tự do khởi động không kéo theo nó.
+    if name in __all__:
+        from cong_duc import engine
+
+        return getattr(engine, name)
+    raise AttributeError(f"module 'cong_duc' has no attribute {name!r}")
@@ -0,0 +1,3 @@
+from cong_duc.modes import main
+
+main()
@@ -0,0 +1,147 @@
+"""Tổng hợp offline luồng sự kiện phân tích: người chơi thua ở đâu và vì sao.
+
+Đọc mọi file phiên do ``cong_duc.events`` ghi (Parquet hoặc CSV) thành các
+cột NumPy rồi gom bằng ``bincount`` theo level, không lặp Python theo từng
+sự kiện, nên vài triệu sự kiện chỉ mất chừng giây. Bảng in ra cho từng level:
+số lần vào, qua, thua, số lần trượt và tổng số giây bị trừ vì trượt, combo
+trung bình trước khi đứt; kèm phân bố độ dài combo lúc đứt.
+
+    python -m cong_duc.analytics                      # $CONG_DUC_HOME/events
+    python -m cong_duc.analytics path/to/events --levels 30
+
+Cần NumPy (pyarrow nếu có file Parquet); không bắt buộc để chơi game.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from cong_duc.events import COLUMNS, EV_GAME_OVER, EV_LEVEL_START, EV_LEVEL_UP, EV_MISS, default_events_dir
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - chỉ khi thiếu NumPy
+    np = None  # type: ignore[assignment]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise SystemExit("cong_duc.analytics cần NumPy: pip install numpy")
+
+
+def session_files(paths: list[Path]) -> list[Path]:
+    files: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in (".csv", ".parquet")))
+        else:
+            files.append(path)
+    return files
+
+
+def read_session(path: Path) -> dict[str, np.ndarray]:
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, columns=list(COLUMNS))
+        return {name: table.column(name).to_numpy() for name in COLUMNS}
+    data = np.loadtxt(path, delimiter=",", skiprows=1, dtype=np.int64, ndmin=2)
+    return {name: data[:, i] for i, name in enumerate(COLUMNS)}
+
+
+def load_events(paths: list[Path]) -> dict[str, np.ndarray]:
+    """Gộp mọi phiên thành một bảng cột; thêm cột ``session`` (số thứ tự file)."""
+    sessions = [read_session(path) for path in session_files(paths)]
+    sessions = [s for s in sessions if len(s["kind"])]
+    if not sessions:
+        return {name: np.zeros(0, dtype=np.int64) for name in (*COLUMNS, "session")}
+    events = {name: np.concatenate([s[name] for s in sessions]) for name in COLUMNS}
+    events["session"] = np.repeat(np.arange(len(sessions)), [len(s["kind"]) for s in sessions])
+    return events
+
+
+def level_table(events: dict[str, np.ndarray], max_level: int) -> list[tuple[int, int, int, int, int, int, float]]:
+    """(level, vào, qua, thua, số lần trượt, giây bị trừ, combo TB lúc đứt) theo level."""
+    kind = events["kind"]
+    level = np.minimum(events["level"], max_level)
+    size = max_level + 1
+
+    def count(k: int) -> np.ndarray:
+        return np.bincount(level[kind == k], minlength=size)
+
+    miss = kind == EV_MISS
+    started = count(EV_LEVEL_START)
+    cleared = count(EV_LEVEL_UP)
+    failed = count(EV_GAME_OVER)
+    misses = count(EV_MISS)
+    lost = np.bincount(level[miss], weights=events["value"][miss], minlength=size)
+    combo_sum = np.bincount(level[miss], weights=events["combo"][miss], minlength=size)
+    rows = []
+    for lvl in range(1, size):
+        mean_combo = combo_sum[lvl] / misses[lvl] if misses[lvl] else 0.0
+        rows.append(
+            (
+                lvl,
+                int(started[lvl]),
+                int(cleared[lvl]),
+                int(failed[lvl]),
+                int(misses[lvl]),
+                int(lost[lvl]),
+                float(mean_combo),
+            )
+        )
+    return rows
+
+
+def combo_breaks(events: dict[str, np.ndarray], longest: int = 20) -> np.ndarray:
+    """Số lần combo đứt theo độ dài lúc đứt (ô cuối gộp mọi combo >= ``longest``)."""
+    combo = events["combo"][events["kind"] == EV_MISS]
+    return np.bincount(np.minimum(combo, longest), minlength=longest + 1)
+
+
+def format_table(rows: list[tuple[int, int, int, int, int, int, float]]) -> str:
+    lines = [
+        f"{'level':>5}{'started':>10}{'cleared':>10}{'failed':>9}{'fail %':>8}{'misses':>10}{'lost s':>10}{'combo':>8}"
+    ]
+    for lvl, started, cleared, failed, misses, lost, mean_combo in rows:
+        if started:
+            lines.append(
+                f"{lvl:>5}{started:>10}{cleared:>10}{failed:>9}{failed / started * 100:>7.1f}%"
+                f"{misses:>10}{lost:>10}{mean_combo:>8.2f}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", type=Path, help="file phiên hoặc thư mục (mặc định: thư mục events)")
+    parser.add_argument("--levels", type=int, default=20, help="gộp các level cao hơn vào level cuối")
+    parser.add_argument("--longest-combo", type=int, default=20)
+    args = parser.parse_args()
+    _require_numpy()
+
+    start = time.perf_counter()
+    events = load_events(args.paths or [default_events_dir()])
+    loaded = time.perf_counter()
+    rows = level_table(events, args.levels)
+    breaks = combo_breaks(events, args.longest_combo)
+    done = time.perf_counter()
+    sessions = int(events["session"].max()) + 1 if len(events["session"]) else 0
+    print(
+        f"{len(events['kind'])} sự kiện, {sessions} phiên: "
+        f"đọc {loaded - start:.2f} s, tổng hợp {(done - loaded) * 1000:.1f} ms"
+    )
+    print(format_table(rows))
+
+    print("\ncombo lúc đứt")
+    total = int(breaks.sum()) or 1
+    for length, count in enumerate(breaks):
+        if count:
+            label = f">={length}" if length == args.longest_combo else str(length)
+            print(f"{label:>5}{int(count):>10}{count / total * 100:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Lõi dùng chung của mọi chế độ chơi: cửa sổ, canvas, scheduler, âm thanh.
+
+Mỗi chế độ trong ``cong_duc.modes`` kế thừa ``FishApp`` và chỉ thêm phần
+riêng của nó (bố cục nhãn, vòng quanh Mỏ, cách xử lý tap). Module này chỉ
+import những gì chế độ nào cũng cần; phần nặng hơn (engine, replay, cộng
+đồng, profiler...) do chế độ cần nó tự import.
+
+Khởi động chia hai pha: khung chính (tiêu đề, nhãn điểm, canvas) dựng ngay,
+phần còn lại dựng qua ``defer``. Với ``lazy_ui`` (launcher luôn bật) cửa sổ
+được hiện trước, phần phụ, vẽ Mỏ và animation chạy ở frame kế tiếp.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tkinter as tk
+from typing import Callable
+
+from cong_duc.audio import TapAudio
+from cong_duc.fonts import FontCache
+from cong_duc.items import DEFAULT_CAP, CanvasItemRegistry
+from cong_duc.layout import CanvasLayout
+from cong_duc.ledger import MeritLedger
+from cong_duc.quality import QualityController, QualityTier
+from cong_duc.scheduler import FrameScheduler
+from cong_duc.startup import StartupTimer
+
+BG_COLOR = "#090c18"
+NEON_MAIN = "#00e5ff"
+NEON_GLOW = "#4b6cff"
+TEXT_COLOR = "#d8f7ff"
+FLASH_COLOR = "#b9fbff"
+GLOW_PALETTE = ["#00e5ff", "#7a7dff", "#ff4fd8", "#7dffb3", "#ffd166"]
+
+
+class FishApp:
+    def __init__(
+        self,
+        root: tk.Tk,
+        title: str,
+        geometry: str,
+        min_size: tuple[int, int],
+        lazy_ui: bool = False,
+        startup: StartupTimer | None = None,
+    ) -> None:
+        self.root = root
+        self.lazy_ui = lazy_ui
+        self.startup = startup
+        self.root.title(title)
+        self.root.geometry(geometry)
+        self.root.minsize(*min_size)
+        self.root.configure(bg=BG_COLOR)
+        # Font phân giải một lần theo spec, dùng chung cho widget và canvas.
+        self.fonts = FontCache(root)
+
+        # Mọi timer/hiệu ứng chạy qua một scheduler, một callback mỗi frame.
+        self.scheduler = FrameScheduler(root)
+        # Âm thanh (chọn backend, tổng hợp mẫu "cốc") được tạo cùng phần phụ.
+        self.audio: TapAudio | None = None
+        # Công đức trọn đời được lưu xuống đĩa theo lô, khôi phục khi mở lại.
+        self.ledger = MeritLedger()
+        # Tự bớt hiệu ứng trang trí khi event loop quá tải (xem apply_quality).
+        self.quality = QualityController(self.scheduler, self.apply_quality)
+        self.core_item_id: int | None = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.mark("lõi (scheduler, sổ công đức)")
+
+    # ------------------------ Launch ------------------------
+    @classmethod
+    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
+        """Thêm tuỳ chọn dòng lệnh riêng của chế độ (mặc định: không có)."""
+
+    @classmethod
+    def from_args(cls, root: tk.Tk, args: argparse.Namespace, **options: object) -> FishApp:
+        return cls(root, **options)
+
+    def mark(self, phase: str) -> None:
+        if self.startup is not None:
+            self.startup.mark(phase)
+
+    def defer(self, build: Callable[[], None]) -> None:
+        """Chạy ``build`` ngay, hoặc (``lazy_ui``) hiện cửa sổ trước rồi chạy ở frame sau."""
+        self.mark("khung chính")
+        if not self.lazy_ui:
+            self._run_deferred(build)
+            return
+        self.root.update()
+        self.mark("cửa sổ hiện")
+        self.scheduler.once("deferred_ui", 0, lambda: self._run_deferred(build))
+
+    def _run_deferred(self, build: Callable[[], None]) -> None:
+        # Backend âm thanh được chọn một lần, mẫu "cốc" tổng hợp sẵn trước
+        # khi tap đầu tiên được bind.
+        self.audio = TapAudio.create(self.root)
+        self.mark("âm thanh")
+        build()
+        self.quality.start()
+        self.mark("widget phụ, vẽ Mỏ, animation")
+        if self.startup is not None:
+            self.startup.report()
+
+    # ------------------------ Widgets ------------------------
+    def make_label(self, parent: tk.Misc, text: str, fg: str, font: tuple, **pack: object) -> tk.Label:
+        label = tk.Label(parent, text=text, fg=fg, bg=BG_COLOR, font=self.fonts.get(font))
+        label.pack(**pack)
+        return label
+
+    def make_canvas(self, width: int, height: int, cap: int = DEFAULT_CAP) -> tk.Canvas:
+        self.canvas = tk.Canvas(self.root, bg=BG_COLOR, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+        # Mọi item canvas được ghi sổ từ lúc tạo đến lúc xoá, có trần cứng.
+        self.canvas_items = CanvasItemRegistry(self.canvas, cap=cap).attach()
+        # Kích thước canvas giữ từ <Configure> ngay từ đầu; chế độ đăng ký
+        # on_change khi đã có item để đặt lại (width/height là kích thước mặc định).
+        self.layout = CanvasLayout(self.canvas, self.scheduler, width, height).attach()
+        return self.canvas
+
+    # ------------------------ Rendering ------------------------
+    def draw_fish_body(self, cx: float, cy: float, rx: float, ry: float, tags: str | tuple = ()) -> list[int]:
+        """Vẽ thân Mỏ, đường giữa, lỗ và chữ "MỎ"; trả về id theo thứ tự vẽ."""
+        canvas = self.canvas
+        body = canvas.create_oval(
+            cx - rx,
+            cy - ry,
+            cx + rx,
+            cy + ry,
+            fill="#0f1731",
+            outline=NEON_MAIN,
+            width=4,
+            tags=tags,
+        )
+        self.core_item_id = body
+        midline = canvas.create_line(cx - 90, cy, cx + 90, cy, fill=NEON_MAIN, width=3, tags=tags)
+        hole = canvas.create_oval(
+            cx - 26,
+            cy - 26,
+            cx + 26,
+            cy + 26,
+            fill="#101f45",
+            outline=NEON_MAIN,
+            width=3,
+            tags=tags,
+        )
+        label = canvas.create_text(
+            cx, cy, text="MỎ", fill=TEXT_COLOR, font=self.fonts.get(("Consolas", 14, "bold")), tags=tags
+        )
+        return [body, midline, hole, label]
+
+    def flash_core(self, duration_ms: int) -> None:
+        """Nháy viền thân Mỏ (giả lập haptic feedback) trong ``duration_ms``."""
+        if not self.core_item_id:
+            return
+        self.canvas.itemconfig(self.core_item_id, outline=FLASH_COLOR)
+        self.scheduler.once("flash", duration_ms, lambda: self.canvas.itemconfig(self.core_item_id, outline=NEON_MAIN))
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        """Áp một bậc chất lượng lên hiệu ứng của chế độ (mặc định: không có gì)."""
+
+    # ------------------------ Util ------------------------
+    def play_tap_sound(self) -> None:
+        """Phát tiếng cốc trên worker nền, không chặn UI (hết voice thì bỏ qua)."""
+        self.audio.play()
+
+    def on_close(self) -> None:
+        """Xả nốt sổ công đức và âm thanh trước khi đóng cửa sổ."""
+        self.ledger.close()
+        if self.audio is not None:
+            self.audio.close()
+        self.root.destroy()
@@ -0,0 +1,247 @@
+"""Âm thanh tap "cốc" không chặn UI, tải sẵn một lần và giới hạn số voice.
+
+Backend được chọn đúng một lần lúc khởi động (winsound, aplay/paplay, chuông
+Tk hoặc im lặng). Mẫu tiếng mõ gỗ được tổng hợp sẵn thành WAV trong bộ nhớ,
+rồi các worker nền phát nó; khi đã đủ ``max_voices`` tiếng đang kêu thì tap
+mới bị bỏ tiếng chứ không bao giờ làm chậm ``on_tap``.
+
+Đặt biến môi trường ``CONG_DUC_AUDIO`` thành ``null`` hoặc ``wav:<đường dẫn>``
+để chạy headless (ví dụ khi test/benchmark).
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import os
+import queue
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+import tkinter as tk
+import wave
+from typing import Protocol
+
+SAMPLE_RATE = 22050
+
+
+def synthesize_coc(sample_rate: int = SAMPLE_RATE, duration_ms: int = 140) -> bytes:
+    """Tổng hợp tiếng "cốc" mõ gỗ: vài họa âm tắt rất nhanh, trả về WAV 16-bit mono."""
+    frames = sample_rate * duration_ms // 1000
+    # Tần số/biên độ/hệ số tắt của các họa âm, chỉnh tai cho giống mõ gỗ.
+    partials = ((820.0, 0.55, 38.0), (1370.0, 0.3, 55.0), (2240.0, 0.15, 80.0))
+    samples = bytearray()
+    for n in range(frames):
+        t = n / sample_rate
+        value = sum(amp * math.exp(-decay * t) * math.sin(2 * math.pi * freq * t) for freq, amp, decay in partials)
+        # Tiếng gõ ban đầu: vài mili giây nhiễu đã lọc cho cảm giác "cộc".
+        if n < sample_rate // 500:
+            value += 0.25 * math.sin(n * 12.9898) * (1 - n / (sample_rate // 500))
+        samples += struct.pack("<h", int(max(-1.0, min(1.0, value)) * 32000))
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(bytes(samples))
+    return buffer.getvalue()
+
+
+# ------------------------ Backends ------------------------
+class AudioBackend(Protocol):
+    name: str
+    # True nếu play() có thể chặn và phải chạy trên worker nền.
+    threaded: bool
+
+    def play(self, sample: bytes) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class NullBackend:
+    """Không phát gì; chỉ đếm số lần phát."""
+
+    name = "null"
+    threaded = False
+
+    def __init__(self) -> None:
+        self.played = 0
+
+    def play(self, sample: bytes) -> None:
+        self.played += 1
+
+    def close(self) -> None:
+        pass
+
+
+class WavFileBackend:
+    """Ghi nối mọi tiếng được phát vào một file WAV (nghe lại/kiểm tra headless)."""
+
+    name = "wav"
+    threaded = True
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.played = 0
+        self._lock = threading.Lock()
+        self._out: wave.Wave_write | None = None
+
+    def play(self, sample: bytes) -> None:
+        with wave.open(io.BytesIO(sample), "rb") as source:
+            params = source.getparams()
+            frames = source.readframes(source.getnframes())
+        with self._lock:
+            if self._out is None:
+                self._out = wave.open(self.path, "wb")
+                self._out.setparams(params)
+            self._out.writeframes(frames)
+            self.played += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._out is not None:
+                self._out.close()
+                self._out = None
+
+
+class WinsoundBackend:
+    name = "winsound"
+    threaded = True
+
+    def __init__(self) -> None:
+        import winsound  # type: ignore
+
+        self._winsound = winsound
+
+    def play(self, sample: bytes) -> None:
+        # SND_MEMORY không hỗ trợ SND_ASYNC nên gọi chặn, nhưng trên worker nền.
+        self._winsound.PlaySound(sample, self._winsound.SND_MEMORY | self._winsound.SND_NODEFAULT)
+
+    def close(self) -> None:
+        pass
+
+
+class PipeBackend:
+    """Đẩy WAV qua stdin của ``aplay``/``paplay`` (Linux)."""
+
+    name = "pipe"
+    threaded = True
+
+    def __init__(self, command: list[str]) -> None:
+        self.command = command
+
+    def play(self, sample: bytes) -> None:
+        try:
+            subprocess.run(self.command, input=sample, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        pass
+
+
+class BellBackend:
+    """Chuông hệ thống của Tk: rẻ, không chặn, nhưng phải gọi trên luồng Tk."""
+
+    name = "bell"
+    threaded = False
+
+    def __init__(self, root: tk.Misc) -> None:
+        self.root = root
+
+    def play(self, sample: bytes) -> None:
+        self.root.bell()
+
+    def close(self) -> None:
+        pass
+
+
+def select_backend(root: tk.Misc | None = None) -> AudioBackend:
+    """Chọn backend một lần theo môi trường; không bao giờ ném lỗi."""
+    choice = os.environ.get("CONG_DUC_AUDIO", "")
+    if choice == "null":
+        return NullBackend()
+    if choice.startswith("wav:"):
+        return WavFileBackend(choice[4:])
+
+    if sys.platform == "win32":
+        try:
+            return WinsoundBackend()
+        except Exception:
+            pass
+    for player in (["paplay"], ["aplay", "-q"]):
+        if shutil.which(player[0]):
+            return PipeBackend(player)
+    if root is not None:
+        return BellBackend(root)
+    return NullBackend()
+
+
+# ------------------------ Engine ------------------------
+class TapAudio:
+    def __init__(self, backend: AudioBackend, max_voices: int = 3, sample: bytes | None = None) -> None:
+        self.backend = backend
+        self.max_voices = max_voices
+        self.sample = sample if sample is not None else synthesize_coc()
+
+        self.dropped = 0
+        self.submitted = 0
+        self._active = 0
+        self._lock = threading.Lock()
+        self._queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._workers: list[threading.Thread] = []
+
+    @classmethod
+    def create(cls, root: tk.Misc | None = None, max_voices: int = 3) -> TapAudio:
+        return cls(select_backend(root), max_voices=max_voices)
+
+    def play(self) -> bool:
+        """Phát tiếng cốc nếu còn voice trống; trả về False nếu bị bỏ."""
+        if not self.backend.threaded:
+            self.backend.play(self.sample)
+            self.submitted += 1
+            return True
+
+        with self._lock:
+            if self._active >= self.max_voices:
+                self.dropped += 1
+                return False
+            self._active += 1
+        self.submitted += 1
+        if len(self._workers) < self.max_voices:
+            self._start_worker()
+        self._queue.put(self.sample)
+        return True
+
+    @property
+    def active_voices(self) -> int:
+        return self._active
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._worker, name="cong-duc-audio", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker(self) -> None:
+        while True:
+            sample = self._queue.get()
+            if sample is None:
+                return
+            try:
+                self.backend.play(sample)
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._active -= 1
+
+    def close(self) -> None:
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+        self._workers.clear()
+        self.backend.close()
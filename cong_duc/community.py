@@ -0,0 +1,281 @@
+"""Công đức cộng đồng: server asyncio gom công đức từ nhiều người chơi.
+
+Client không gửi từng tap mà gửi lô ``<Ii>`` (số tap, công đức) vài lần mỗi
+giây. Server cộng lô vào bộ đếm chia shard theo kết nối và chỉ gộp các shard
+khi phát tổng ``<qq>`` (công đức, tap) cho mọi client theo nhịp cố định,
+không phát theo từng tap.
+
+    python -m cong_duc.community --port 7345          # chạy server
+    CONG_DUC_SERVER=127.0.0.1:7345 python cong_duc_dien_tu12.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import select
+import socket
+import struct
+import threading
+import time
+
+TAP_BATCH = struct.Struct("<Ii")
+TOTALS = struct.Struct("<qq")
+DEFAULT_PORT = 7345
+# Một tap được tối đa 2 công đức (hit thứ 5 của combo).
+MAX_GAIN_PER_TAP = 2
+# Tốc độ tap của tay người, cùng mức với ``TapValidator``. Mỗi kết nối có một
+# thùng token nạp theo tốc độ này, chứa tối đa ``MAX_TAPS_PER_FRAME`` tap.
+MAX_TAPS_PER_SECOND = 20
+MAX_TAPS_PER_FRAME = 2 * MAX_TAPS_PER_SECOND
+
+
+class CommunityServer:
+    def __init__(self, shards: int = 16, broadcast_hz: float = 4.0, max_write_buffer: int = 1 << 16) -> None:
+        self.shards = shards
+        self.broadcast_interval = 1.0 / broadcast_hz
+        self.max_write_buffer = max_write_buffer
+        self.merit = [0] * shards
+        self.taps = [0] * shards
+        self.clients: set[asyncio.Transport] = set()
+
+        # Thống kê cho benchmark.
+        self.frames = 0
+        self.rejected = 0
+        self.kicked = 0
+        self.broadcasts = 0
+        self.skipped_sends = 0
+
+        self._next_shard = 0
+        self._server: asyncio.Server | None = None
+        self._broadcaster: asyncio.Task[None] | None = None
+
+    def totals(self) -> tuple[int, int]:
+        return sum(self.merit), sum(self.taps)
+
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> asyncio.Server:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(self._make_protocol, host, port)
+        self._broadcaster = loop.create_task(self._broadcast_loop())
+        return self._server
+
+    async def close(self) -> None:
+        if self._broadcaster is not None:
+            self._broadcaster.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for transport in list(self.clients):
+            transport.close()
+
+    def _make_protocol(self) -> _TapProtocol:
+        shard = self._next_shard
+        self._next_shard = (shard + 1) % self.shards
+        return _TapProtocol(self, shard)
+
+    async def _broadcast_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self.broadcast_interval
+        next_at = loop.time() + interval
+        sent: tuple[int, int] | None = None
+        while True:
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            # Nhịp cố định, bỏ qua nhịp đã lỡ thay vì dồn phát bù.
+            next_at += interval * max(1, int((loop.time() - next_at) // interval) + 1)
+            totals = self.totals()
+            if totals == sent:
+                continue
+            sent = totals
+            self.broadcasts += 1
+            payload = TOTALS.pack(*totals)
+            limit = self.max_write_buffer
+            for transport in self.clients:
+                # Client đọc chậm thì bỏ nhịp này; nhịp sau đã có tổng mới hơn.
+                if transport.get_write_buffer_size() > limit:
+                    self.skipped_sends += 1
+                    continue
+                transport.write(payload)
+
+
+class _TapProtocol(asyncio.Protocol):
+    def __init__(self, server: CommunityServer, shard: int) -> None:
+        self.server = server
+        self.shard = shard
+        self.transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+        self._allowance = float(MAX_TAPS_PER_FRAME)
+        self._refilled_at = time.monotonic()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+        self.server.clients.add(self.transport)  # type: ignore[arg-type]
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.server.clients.discard(self.transport)  # type: ignore[arg-type]
+
+    def data_received(self, data: bytes) -> None:
+        buffer = self._buffer
+        buffer += data
+        usable = len(buffer) - len(buffer) % TAP_BATCH.size
+        if not usable:
+            return
+
+        now = time.monotonic()
+        allowance = min(MAX_TAPS_PER_FRAME, self._allowance + (now - self._refilled_at) * MAX_TAPS_PER_SECOND)
+        self._refilled_at = now
+        taps_sum = 0
+        merit_sum = 0
+        frames = 0
+        rejected = 0
+        kicked = False
+        for taps, merit in TAP_BATCH.iter_unpack(memoryview(buffer)[:usable]):
+            if taps > MAX_TAPS_PER_FRAME:
+                # Client thật không bao giờ gửi lô lớn thế: ngắt kết nối,
+                # bỏ cả frame này lẫn phần còn lại của lần đọc.
+                rejected += 1
+                kicked = True
+                break
+            if merit < 0 or merit > taps * MAX_GAIN_PER_TAP or taps > allowance:
+                rejected += 1
+                continue
+            allowance -= taps
+            taps_sum += taps
+            merit_sum += merit
+            frames += 1
+        del buffer[:usable]
+        self._allowance = allowance
+
+        # Một lần cộng vào shard cho cả lần đọc, dù có bao nhiêu frame.
+        server = self.server
+        server.merit[self.shard] += merit_sum
+        server.taps[self.shard] += taps_sum
+        server.frames += frames
+        server.rejected += rejected
+        if kicked:
+            server.kicked += 1
+            self.transport.close()  # type: ignore[union-attr]
+
+
+class CommunityClient:
+    """Client chạy trên luồng nền: gom công đức, gửi theo lô, nhận tổng.
+
+    ``add`` chỉ chạm bộ nhớ nên gọi được ngay trên luồng Tk; mất kết nối thì
+    công đức chưa gửi được giữ lại và thử kết nối lại sau. Mỗi lô không vượt
+    ``MAX_TAPS_PER_SECOND`` tính theo chu kỳ gửi, phần dư đợi lô sau, để phần
+    dồn lại khi mất mạng không bị server coi là tap nhanh hơn người.
+    """
+
+    def __init__(self, host: str, port: int = DEFAULT_PORT, flush_interval_ms: int = 250) -> None:
+        self.address = (host, port)
+        self.flush_interval = flush_interval_ms / 1000
+        self.taps_per_flush = max(1, int(MAX_TAPS_PER_SECOND * self.flush_interval))
+        self.total_merit: int | None = None
+        self.total_taps: int | None = None
+        self.connected = False
+
+        self._pending_taps = 0
+        self._pending_merit = 0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cong-duc-community", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls) -> CommunityClient | None:
+        """Đọc ``CONG_DUC_SERVER=host:port``; không đặt thì không kết nối."""
+        address = os.environ.get("CONG_DUC_SERVER", "")
+        if not address:
+            return None
+        host, _, port = address.rpartition(":")
+        return cls(host or "127.0.0.1", int(port or DEFAULT_PORT))
+
+    def add(self, delta: int) -> None:
+        with self._lock:
+            self._pending_taps += 1
+            self._pending_merit += delta
+
+    def close(self) -> None:
+        self._closed.set()
+        self._thread.join(timeout=1.0)
+
+    def _run(self) -> None:
+        backoff = 0.5
+        while not self._closed.is_set():
+            try:
+                sock = socket.create_connection(self.address, timeout=2.0)
+            except OSError:
+                self._closed.wait(backoff)
+                backoff = min(backoff * 2, 10.0)
+                continue
+            backoff = 0.5
+            self.connected = True
+            with sock:
+                try:
+                    self._pump(sock)
+                except OSError:
+                    pass
+            self.connected = False
+
+    def _pump(self, sock: socket.socket) -> None:
+        buffer = b""
+        next_flush = time.monotonic() + self.flush_interval
+        while not self._closed.is_set():
+            readable, _, _ = select.select([sock], [], [], max(0.0, next_flush - time.monotonic()))
+            if readable:
+                data = sock.recv(4096)
+                if not data:
+                    return
+                buffer += data
+                usable = len(buffer) - len(buffer) % TOTALS.size
+                if usable:
+                    # Chỉ tổng mới nhất là có ý nghĩa.
+                    self.total_merit, self.total_taps = TOTALS.unpack_from(buffer, usable - TOTALS.size)
+                    buffer = buffer[usable:]
+            if time.monotonic() >= next_flush:
+                next_flush += self.flush_interval
+                self._flush(sock)
+        self._flush(sock)
+
+    def _flush(self, sock: socket.socket) -> None:
+        with self._lock:
+            taps = min(self._pending_taps, self.taps_per_flush)
+            # Dồn công đức vào các tap gửi trước nhưng vẫn giữ merit <= taps * 2
+            # cho cả lô này lẫn phần còn lại.
+            merit = min(self._pending_merit, taps * MAX_GAIN_PER_TAP)
+            self._pending_taps -= taps
+            self._pending_merit -= merit
+        if not taps:
+            return
+        try:
+            sock.sendall(TAP_BATCH.pack(taps, merit))
+        except OSError:
+            with self._lock:
+                self._pending_taps += taps
+                self._pending_merit += merit
+            raise
+
+
+async def serve(host: str, port: int, shards: int, broadcast_hz: float) -> None:
+    server = CommunityServer(shards=shards, broadcast_hz=broadcast_hz)
+    listener = await server.start(host, port)
+    print(f"community server trên {host}:{port} ({shards} shard, {broadcast_hz:g} Hz)", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--hz", type=float, default=4.0, help="số lần phát tổng mỗi giây")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.shards, args.hz))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Độ khó thích ứng: ước lượng kỹ năng người chơi theo từng tap, chỉnh luật theo level.
+
+``SkillModel`` giữ vài trung bình trượt hàm mũ (EWMA), mỗi tap cập nhật O(1)
+bằng vài phép cộng nhân: tỉ lệ trúng, độ chính xác khi đã kịp nhìn thấy Mỏ,
+nhịp tap, nhịp Mỏ nhảy đang chơi và thời gian phản xạ (từ lúc Mỏ nhảy chỗ tới
+hit đầu tiên ở chỗ mới). Phần trượt vì Mỏ vừa nhảy suy ra từ chênh lệch giữa
+tỉ lệ trúng và độ chính xác, rồi quy ra "thời gian mù" sau mỗi lần nhảy.
+
+``AdaptiveRules`` là một ``LevelRules`` tính luật cho mỗi level từ ước lượng
+đó, sao cho xác suất qua màn gần ``pass_rate``. Mô hình qua màn: mỗi tap tốn
+``1/r`` giây, trượt thì mất thêm ``MISS_PENALTY_S``; tỉ lệ trúng giảm theo
+phần thời gian "mù" ``blind_ms / move_ms`` sau mỗi lần Mỏ nhảy. Điểm trong
+``seconds`` giây xấp xỉ phân phối chuẩn (định lý giới hạn của quá trình
+renewal-reward), nên xác suất đạt ``target`` tính được dạng đóng:
+
+- nhịp Mỏ nhảy chọn để phần thời gian "mù" quanh ``move_loss``;
+- mục tiêu điểm là mức đạt được với xác suất ``pass_rate``;
+- người chơi yếu tới mức mục tiêu chạm sàn thì được thêm giờ.
+
+Mọi giá trị bị kẹp quanh đường cong gốc nên level sau vẫn khó hơn level
+trước. Luật thay đổi theo người chơi nên replay ghi lại luật của từng level
+(``ReplayRecorder`` xem ``rules.adaptive``).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+from statistics import NormalDist
+
+from cong_duc.engine import COMBO_BONUS_EVERY, MISS_PENALTY_S, LevelRules
+from cong_duc.ledger import default_data_dir
+
+SKILL_NAME = "skill.json"
+# Khoảng cách giữa hai tap dài hơn mức này là nghỉ tay, không tính vào nhịp.
+MAX_TAP_GAP_MS = 2000
+MAX_REACTION_MS = 2000
+
+
+class SkillModel:
+    __slots__ = (
+        "alpha",
+        "hits",
+        "accuracy",
+        "tap_ms",
+        "move_ms",
+        "reaction_ms",
+        "samples",
+        "_last_t",
+        "_reacted_to",
+    )
+
+    def __init__(
+        self,
+        alpha: float = 0.05,
+        hits: float = 0.7,
+        accuracy: float = 0.85,
+        tap_ms: float = 220.0,
+        move_ms: float = 900.0,
+        reaction_ms: float = 400.0,
+        samples: int = 0,
+    ) -> None:
+        self.alpha = alpha
+        self.hits = hits
+        self.accuracy = accuracy
+        self.tap_ms = tap_ms
+        self.move_ms = move_ms
+        self.reaction_ms = reaction_ms
+        self.samples = samples
+        self._last_t: int | None = None
+        self._reacted_to: int | None = None
+
+    def observe(self, hit: bool, now: int, moved_at: int, move_ms: int) -> None:
+        """Cập nhật với một tap đã chấm tại ``now``; Mỏ nhảy mỗi ``move_ms``, lần cuối lúc ``moved_at``."""
+        alpha = self.alpha
+        outcome = 1.0 if hit else 0.0
+        last = self._last_t
+        self._last_t = now
+        if last is not None and 0 < now - last < MAX_TAP_GAP_MS:
+            self.tap_ms += alpha * (now - last - self.tap_ms)
+        self.hits += alpha * (outcome - self.hits)
+        self.move_ms += alpha * (move_ms - self.move_ms)
+        since_move = now - moved_at
+        if since_move >= self.reaction_ms:
+            # Đã đủ thời gian thấy chỗ mới: đúng/sai là do tay, không do Mỏ nhảy.
+            self.accuracy += alpha * (outcome - self.accuracy)
+        if hit and moved_at != self._reacted_to:
+            self._reacted_to = moved_at
+            self.reaction_ms += alpha * (min(since_move, MAX_REACTION_MS) - self.reaction_ms)
+        self.samples += 1
+
+    @property
+    def blind_ms(self) -> float:
+        """Thời gian sau mỗi lần Mỏ nhảy mà tap coi như trượt (ước lượng)."""
+        if self.accuracy <= 0:
+            return 0.0
+        return self.move_ms * max(0.0, 1.0 - self.hits / self.accuracy)
+
+    def hit_rate(self, move_ms: float) -> float:
+        """Tỉ lệ trúng dự đoán khi Mỏ nhảy mỗi ``move_ms``."""
+        return self.accuracy * (1.0 - min(0.9, self.blind_ms / move_ms))
+
+    def pass_probability(self, target: int, seconds: float, move_ms: float) -> float:
+        mean, sd = self.score_distribution(seconds, move_ms)
+        return 1.0 - NormalDist(mean, sd).cdf(target - 0.5)
+
+    def score_distribution(self, seconds: float, move_ms: float) -> tuple[float, float]:
+        """Trung bình và độ lệch chuẩn của điểm đạt được trong ``seconds`` giây."""
+        h = self.hit_rate(move_ms)
+        q = 1.0 - h
+        per_tap_s = self.tap_ms / 1000 + MISS_PENALTY_S * q
+        # Mỗi hit thứ COMBO_BONUS_EVERY liên tiếp được thêm 1 (xấp xỉ theo h).
+        bonus = 1.0 + h ** (COMBO_BONUS_EVERY - 1) / COMBO_BONUS_EVERY
+        mean = seconds / per_tap_s * h * bonus
+        c = h / per_tap_s
+        var = seconds * (1.0 + MISS_PENALTY_S * c) ** 2 * h * q / per_tap_s
+        return mean, math.sqrt(var) + 0.5
+
+    # ------------------------ Persistence ------------------------
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "accuracy": self.accuracy,
+            "tap_ms": self.tap_ms,
+            "move_ms": self.move_ms,
+            "reaction_ms": self.reaction_ms,
+            "samples": self.samples,
+        }
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> None:
+        path = Path(path) if path is not None else default_data_dir() / SKILL_NAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str] | None = None) -> SkillModel:
+        path = Path(path) if path is not None else default_data_dir() / SKILL_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(
+                hits=float(data["hits"]),
+                accuracy=float(data["accuracy"]),
+                tap_ms=float(data["tap_ms"]),
+                move_ms=float(data["move_ms"]),
+                reaction_ms=float(data["reaction_ms"]),
+                samples=int(data["samples"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+
+class AdaptiveRules(LevelRules):
+    adaptive = True
+
+    def __init__(
+        self,
+        skill: SkillModel | None = None,
+        pass_rate: float = 0.7,
+        base: LevelRules | None = None,
+        move_loss: float = 0.25,
+        min_scale: float = 0.5,
+        max_scale: float = 1.6,
+    ) -> None:
+        self.skill = skill or SkillModel()
+        self.pass_rate = pass_rate
+        self.base = base or LevelRules()
+        self.move_loss = move_loss
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self._z = NormalDist().inv_cdf(pass_rate)
+        # Luật của level gần nhất, tính lại khi sang level hoặc có tap mới.
+        self._plan_key: tuple[int, int] | None = None
+        self._plan = (0, 0, 0)
+
+    def plan(self, level: int) -> tuple[int, int, int]:
+        """(mục tiêu, số giây, nhịp Mỏ nhảy ms) cho ``level`` theo kỹ năng hiện tại."""
+        key = (level, self.skill.samples)
+        if key == self._plan_key:
+            return self._plan
+        base = self.base
+        skill = self.skill
+        base_target = base.get_level_target(level)
+        base_time = base.get_level_time(level)
+        base_move = base.get_move_interval_ms(level)
+
+        move = skill.blind_ms / self.move_loss
+        move = round(min(max(move, base_move * self.min_scale), base_move * self.max_scale))
+        low = max(3, round(base_target * self.min_scale))
+        high = max(low, round(base_target * self.max_scale))
+        seconds = base_time
+        mean, sd = skill.score_distribution(seconds, move)
+        target = min(max(int(mean - self._z * sd + 0.5), low), high)
+        # Mục tiêu đã chạm sàn mà vẫn khó: cho thêm giờ (tối đa gấp đôi).
+        while seconds < 2 * base_time and skill.pass_probability(target, seconds, move) < self.pass_rate:
+            seconds += 1
+
+        self._plan_key = key
+        self._plan = (target, seconds, move)
+        return self._plan
+
+    def get_level_target(self, level: int) -> int:
+        return self.plan(level)[0]
+
+    def get_level_time(self, level: int) -> int:
+        return self.plan(level)[1]
+
+    def get_move_interval_ms(self, level: int) -> int:
+        return self.plan(level)[2]
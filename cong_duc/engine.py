@@ -0,0 +1,452 @@
+"""Luật chơi của bản game có level, tách khỏi Tk.
+
+Engine chạy trên đồng hồ ảo tính bằng mili giây: view Tk truyền vào thời
+gian thật, còn bộ mô phỏng tự sinh thời gian nên có thể chạy nhanh hơn
+thời gian thực hàng nghìn lần.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from cong_duc.spatial import Target, TargetField
+
+if TYPE_CHECKING:
+    from cong_duc.events import EventStream
+
+# Kết quả của một lần tap
+TAP_IGNORED = 0
+TAP_MISS = 1
+TAP_HIT = 2
+TAP_LEVEL_UP = 3
+TAP_GAME_OVER = 4
+
+# Cờ trả về từ advance()
+TICK_COUNTDOWN = 1
+TICK_FISH_MOVED = 2
+TICK_LEVEL_UP = 4
+TICK_GAME_OVER = 8
+
+# Loại sự kiện gửi tới luồng phân tích (xem cong_duc.events)
+EV_LEVEL_START = 1
+EV_HIT = 2
+EV_MISS = 3
+EV_LEVEL_UP = 4
+EV_GAME_OVER = 5
+
+# Cách Mỏ đổi chỗ mỗi nhịp: nhảy tức thì, hoặc lướt tới điểm mới trong suốt nhịp
+MOTION_TELEPORT = 0
+MOTION_GLIDE = 1
+
+COUNTDOWN_MS = 1000
+MISS_PENALTY_S = 2
+COMBO_BONUS_EVERY = 5
+
+MIN_FIELD_W = 760
+MIN_FIELD_H = 360
+
+
+class LevelRules:
+    """Đường cong độ khó mặc định; lớp con có thể ghi đè từng hàm."""
+
+    # Luật đổi theo người chơi (không suy lại được từ level): replay phải ghi
+    # lại luật của từng level.
+    adaptive = False
+
+    def get_level_target(self, level: int) -> int:
+        return 6 + level * 3
+
+    def get_level_time(self, level: int) -> int:
+        return max(10, 20 - level // 2)
+
+    def get_move_interval_ms(self, level: int) -> int:
+        return max(260, 900 - level * 60)
+
+
+class GameEngine:
+    def __init__(
+        self,
+        rules: LevelRules | None = None,
+        rng: random.Random | None = None,
+        width: int = 980,
+        height: int = 440,
+        field: TargetField | None = None,
+        events: EventStream | None = None,
+        motion: int = MOTION_TELEPORT,
+    ) -> None:
+        self.rules = rules or LevelRules()
+        # Luồng sự kiện phân tích (tuỳ chọn); engine của replay/mô phỏng không có.
+        self.events = events
+        self.rng = rng or random.Random()
+        # Chế độ nhiều mục tiêu: Mỏ chính là field.main, mồi nhử tính là trượt.
+        self.field = field
+        self.last_target: Target | None = None
+        # Lướt chỉ áp cho một Mỏ; chỉ mục lưới của field cần vị trí cố định.
+        self.motion = motion if field is None else MOTION_TELEPORT
+
+        # Game state
+        self.level = 1
+        self.total_merit = 0
+        self.level_score = 0
+        self.target_score = 0
+        self.time_left = 0
+        self.level_time = 0
+        self.combo = 0
+        self.game_running = False
+        self.last_gain = 0
+
+        # Fish position/bounds
+        self.width = width
+        self.height = height
+        self.cx = width // 2
+        self.cy = height // 2 + 8
+        self.body_rx = 170
+        self.body_ry = 86
+        self._update_spawn_box()
+        # Chặng lướt hiện tại: từ (x0, y0) lúc leg_start tới (x1, y1) sau leg_ms.
+        self._hold(0)
+
+        # Đồng hồ ảo
+        self.now = 0
+        self.move_interval_ms = self.rules.get_move_interval_ms(self.level)
+        self._next_tick_at = 0
+        self._next_move_at = 0
+
+    # ------------------------ Game flow ------------------------
+    def start_game(self, now: int, seed: int | None = None) -> None:
+        # Có seed thì cả ván (vị trí Mỏ, mục tiêu) tái lập được từ replay.
+        if seed is not None:
+            self.rng.seed(seed)
+        self.level = 1
+        self.total_merit = 0
+        self.now = now
+        self.start_level(now)
+
+    def start_level(self, now: int) -> None:
+        self.level_score = 0
+        self.combo = 0
+        self.target_score = self.rules.get_level_target(self.level)
+        self.time_left = self.level_time = self.rules.get_level_time(self.level)
+        self.move_interval_ms = self.rules.get_move_interval_ms(self.level)
+        self.game_running = True
+        self.random_reposition_fish()
+        self._hold(now)
+        # Countdown và di chuyển đều chạy ngay ở lần advance() đầu tiên,
+        # giống schedule_countdown/schedule_fish_movement gọi trực tiếp.
+        self._next_tick_at = now
+        self._next_move_at = now
+        if self.events is not None:
+            self.events.emit(EV_LEVEL_START, now, self.level, 0, self.time_left, self.target_score)
+
+    def advance_level(self, now: int) -> None:
+        if self.events is not None:
+            self.events.emit(EV_LEVEL_UP, now, self.level, self.combo, self.time_left, self.level_score)
+        self.level += 1
+        self.start_level(now)
+
+    def handle_time_up(self, now: int) -> int:
+        if self.level_score >= self.target_score:
+            self.advance_level(now)
+            return TICK_LEVEL_UP
+
+        self.game_running = False
+        if self.events is not None:
+            self.events.emit(EV_GAME_OVER, now, self.level, self.combo, 0, self.level_score)
+        return TICK_GAME_OVER
+
+    @property
+    def last_move_at(self) -> int:
+        """Mốc (ms) Mỏ nhảy chỗ lần gần nhất."""
+        return self._next_move_at - self.move_interval_ms
+
+    def next_deadline(self) -> int | None:
+        """Thời điểm (ms) engine cần được advance() tiếp theo."""
+        if not self.game_running:
+            return None
+        return min(self._next_tick_at, self._next_move_at)
+
+    def advance(self, now: int) -> int:
+        """Chạy các timer tới thời điểm ``now``; trả về tổ hợp cờ TICK_*."""
+        flags = 0
+        while self.game_running:
+            tick_at = self._next_tick_at
+            move_at = self._next_move_at
+            if tick_at <= move_at:
+                if tick_at > now:
+                    break
+                self.now = tick_at
+                if self.time_left <= 0:
+                    flags |= self.handle_time_up(tick_at)
+                    continue
+                self.time_left -= 1
+                self._next_tick_at = tick_at + COUNTDOWN_MS
+                flags |= TICK_COUNTDOWN
+            else:
+                if move_at > now:
+                    break
+                self.now = move_at
+                if self.motion:
+                    self._start_leg(move_at)
+                else:
+                    self.random_reposition_fish()
+                self._next_move_at = move_at + self.move_interval_ms
+                flags |= TICK_FISH_MOVED
+        if now > self.now:
+            self.now = now
+        if self.motion:
+            self.cx, self.cy = self.position_at(self.now)
+        return flags
+
+    # ------------------------ Fish ------------------------
+    def set_field_size(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._update_spawn_box()
+
+    def _update_spawn_box(self) -> None:
+        # Vùng hợp lệ cho tâm Mỏ, tính một lần mỗi khi đổi kích thước.
+        w = max(MIN_FIELD_W, self.width)
+        h = max(MIN_FIELD_H, self.height)
+        self._min_x = self.body_rx + 30
+        self._min_y = self.body_ry + 30
+        self._span_x = max(0, w - 2 * self._min_x) + 1
+        self._span_y = max(0, h - 2 * self._min_y) + 1
+
+    def center_fish(self) -> None:
+        self.cx = self.width // 2
+        self.cy = self.height // 2 + 8
+        self._hold(self.now)
+        if self.field is not None:
+            self.field.grid.move(self.field.main, self.cx, self.cy)
+
+    def random_reposition_fish(self) -> None:
+        # Tương đương randint(margin, max(margin, w - margin)) nhưng rẻ hơn
+        # nhiều, vì hàm này chạy ở mỗi lần Mỏ di chuyển khi mô phỏng.
+        if self.field is not None:
+            field = self.field
+            field.scatter(self.rng, max(MIN_FIELD_W, self.width), max(MIN_FIELD_H, self.height))
+            self.cx = field.main.cx
+            self.cy = field.main.cy
+            return
+
+        rand = self.rng.random
+        self.cx = self._min_x + int(rand() * self._span_x)
+        self.cy = self._min_y + int(rand() * self._span_y)
+
+    def _hold(self, now: int) -> None:
+        # Chặng đứng yên tại vị trí hiện tại.
+        self._x0 = self._x1 = self.cx
+        self._y0 = self._y1 = self.cy
+        self._leg_start = now
+        self._leg_ms = 1
+
+    def _start_leg(self, now: int) -> None:
+        # Điểm đến rút từ rng y như khi nhảy chỗ, nên cùng seed cho cùng đường đi.
+        self._x0, self._y0 = self.position_at(now)
+        self.random_reposition_fish()
+        self._x1, self._y1 = self.cx, self.cy
+        self.cx, self.cy = self._x0, self._y0
+        self._leg_start = now
+        self._leg_ms = max(1, self.move_interval_ms)
+
+    def position_at(self, t: float) -> tuple[float, float]:
+        """Tâm Mỏ tại thời điểm ``t`` (ms); chỉ khác (cx, cy) khi đang lướt."""
+        if not self.motion:
+            return self.cx, self.cy
+        u = (t - self._leg_start) / self._leg_ms
+        if u >= 1.0:
+            return self._x1, self._y1
+        if u <= 0.0:
+            return self._x0, self._y0
+        # Smoothstep: tăng tốc rồi hãm lại, vận tốc bằng 0 ở hai đầu chặng.
+        s = u * u * (3.0 - 2.0 * u)
+        return self._x0 + (self._x1 - self._x0) * s, self._y0 + (self._y1 - self._y0) * s
+
+    # ------------------------ Interaction ------------------------
+    def is_hit(self, x: float, y: float) -> bool:
+        if self.field is not None:
+            # Tap thuộc về mục tiêu trên cùng; trúng mồi nhử vẫn là trượt.
+            target = self.field.hit_test(x, y)
+            self.last_target = target
+            return target is not None and not target.decoy
+
+        # Kiểm tra điểm có nằm trong ellipse thân Mỏ hay không.
+        dx = (x - self.cx) / self.body_rx
+        dy = (y - self.cy) / self.body_ry
+        return dx * dx + dy * dy <= 1.0
+
+    def tap(self, x: float, y: float, now: int) -> int:
+        """Xử lý một lần tap tại thời điểm ``now``; trả về TAP_*."""
+        # Tap đến trễ hơn timer đã chạy thì được chấm tại self.now, để thời
+        # gian không chạy lùi và replay ghi lại đúng mốc đã dùng.
+        if now < self.now:
+            now = self.now
+        self.advance(now)
+        if not self.game_running:
+            return TAP_IGNORED
+        if self.is_hit(x, y):
+            return self.handle_hit(now)
+        return self.handle_miss(now)
+
+    def handle_hit(self, now: int) -> int:
+        self.combo += 1
+        gain = 2 if self.combo % COMBO_BONUS_EVERY == 0 else 1
+        self.last_gain = gain
+
+        self.level_score += gain
+        self.total_merit += gain
+        if self.events is not None:
+            self.events.emit(EV_HIT, now, self.level, self.combo, self.time_left, gain)
+
+        if self.level_score >= self.target_score:
+            self.advance_level(now)
+            return TAP_LEVEL_UP
+        return TAP_HIT
+
+    def handle_miss(self, now: int) -> int:
+        broken = self.combo
+        lost = min(self.time_left, MISS_PENALTY_S)
+        self.combo = 0
+        self.last_gain = 0
+        self.time_left -= lost
+        if self.events is not None:
+            self.events.emit(EV_MISS, now, self.level, broken, self.time_left, lost)
+
+        if self.time_left <= 0:
+            if self.handle_time_up(now) == TICK_GAME_OVER:
+                return TAP_GAME_OVER
+            return TAP_LEVEL_UP
+        return TAP_MISS
+
+    # ------------------------ Simulation ------------------------
+    def run(self, events: Iterable[tuple[int, float, float]]) -> int:
+        """Đưa cả luồng tap ``(t_ms, x, y)`` qua engine; trả về số tap trúng.
+
+        Tương đương gọi tap() cho từng sự kiện, nhưng giữ trạng thái nóng
+        trong biến cục bộ để mô phỏng được hàng triệu tap mỗi giây.
+        """
+        hits = 0
+        t = self.now
+        # Nhiều mục tiêu, có luồng sự kiện hoặc Mỏ lướt: đi qua tap() để mọi mốc
+        # được ghi và vị trí được nội suy đúng thời điểm từng tap.
+        if self.field is not None or self.events is not None or self.motion:
+            for t, x, y in events:
+                if self.tap(x, y, t) != TAP_IGNORED and self.last_gain:
+                    hits += 1
+            return hits
+
+        deadline = self.next_deadline()
+        if deadline is None:
+            return 0
+        cx = self.cx
+        cy = self.cy
+        inv_rx = 1.0 / self.body_rx
+        inv_ry = 1.0 / self.body_ry
+        combo = self.combo
+        level_score = self.level_score
+        target = self.target_score
+        merit = self.total_merit
+
+        for t, x, y in events:
+            if t >= deadline:
+                self.combo = combo
+                self.level_score = level_score
+                self.total_merit = merit
+                self.advance(t)
+                deadline = self.next_deadline()
+                if deadline is None:
+                    break
+                cx = self.cx
+                cy = self.cy
+                combo = self.combo
+                level_score = self.level_score
+                target = self.target_score
+
+            dx = (x - cx) * inv_rx
+            dy = (y - cy) * inv_ry
+            if dx * dx + dy * dy <= 1.0:
+                hits += 1
+                combo += 1
+                gain = 2 if combo % COMBO_BONUS_EVERY == 0 else 1
+                level_score += gain
+                merit += gain
+                if level_score >= target:
+                    self.combo = combo
+                    self.level_score = level_score
+                    self.total_merit = merit
+                    self.last_gain = gain
+                    self.advance_level(t)
+                    deadline = self.next_deadline()
+                    cx = self.cx
+                    cy = self.cy
+                    combo = 0
+                    level_score = 0
+                    target = self.target_score
+            else:
+                combo = 0
+                time_left = self.time_left - MISS_PENALTY_S
+                if time_left > 0:
+                    self.time_left = time_left
+                    continue
+                self.time_left = 0
+                self.combo = 0
+                self.level_score = level_score
+                self.total_merit = merit
+                self.handle_time_up(t)
+                level_score = self.level_score
+                deadline = self.next_deadline()
+                if deadline is None:
+                    break
+                cx = self.cx
+                cy = self.cy
+                target = self.target_score
+
+        self.combo = combo
+        self.level_score = level_score
+        self.total_merit = merit
+        if t > self.now:
+            self.now = t
+        return hits
+
+
+def simulated_player(
+    engine: GameEngine,
+    rng: random.Random,
+    taps_per_second: float = 6.0,
+    hit_rate: float = 0.85,
+    reaction_ms: int = 180,
+    start_ms: int = 0,
+) -> Iterator[tuple[int, float, float]]:
+    """Sinh luồng tap của một người chơi giả lập cho GameEngine.run().
+
+    Người chơi chỉ cập nhật vị trí Mỏ mình thấy sau mỗi ``reaction_ms``,
+    nên khi Mỏ vừa nhảy chỗ thì tap vẫn rơi vào chỗ cũ và bị tính trượt.
+    """
+    interval = 1000.0 / taps_per_second
+    t = float(start_ms)
+    seen_x, seen_y, seen_at = engine.cx, engine.cy, start_ms
+    while engine.game_running:
+        t += interval
+        now = int(t)
+        if now - seen_at >= reaction_ms:
+            seen_x, seen_y, seen_at = engine.cx, engine.cy, now
+        if rng.random() < hit_rate:
+            yield now, seen_x, seen_y
+        else:
+            yield now, seen_x + engine.body_rx * 2, seen_y
+
+
+def simulate_session(
+    seed: int,
+    taps_per_second: float = 6.0,
+    hit_rate: float = 0.85,
+    reaction_ms: int = 180,
+    rules: LevelRules | None = None,
+) -> GameEngine:
+    """Chơi một ván hoàn chỉnh bằng người chơi giả lập; trả về engine cuối ván."""
+    rng = random.Random(seed)
+    engine = GameEngine(rules=rules, rng=rng)
+    engine.start_game(0)
+    engine.run(simulated_player(engine, rng, taps_per_second, hit_rate, reaction_ms))
+    return engine
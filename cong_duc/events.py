@@ -0,0 +1,215 @@
+"""Luồng sự kiện phân tích của mỗi phiên chơi: ghi nhanh, xả xuống đĩa theo lô.
+
+Engine gọi ``emit`` ở các mốc của ván (vào level, hit, trượt, qua level, thua).
+``emit`` chỉ đặt một tuple vào ``EventRing``, một hàng đợi vòng dựng sẵn
+một-ghi-một-đọc không khoá (luồng Tk ghi, luồng nền đọc; mỗi bên chỉ tăng chỉ
+số của mình). Đầy thì bỏ sự kiện và đếm ``dropped`` chứ không bao giờ chặn UI.
+Luồng nền xả mỗi ``flush_every`` sự kiện hoặc ``flush_interval_ms`` vào một
+file mỗi phiên: Parquet (mỗi lô một row group) nếu có pyarrow, không thì CSV
+gọn chỉ có số nguyên. File Parquet chỉ đọc được khi phiên đóng đúng cách;
+CSV thì đọc được đến lô cuối đã xả.
+
+Mỗi dòng: ``t_ms, kind, level, combo, time_left, value`` với ``value`` tuỳ
+loại: mục tiêu điểm (vào level), công đức được cộng (hit), số giây bị trừ
+(trượt, ``combo`` là chuỗi vừa đứt), điểm level (qua level, thua). Phân
+tích offline: ``python -m cong_duc.analytics``.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import threading
+import time
+from pathlib import Path
+
+from cong_duc.engine import EV_GAME_OVER, EV_HIT, EV_LEVEL_START, EV_LEVEL_UP, EV_MISS
+from cong_duc.ledger import default_data_dir
+
+KIND_NAMES = {
+    EV_LEVEL_START: "level_start",
+    EV_HIT: "hit",
+    EV_MISS: "miss",
+    EV_LEVEL_UP: "level_up",
+    EV_GAME_OVER: "game_over",
+}
+COLUMNS = ("t_ms", "kind", "level", "combo", "time_left", "value")
+
+
+def default_events_dir() -> Path:
+    return default_data_dir() / "events"
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class EventRing:
+    """Hàng đợi vòng một-ghi-một-đọc: ``push`` ở luồng Tk, ``drain`` ở luồng nền.
+
+    Không cần khoá vì mỗi chỉ số chỉ do một luồng ghi, và ô được ghi xong
+    trước khi ``_head`` tăng (một phép gán dưới GIL), nên bên đọc không bao
+    giờ thấy ô dở dang.
+    """
+
+    def __init__(self, capacity: int = 1 << 16) -> None:
+        self.capacity = 1 << max(0, capacity - 1).bit_length()
+        self._mask = self.capacity - 1
+        self._slots: list[tuple[int, ...] | None] = [None] * self.capacity
+        self._head = 0
+        self._tail = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    @property
+    def pushed(self) -> int:
+        return self._head
+
+    def push(self, event: tuple[int, ...]) -> int:
+        """Thêm một sự kiện; trả về số sự kiện đang chờ (0 nếu đầy và bị bỏ)."""
+        head = self._head
+        pending = head - self._tail
+        if pending >= self.capacity:
+            self.dropped += 1
+            return 0
+        self._slots[head & self._mask] = event
+        self._head = head + 1
+        return pending + 1
+
+    def drain(self) -> list[tuple[int, ...]]:
+        tail = self._tail
+        head = self._head
+        slots = self._slots
+        mask = self._mask
+        batch = []
+        for i in range(tail, head):
+            # Trả ô về None: ring chỉ giữ sự kiện đang chờ, không giữ tuple cũ.
+            batch.append(slots[i & mask])
+            slots[i & mask] = None
+        self._tail = head
+        return batch  # type: ignore[return-value]
+
+
+class _CsvSink:
+    suffix = ".csv"
+
+    def __init__(self, path: Path) -> None:
+        self._file = open(path, "w", newline="", encoding="ascii")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write(self, batch: list[tuple[int, ...]]) -> None:
+        self._writer.writerows(batch)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetSink:
+    suffix = ".parquet"
+
+    def __init__(self, path: Path) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema([(name, pa.int64()) for name in COLUMNS])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, batch: list[tuple[int, ...]]) -> None:
+        columns = [self._pa.array(column, type=self._pa.int64()) for column in zip(*batch)]
+        self._writer.write_table(self._pa.Table.from_arrays(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class EventStream:
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        capacity: int = 1 << 16,
+        flush_every: int = 4096,
+        flush_interval_ms: int = 1000,
+        fmt: str = "auto",
+        session: int | None = None,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else default_events_dir()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self.flush_interval_ms = flush_interval_ms
+        if fmt == "auto":
+            fmt = "parquet" if parquet_available() else "csv"
+        self._sink_class = _ParquetSink if fmt == "parquet" else _CsvSink
+        # Mỗi phiên một file, tên theo thời điểm mở (ms); file chỉ được tạo
+        # khi có lô đầu tiên nên mở game rồi tắt không để lại file rỗng.
+        self.session = session if session is not None else int(time.time() * 1000)
+        self.path = self.directory / f"{self.session}{self._sink_class.suffix}"
+        self._sink: _CsvSink | _ParquetSink | None = None
+        self.ring = EventRing(capacity)
+
+        # Thống kê cho benchmark.
+        self.written = 0
+        self.batches_written = 0
+
+        self._wake = threading.Event()
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run_writer, name="cong-duc-events", daemon=True)
+        self._writer.start()
+
+    @property
+    def emitted(self) -> int:
+        return self.ring.pushed
+
+    # ------------------------ Hot path ------------------------
+    def emit(self, kind: int, t_ms: int, level: int, combo: int, time_left: int, value: int) -> None:
+        if self.ring.push((t_ms, kind, level, combo, time_left, value)) >= self.flush_every:
+            self._wake.set()
+
+    # ------------------------ Writer ------------------------
+    def _run_writer(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        while not self._closed:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        # Chỉ một bên đọc ring tại một thời điểm (luồng nền hoặc close).
+        with self._io_lock:
+            batch = self.ring.drain()
+            if not batch:
+                return
+            if self._sink is None:
+                self._sink = self._sink_class(self.path)
+            self._sink.write(batch)
+            self.written += len(batch)
+            self.batches_written += 1
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=2.0)
+        self.flush()
+        with self._io_lock:
+            if self._sink is not None:
+                self._sink.close()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "path": str(self.path),
+            "emitted": self.emitted,
+            "written": self.written,
+            "dropped": self.ring.dropped,
+            "batches": self.batches_written,
+        }
@@ -0,0 +1,35 @@
+"""Cache ``tkfont.Font`` theo spec kiểu ``("Segoe UI", 11, "bold")``.
+
+Truyền tuple font thẳng vào widget/item canvas bắt Tk phân giải lại họ font
+mỗi lần dùng; trên Linux, họ không có sẵn (Segoe UI, Consolas) phải dò
+fontconfig để tìm font thay thế nên rất chậm. Mỗi spec ở đây chỉ dựng một
+``tkfont.Font`` (một named font của Tk), mọi chỗ dùng chung nó.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import font as tkfont
+
+
+class FontCache:
+    def __init__(self, root: tk.Misc) -> None:
+        self.root = root
+        self._fonts: dict[tuple, tkfont.Font] = {}
+
+    def get(self, spec: tuple) -> tkfont.Font:
+        font = self._fonts.get(spec)
+        if font is None:
+            family, size, *style = spec
+            font = tkfont.Font(
+                root=self.root,
+                family=family,
+                size=size,
+                weight="bold" if "bold" in style else "normal",
+                slant="italic" if "italic" in style else "roman",
+            )
+            self._fonts[spec] = font
+        return font
+
+    def __len__(self) -> int:
+        return len(self._fonts)
@@ -0,0 +1,139 @@
+"""Vòng glow của Mỏ với mọi trạng thái màu dựng sẵn trên canvas.
+
+Thay vì mỗi nhịp ``itemconfig`` lại màu từng vòng, mỗi pha của vòng màu
+(và mỗi màu "bùng sáng" khi hit) được tạo sẵn thành một frame: một nhóm vòng
+chồng khít lên nhau, có tag riêng. Đổi frame chỉ là một lệnh ``tag_raise``
+đưa nhóm đó lên trên các frame còn lại. Khi cửa sổ bị thu nhỏ, bị che hoặc
+mất focus thì task animation bị huỷ hẳn, không còn chạy nền.
+"""
+
+from __future__ import annotations
+
+import random
+import tkinter as tk
+from typing import Sequence
+
+from cong_duc.scheduler import FrameScheduler
+
+
+class GlowRings:
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        scheduler: FrameScheduler,
+        palette: Sequence[str],
+        interval_ms: int = 170,
+        tag: str = "glow",
+        rng: random.Random | None = None,
+    ) -> None:
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.palette = list(palette)
+        self.interval_ms = interval_ms
+        self.tag = tag
+        self.rng = rng or random.Random()
+        self.phase = 0
+        self.paused = False
+        self._built = False
+        self._root: tk.Tk | None = None
+
+        # Thống kê cho benchmark: số lần đổi frame.
+        self.switches = 0
+
+    def _frame_tag(self, index: int) -> str:
+        # Frame 0..n-1: các pha xoay vòng; n..2n-1: bùng sáng một màu.
+        return f"{self.tag}:{index}"
+
+    def build(
+        self,
+        cx: float,
+        cy: float,
+        rx: float,
+        ry: float,
+        widths: Sequence[float],
+        step: float = 7,
+        tags: str | tuple[str, ...] = (),
+    ) -> list[int]:
+        """Tạo mọi frame quanh tâm (cx, cy); trả về id các item đã tạo."""
+        extra = (tags,) if isinstance(tags, str) else tuple(tags)
+        palette = self.palette
+        n = len(palette)
+        items = []
+        for frame in range(2 * n):
+            frame_tags = (self.tag, self._frame_tag(frame), *extra)
+            for i, width in enumerate(widths):
+                color = palette[(frame + i) % n] if frame < n else palette[frame - n]
+                items.append(
+                    self.canvas.create_oval(
+                        cx - rx - i * step,
+                        cy - ry - i * step,
+                        cx + rx + i * step,
+                        cy + ry + i * step,
+                        outline=color,
+                        width=width,
+                        tags=frame_tags,
+                    )
+                )
+        self._built = True
+        self.show(self.phase)
+        return items
+
+    def show(self, frame: int) -> None:
+        if self._built:
+            self.canvas.tag_raise(self._frame_tag(frame), self.tag)
+            self.switches += 1
+
+    def advance(self) -> None:
+        self.phase = (self.phase + 1) % len(self.palette)
+        self.show(self.phase)
+
+    def flash(self) -> None:
+        """Bùng sáng một màu ngẫu nhiên; nhịp glow kế tiếp tự trả về pha thường."""
+        if not self.interval_ms:
+            # Glow đang đứng yên: không còn nhịp nào để trả về pha thường.
+            return
+        self.show(len(self.palette) + self.rng.randrange(len(self.palette)))
+
+    # ------------------------ Lifecycle ------------------------
+    def start(self, delay_ms: int | None = 0) -> None:
+        self.paused = False
+        if self.interval_ms:
+            self.scheduler.every(self.tag, self.interval_ms, self.advance, delay_ms=delay_ms)
+        else:
+            self.scheduler.cancel(self.tag)
+
+    def set_interval(self, interval_ms: int) -> None:
+        """Đổi nhịp đổi màu; 0 = đứng yên ở pha hiện tại (chất lượng thấp)."""
+        if interval_ms == self.interval_ms:
+            return
+        self.interval_ms = interval_ms
+        if not self.paused:
+            self.start(delay_ms=None)
+
+    def pause(self) -> None:
+        self.paused = True
+        self.scheduler.cancel(self.tag)
+
+    def bind_visibility(self, root: tk.Tk) -> None:
+        """Tự dừng khi cửa sổ bị unmap/thu nhỏ hoặc mất focus, chạy lại khi trở về."""
+        self._root = root
+        for sequence in ("<Map>", "<Unmap>", "<FocusIn>", "<FocusOut>"):
+            root.bind(sequence, self._on_visibility_event, add="+")
+
+    def _on_visibility_event(self, _event: tk.Event | None = None) -> None:
+        # Sự kiện focus lan từ mọi widget con (đổi focus giữa canvas và nút
+        # cũng sinh FocusOut); kiểm tra lại trạng thái thật ở frame sau.
+        check = f"{self.tag}_visibility"
+        if not self.scheduler.is_scheduled(check):
+            self.scheduler.once(check, 0, self._check_visibility)
+
+    def _check_visibility(self) -> None:
+        root = self._root
+        try:
+            visible = bool(root.winfo_ismapped()) and root.state() != "iconic" and root.focus_displayof() is not None
+        except (tk.TclError, KeyError):
+            visible = True
+        if visible and self.paused:
+            self.start()
+        elif not visible and not self.paused:
+            self.pause()
@@ -0,0 +1,96 @@
+"""HUD chỉ đẩy chữ xuống Tk khi chuỗi hiển thị thực sự thay đổi.
+
+Mỗi lần ``config(text=...)`` trên Label là một vòng geometry/redraw của Tk.
+Các lớp dưới đây ghi nhận giá trị mới, đánh dấu bẩn rồi gộp lại thành tối đa
+một lần cập nhật widget mỗi frame (task của FrameScheduler).
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from abc import ABC, abstractmethod
+
+from cong_duc.scheduler import FrameScheduler
+
+
+class _BatchedLabel(ABC):
+    def __init__(self, label: tk.Label, scheduler: FrameScheduler, task_name: str) -> None:
+        self.label = label
+        self.scheduler = scheduler
+        self.task_name = task_name
+        self._shown: str | None = None
+
+        # requests: số lần được yêu cầu cập nhật; pushes: số lần thật sự config.
+        self.requests = 0
+        self.pushes = 0
+
+    @property
+    def skipped(self) -> int:
+        return self.requests - self.pushes
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Đẩy giá trị đang chờ xuống widget (task cuối frame)."""
+
+    def _schedule_flush(self) -> None:
+        if not self.scheduler.is_scheduled(self.task_name):
+            self.scheduler.once(self.task_name, 0, self.flush)
+
+    def _push(self, text: str) -> None:
+        if text == self._shown:
+            return
+        self.label.config(text=text)
+        self._shown = text
+        self.pushes += 1
+
+
+class LabelText(_BatchedLabel):
+    """Chữ của một Label, chỉ ``config`` khi khác với chữ đang hiển thị."""
+
+    def __init__(self, label: tk.Label, scheduler: FrameScheduler, task_name: str) -> None:
+        super().__init__(label, scheduler, task_name)
+        self._pending: str | None = None
+
+    def set(self, text: str) -> None:
+        self.requests += 1
+        self._pending = text
+        self._schedule_flush()
+
+    def flush(self) -> None:
+        text = self._pending
+        self._pending = None
+        if text is not None:
+            self._push(text)
+
+
+class HudModel(_BatchedLabel):
+    """Dòng thông tin nhiều trường; chỉ render lại khi có trường đổi giá trị."""
+
+    def __init__(
+        self,
+        label: tk.Label,
+        scheduler: FrameScheduler,
+        template: str,
+        task_name: str = "hud",
+        **fields: object,
+    ) -> None:
+        super().__init__(label, scheduler, task_name)
+        self.template = template
+        self.fields = dict(fields)
+        self.dirty: set[str] = set()
+
+    def update(self, **fields: object) -> None:
+        self.requests += 1
+        current = self.fields
+        for name, value in fields.items():
+            if current.get(name) != value:
+                current[name] = value
+                self.dirty.add(name)
+        if self.dirty:
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        if not self.dirty:
+            return
+        self.dirty.clear()
+        self._push(self.template.format(**self.fields))
@@ -0,0 +1,53 @@
+"""Hàng đợi tap: ghi lại tap thô rồi xử lý cả lô một lần mỗi frame.
+
+Handler ``<Button-1>`` chỉ còn việc ghi ``(x, y, t_ms)``; logic game, HUD và
+hiệu ứng chạy trong task "input" của FrameScheduler, nên 50+ tap/giây cũng
+chỉ tốn một lần cập nhật giao diện mỗi frame.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable
+
+from cong_duc.scheduler import FrameScheduler
+
+Tap = tuple[int, int, int]
+
+
+class TapQueue:
+    def __init__(
+        self,
+        scheduler: FrameScheduler,
+        handler: Callable[[list[Tap]], object],
+        task_name: str = "input",
+    ) -> None:
+        self.scheduler = scheduler
+        self.handler = handler
+        self.task_name = task_name
+        self._pending: list[Tap] = []
+
+        # Thống kê độ trễ từ lúc nhận tap tới lúc được tính điểm.
+        self.latencies_ms: deque[int] = deque(maxlen=4096)
+        self.batches = 0
+        self.max_batch = 0
+
+    def push(self, x: int, y: int, t_ms: int) -> None:
+        self._pending.append((x, y, t_ms))
+        if len(self._pending) == 1:
+            self.scheduler.once(self.task_name, 0, self.flush)
+
+    def flush(self) -> None:
+        batch = self._pending
+        if not batch:
+            return
+        self._pending = []
+        self.handler(batch)
+
+        now = self.scheduler.now()
+        self.latencies_ms.extend(now - t for _, _, t in batch)
+        self.batches += 1
+        self.max_batch = max(self.max_batch, len(batch))
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,110 @@
+"""Sổ theo dõi vòng đời item canvas: đếm item còn sống/đã tạo và chặn trần.
+
+``CanvasItemRegistry.attach()`` bọc các hàm ``create_*`` và ``delete`` ngay
+trên instance canvas, nên mọi chỗ vẽ (Mỏ, glow, pool chữ bay, overlay...) đều
+được ghi sổ mà không phải sửa. Mỗi item nhớ nhãn của nó (tag đầu tiên, không
+có tag thì là loại item) để khi rò rỉ biết ngay nhóm nào đang phình ra. Vượt
+``cap`` item còn sống thì ném ``CanvasItemLimitError`` thay vì để canvas và
+bộ nhớ lớn dần không giới hạn.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from collections import Counter
+from typing import Callable
+
+DEFAULT_CAP = 2000
+
+_CREATE_KINDS = ("arc", "bitmap", "image", "line", "oval", "polygon", "rectangle", "text", "window")
+
+
+class CanvasItemLimitError(RuntimeError):
+    pass
+
+
+class CanvasItemRegistry:
+    def __init__(self, canvas: tk.Canvas, cap: int = DEFAULT_CAP) -> None:
+        self.canvas = canvas
+        self.cap = cap
+        # id -> nhãn (tag đầu tiên hoặc loại item).
+        self.live: dict[int, str] = {}
+        self.total_created = 0
+        self.total_deleted = 0
+        self.peak = 0
+        self._originals: dict[str, Callable[..., object]] = {}
+
+    @property
+    def live_count(self) -> int:
+        return len(self.live)
+
+    def attach(self) -> CanvasItemRegistry:
+        canvas = self.canvas
+        for kind in _CREATE_KINDS:
+            name = f"create_{kind}"
+            self._originals[name] = getattr(canvas, name)
+            setattr(canvas, name, self._wrap_create(kind, self._originals[name]))
+        self._originals["delete"] = canvas.delete
+        canvas.delete = self._delete
+        # Item tạo trước khi gắn (nếu có) cũng được ghi sổ.
+        for item in canvas.find_all():
+            self.live.setdefault(item, "untracked")
+        return self
+
+    def detach(self) -> None:
+        for name in self._originals:
+            # Xoá thuộc tính trên instance để method của lớp hiện lại.
+            self.canvas.__dict__.pop(name, None)
+        self._originals.clear()
+
+    # ------------------------ Wrappers ------------------------
+    def _wrap_create(self, kind: str, create: Callable[..., int]) -> Callable[..., int]:
+        live = self.live
+
+        def tracked(*args: object, **options: object) -> int:
+            if len(live) >= self.cap:
+                raise CanvasItemLimitError(
+                    f"canvas đã có {len(live)} item (trần {self.cap}); nhiều nhất: {self.summary(5)}"
+                )
+            item = create(*args, **options)
+            tags = options.get("tags")
+            if isinstance(tags, str):
+                label = tags
+            elif tags:
+                label = tags[0]
+            else:
+                label = kind
+            live[item] = label
+            self.total_created += 1
+            if len(live) > self.peak:
+                self.peak = len(live)
+            return item
+
+        return tracked
+
+    def _delete(self, *tags_or_ids: object) -> None:
+        live = self.live
+        find_withtag = self.canvas.find_withtag
+        for tag_or_id in tags_or_ids:
+            # Xoá theo id là trường hợp thường gặp, không cần hỏi Tk.
+            items = (tag_or_id,) if isinstance(tag_or_id, int) else find_withtag(tag_or_id)
+            for item in items:
+                if live.pop(item, None) is not None:
+                    self.total_deleted += 1
+        self._originals["delete"](*tags_or_ids)
+
+    # ------------------------ Reports ------------------------
+    def counts(self) -> Counter[str]:
+        return Counter(self.live.values())
+
+    def summary(self, top: int = 5) -> str:
+        return ", ".join(f"{label} x{count}" for label, count in self.counts().most_common(top))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "live": len(self.live),
+            "peak": self.peak,
+            "created": self.total_created,
+            "deleted": self.total_deleted,
+            "cap": self.cap,
+        }
@@ -0,0 +1,82 @@
+"""Kích thước canvas lấy từ ``<Configure>``, bố cục lại tối đa một lần mỗi frame.
+
+Kéo mép cửa sổ sinh hàng chục ``<Configure>`` mỗi giây, thường vài cái giữa
+hai frame. ``CanvasLayout`` chỉ ghi lại kích thước mới nhất của sự kiện rồi
+hẹn task "layout" ở frame kế tiếp; task đó báo cho các listener đúng một lần
+với (kích thước cũ, kích thước mới). Kích thước đã lưu đọc thẳng qua
+``width``/``height`` nên không còn ``winfo_width()``/``winfo_height()``,
+mỗi lệnh là một lượt hỏi Tk đồng bộ.
+
+Listener nên đặt lại item có sẵn (``canvas.move``/``canvas.scale`` theo tag)
+thay vì xoá rồi vẽ lại; ``fit_scale`` cho hệ số co giãn đều theo khung.
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Callable
+
+from cong_duc.scheduler import FrameScheduler
+
+LayoutListener = Callable[[int, int, int, int], object]
+
+
+def fit_scale(width: int, height: int, base_width: int, base_height: int, low: float, high: float) -> float:
+    """Hệ số co giãn đều để khung ``base`` vừa trong (width, height), kẹp trong [low, high]."""
+    return min(max(min(width / base_width, height / base_height), low), high)
+
+
+class CanvasLayout:
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        scheduler: FrameScheduler,
+        width: int,
+        height: int,
+        task_name: str = "layout",
+        debounce: bool = True,
+    ) -> None:
+        self.canvas = canvas
+        self.scheduler = scheduler
+        # Kích thước mặc định dùng tới khi có <Configure> đầu tiên.
+        self.width = width
+        self.height = height
+        self.task_name = task_name
+        # debounce=False: bố cục lại ngay ở mỗi sự kiện (để benchmark so sánh).
+        self.debounce = debounce
+        self._pending: tuple[int, int] | None = None
+        self._listeners: list[LayoutListener] = []
+
+        # Thống kê cho benchmark.
+        self.configure_events = 0
+        self.relayouts = 0
+
+    def attach(self) -> CanvasLayout:
+        self.canvas.bind("<Configure>", self.on_configure, add="+")
+        return self
+
+    def on_change(self, listener: LayoutListener) -> None:
+        """Đăng ký ``listener(old_w, old_h, width, height)``, gọi sau mỗi lần đổi kích thước."""
+        self._listeners.append(listener)
+
+    def on_configure(self, event: tk.Event) -> None:
+        self.configure_events += 1
+        # Widget chưa map có thể báo 0 hoặc 1: giữ kích thước đang có.
+        width = event.width if event.width > 1 else self.width
+        height = event.height if event.height > 1 else self.height
+        self._pending = (width, height)
+        if not self.debounce:
+            self.flush()
+        elif not self.scheduler.is_scheduled(self.task_name):
+            self.scheduler.once(self.task_name, 0, self.flush)
+
+    def flush(self) -> None:
+        pending = self._pending
+        self._pending = None
+        if pending is None or pending == (self.width, self.height):
+            return
+        old_width, old_height = self.width, self.height
+        self.width, self.height = pending
+        self.relayouts += 1
+        for listener in self._listeners:
+            listener(old_width, old_height, *pending)
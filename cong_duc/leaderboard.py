@@ -0,0 +1,252 @@
+"""Bảng xếp hạng cục bộ: lưu mọi ván trong SQLite, hỏi hạng trong O(log n).
+
+Mỗi ván kết thúc ghi một dòng (người chơi, tổng công đức, level đạt được).
+SQLite giữ dữ liệu và chỉ mục ``score DESC`` nên top-K chỉ đọc K dòng đầu
+của B-tree. Còn "tôi hạng mấy" thì SQL phải đếm mọi dòng điểm cao hơn, nên
+trong bộ nhớ có thêm một cây Fenwick đếm số ván theo từng mức điểm (một cây
+chung và một cây cho mỗi level): thêm ván, hỏi hạng và hỏi "điểm của hạng k"
+đều là O(log S) với S là điểm cao nhất. Cây được dựng lại từ SQLite bằng một
+câu ``GROUP BY`` khi mở.
+
+    python -m cong_duc.leaderboard --top 10
+    python -m cong_duc.leaderboard --level 5 --rank 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from cong_duc.ledger import default_data_dir
+
+DB_NAME = "leaderboard.sqlite3"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    t_ms INTEGER NOT NULL
+);
+"""
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id)",
+    "CREATE INDEX IF NOT EXISTS scores_by_level ON scores (level, score DESC, id)",
+)
+
+
+class Entry(NamedTuple):
+    rank: int
+    player: str
+    score: int
+    level: int
+    t_ms: int
+
+
+class ScoreTree:
+    """Cây Fenwick đếm số ván theo điểm (điểm nguyên, không âm).
+
+    Kích thước là luỹ thừa của 2 và tự gấp đôi khi gặp điểm lớn hơn: phần
+    mới của cây Fenwick chỉ có nút cuối mang tổng, nên gấp đôi là O(S) một
+    lần chứ không phải dựng lại.
+    """
+
+    def __init__(self, size: int = 1024) -> None:
+        self.size = 1 << max(0, size - 1).bit_length()
+        self.tree = [0] * (self.size + 1)
+        self.total = 0
+
+    def _grow(self, score: int) -> None:
+        while score >= self.size:
+            self.tree.extend([0] * self.size)
+            self.size *= 2
+            self.tree[self.size] = self.total
+
+    def add(self, score: int, count: int = 1) -> None:
+        if score < 0:
+            raise ValueError(f"điểm không được âm: {score}")
+        if score >= self.size:
+            self._grow(score)
+        tree = self.tree
+        i = score + 1
+        size = self.size
+        while i <= size:
+            tree[i] += count
+            i += i & -i
+        self.total += count
+
+    def count_below(self, score: int) -> int:
+        """Số ván có điểm nhỏ hơn ``score``."""
+        tree = self.tree
+        i = min(max(score, 0), self.size)
+        result = 0
+        while i:
+            result += tree[i]
+            i &= i - 1
+        return result
+
+    def count_above(self, score: int) -> int:
+        """Số ván có điểm lớn hơn ``score``."""
+        return self.total - self.count_below(score + 1)
+
+    def rank(self, score: int) -> int:
+        """Hạng (tính từ 1, đồng điểm đồng hạng) của một ván có ``score``."""
+        return self.count_above(score) + 1
+
+    def score_at(self, rank: int) -> int | None:
+        """Điểm của ván xếp thứ ``rank`` (tính từ 1), ``None`` nếu không có."""
+        if not 1 <= rank <= self.total:
+            return None
+        # Ván thứ rank từ trên xuống là ván thứ (total - rank + 1) từ dưới lên.
+        remaining = self.total - rank + 1
+        tree = self.tree
+        pos = 0
+        step = self.size
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+        return pos
+
+
+class Leaderboard:
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = Path(path) if path is not None else default_data_dir() / DB_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        # WAL + NORMAL: mỗi ván là một commit ngắn, không fsync trên luồng Tk.
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(SCHEMA)
+        for index in INDEXES:
+            self.db.execute(index)
+        self.db.commit()
+
+        self.scores = ScoreTree()
+        self.levels: dict[int, ScoreTree] = {}
+        self._load()
+
+    def _load(self) -> None:
+        self.scores = ScoreTree()
+        self.levels = {}
+        rows = self.db.execute("SELECT level, score, COUNT(*) FROM scores GROUP BY level, score")
+        for level, score, count in rows:
+            self.scores.add(score, count)
+            self._level_tree(level).add(score, count)
+
+    def _level_tree(self, level: int) -> ScoreTree:
+        tree = self.levels.get(level)
+        if tree is None:
+            tree = self.levels[level] = ScoreTree()
+        return tree
+
+    def _tree(self, level: int | None) -> ScoreTree | None:
+        return self.scores if level is None else self.levels.get(level)
+
+    # ------------------------ Write ------------------------
+    def submit(self, player: str, score: int, level: int, t_ms: int | None = None) -> int:
+        """Ghi một ván đã kết thúc; trả về hạng chung của nó."""
+        if score < 0:
+            raise ValueError(f"điểm không được âm: {score}")
+        if t_ms is None:
+            t_ms = int(time.time() * 1000)
+        with self.db:
+            self.db.execute(
+                "INSERT INTO scores (player, score, level, t_ms) VALUES (?, ?, ?, ?)", (player, score, level, t_ms)
+            )
+        self.scores.add(score)
+        self._level_tree(level).add(score)
+        return self.scores.rank(score)
+
+    def bulk_import(self, rows: Iterable[tuple[str, int, int, int]], chunk: int = 100_000) -> int:
+        """Nạp nhiều ván (player, score, level, t_ms) trong một transaction.
+
+        Chỉ mục được bỏ trong lúc nạp rồi dựng lại một lần (sắp xếp một lượt
+        nhanh hơn nhiều so với chèn từng dòng vào B-tree), cây đếm được dựng
+        lại từ SQLite sau cùng. Trả về số dòng đã nạp.
+        """
+        inserted = 0
+        batch: list[tuple[str, int, int, int]] = []
+        insert = "INSERT INTO scores (player, score, level, t_ms) VALUES (?, ?, ?, ?)"
+        with self.db:
+            # sqlite3 không mở transaction ngầm cho DDL: BEGIN tường minh để bỏ
+            # chỉ mục, nạp và dựng lại chỉ mục cùng commit hoặc cùng rollback.
+            self.db.execute("BEGIN")
+            self.db.execute("DROP INDEX IF EXISTS scores_by_score")
+            self.db.execute("DROP INDEX IF EXISTS scores_by_level")
+            for row in rows:
+                if row[1] < 0:
+                    raise ValueError(f"điểm không được âm: {row[1]}")
+                batch.append(row)
+                if len(batch) >= chunk:
+                    self.db.executemany(insert, batch)
+                    inserted += len(batch)
+                    batch = []
+            if batch:
+                self.db.executemany(insert, batch)
+                inserted += len(batch)
+            for index in INDEXES:
+                self.db.execute(index)
+        self._load()
+        return inserted
+
+    # ------------------------ Query ------------------------
+    def count(self, level: int | None = None) -> int:
+        tree = self._tree(level)
+        return tree.total if tree is not None else 0
+
+    def rank(self, score: int, level: int | None = None) -> int:
+        """Hạng mà ``score`` sẽ có trên bảng chung hoặc bảng của ``level``."""
+        tree = self._tree(level)
+        return tree.rank(score) if tree is not None else 1
+
+    def score_at(self, rank: int, level: int | None = None) -> int | None:
+        """Điểm đang giữ hạng ``rank`` (ví dụ ngưỡng vào top 10)."""
+        tree = self._tree(level)
+        return tree.score_at(rank) if tree is not None else None
+
+    def top(self, k: int = 10, level: int | None = None) -> list[Entry]:
+        if level is None:
+            rows = self.db.execute(
+                "SELECT player, score, level, t_ms FROM scores ORDER BY score DESC, id LIMIT ?", (k,)
+            )
+        else:
+            rows = self.db.execute(
+                "SELECT player, score, level, t_ms FROM scores WHERE level = ? ORDER BY score DESC, id LIMIT ?",
+                (level, k),
+            )
+        tree = self._tree(level)
+        return [Entry(tree.rank(score), player, score, lvl, t_ms) for player, score, lvl, t_ms in rows]
+
+    def close(self) -> None:
+        self.db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help=f"mặc định: $CONG_DUC_HOME/{DB_NAME}")
+    parser.add_argument("--level", type=int, help="chỉ xét các ván kết thúc ở level này")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--rank", type=int, metavar="SCORE", help="in hạng mà điểm này sẽ đạt")
+    args = parser.parse_args()
+
+    board = Leaderboard(args.db)
+    try:
+        scope = "chung" if args.level is None else f"level {args.level}"
+        print(f"bảng {scope}: {board.count(args.level)} ván")
+        for entry in board.top(args.top, args.level):
+            print(f"{entry.rank:>6}  {entry.score:>8}  L{entry.level:<3} {entry.player}")
+        if args.rank is not None:
+            print(f"{args.rank} điểm: hạng #{board.rank(args.rank, args.level)}")
+    finally:
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
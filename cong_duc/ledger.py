@@ -0,0 +1,188 @@
+"""Sổ công đức lưu xuống đĩa: ghi theo lô, an toàn khi tắt đột ngột.
+
+Mỗi tap chỉ cộng vào bộ nhớ và thêm một bản ghi vào buffer (không I/O trên
+luồng Tk). Một luồng nền xả buffer vào write-ahead log (WAL) sau mỗi
+``flush_every`` tap hoặc ``flush_interval_ms``, mỗi lô có CRC và được fsync.
+Khi WAL lớn quá ``compact_bytes`` thì gộp thành snapshot rồi mở WAL thế hệ
+mới, nên khởi động chỉ cần đọc snapshot + một WAL ngắn.
+
+Bố cục thư mục::
+
+    snapshot.json        {"generation": g, "total_merit": ..., "taps": ...}
+    merit.<g>.wal        các lô: header <II (số bản ghi, crc32)> + bản ghi <qi (t_ms, delta)>
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+
+RECORD = struct.Struct("<qi")
+BATCH_HEADER = struct.Struct("<II")
+SNAPSHOT_NAME = "snapshot.json"
+
+
+def default_data_dir() -> Path:
+    return Path(os.environ.get("CONG_DUC_HOME") or Path.home() / ".cong_duc")
+
+
+class MeritLedger:
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        flush_every: int = 64,
+        flush_interval_ms: int = 500,
+        compact_bytes: int = 1 << 20,
+        fsync: bool = True,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else default_data_dir()
+        self.flush_every = flush_every
+        self.flush_interval_ms = flush_interval_ms
+        self.compact_bytes = compact_bytes
+        self.fsync = fsync
+
+        self.total_merit = 0
+        self.taps = 0
+        self.generation = 0
+
+        # Thống kê cho benchmark.
+        self.batches_written = 0
+        self.compactions = 0
+
+        self._buffer: list[tuple[int, int]] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._restore()
+        self._wal = open(self._wal_path(self.generation), "ab")
+        self._wal_size = self._wal.tell()
+        # Tổng/tap đã nằm trên đĩa (snapshot + WAL), dùng khi compact.
+        self._durable_total = self.total_merit
+        self._durable_taps = self.taps
+
+        self._writer = threading.Thread(target=self._run_writer, name="cong-duc-ledger", daemon=True)
+        self._writer.start()
+
+    # ------------------------ Hot path ------------------------
+    def add(self, delta: int, t_ms: int | None = None) -> None:
+        """Ghi nhận công đức; chỉ chạm bộ nhớ, việc ghi đĩa để luồng nền làm."""
+        if t_ms is None:
+            t_ms = int(time.time() * 1000)
+        with self._lock:
+            self.total_merit += delta
+            self.taps += 1
+            self._buffer.append((t_ms, delta))
+            pending = len(self._buffer)
+        if pending >= self.flush_every:
+            self._wake.set()
+
+    # ------------------------ Writer ------------------------
+    def _run_writer(self) -> None:
+        interval = self.flush_interval_ms / 1000
+        while not self._closed:
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+
+        payload = b"".join(RECORD.pack(t_ms, delta) for t_ms, delta in batch)
+        header = BATCH_HEADER.pack(len(batch), zlib.crc32(payload))
+        with self._io_lock:
+            self._wal.write(header + payload)
+            self._wal.flush()
+            if self.fsync:
+                os.fsync(self._wal.fileno())
+            self._wal_size += len(header) + len(payload)
+            self._durable_total += sum(delta for _, delta in batch)
+            self._durable_taps += len(batch)
+            self.batches_written += 1
+            if self._wal_size >= self.compact_bytes:
+                self._compact()
+
+    def _compact(self) -> None:
+        # Snapshot thế hệ mới được thay nguyên tử trước, rồi mới bỏ WAL cũ:
+        # tắt máy ở giữa chừng thì lần khởi động sau vẫn đọc đúng một thế hệ.
+        new_generation = self.generation + 1
+        self._write_snapshot(new_generation, self._durable_total, self._durable_taps)
+        self._wal.close()
+        old_wal = self._wal_path(self.generation)
+        self.generation = new_generation
+        self._wal = open(self._wal_path(new_generation), "ab")
+        self._wal_size = 0
+        old_wal.unlink(missing_ok=True)
+        self.compactions += 1
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join(timeout=2.0)
+        self.flush()
+        with self._io_lock:
+            self._wal.close()
+
+    # ------------------------ Restore ------------------------
+    def _wal_path(self, generation: int) -> Path:
+        return self.directory / f"merit.{generation}.wal"
+
+    def _write_snapshot(self, generation: int, total: int, taps: int) -> None:
+        path = self.directory / SNAPSHOT_NAME
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as out:
+            json.dump({"generation": generation, "total_merit": total, "taps": taps}, out)
+            out.flush()
+            if self.fsync:
+                os.fsync(out.fileno())
+        os.replace(tmp, path)
+
+    def _restore(self) -> None:
+        snapshot = self.directory / SNAPSHOT_NAME
+        if snapshot.exists():
+            try:
+                data = json.loads(snapshot.read_text(encoding="utf-8"))
+                self.generation = int(data["generation"])
+                self.total_merit = int(data["total_merit"])
+                self.taps = int(data["taps"])
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        wal = self._wal_path(self.generation)
+        if wal.exists():
+            valid = self._replay(wal.read_bytes())
+            if valid != wal.stat().st_size:
+                # Lô cuối bị ghi dở khi tắt đột ngột: cắt bỏ phần hỏng.
+                with open(wal, "r+b") as f:
+                    f.truncate(valid)
+
+        for stale in self.directory.glob("merit.*.wal"):
+            if stale != wal:
+                stale.unlink(missing_ok=True)
+
+    def _replay(self, data: bytes) -> int:
+        """Cộng dồn các lô hợp lệ trong WAL; trả về số byte hợp lệ."""
+        offset = 0
+        while offset + BATCH_HEADER.size <= len(data):
+            count, crc = BATCH_HEADER.unpack_from(data, offset)
+            start = offset + BATCH_HEADER.size
+            end = start + count * RECORD.size
+            payload = data[start:end]
+            if end > len(data) or zlib.crc32(payload) != crc:
+                break
+            self.total_merit += sum(delta for _, delta in RECORD.iter_unpack(payload))
+            self.taps += count
+            offset = end
+        return offset
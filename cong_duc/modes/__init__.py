@@ -0,0 +1,61 @@
+"""Các chế độ chơi, nạp lười theo tên chọn lúc khởi động.
+
+``MODES`` chỉ giữ đường dẫn "module:Lớp" dạng chuỗi, nên chạy một chế độ
+chỉ import module của chế độ đó (và những gì nó cần), không kéo theo engine,
+replay hay cộng đồng của chế độ khác. Chế độ mới đăng ký qua ``register``.
+
+    python -m cong_duc --mode free
+    python -m cong_duc --mode glow
+    python -m cong_duc --mode levels --profile
+    python -m cong_duc --mode free --profile-startup
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import time
+import tkinter as tk
+from typing import Sequence
+
+from cong_duc.startup import StartupTimer
+
+MODES: dict[str, str] = {
+    "free": "cong_duc.modes.free:FreeMode",
+    "glow": "cong_duc.modes.glow:GlowMode",
+    "levels": "cong_duc.modes.levels:LevelsMode",
+}
+DEFAULT_MODE = "levels"
+
+
+def register(name: str, target: str) -> None:
+    MODES[name] = target
+
+
+def load(name: str) -> type:
+    module_name, _, class_name = MODES[name].partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def main(argv: Sequence[str] | None = None, mode: str | None = None) -> None:
+    started = time.perf_counter()
+    # Đọc --mode trước (chưa bật -h) để biết chế độ nào cần nạp và tuỳ chọn của nó.
+    parser = argparse.ArgumentParser(description="Công Đức Điện Tử • Cyber Wooden Fish", add_help=False)
+    parser.add_argument("--mode", choices=sorted(MODES), default=mode or DEFAULT_MODE)
+    parser.add_argument("--profile-startup", action="store_true", help="in thời gian từng pha khởi động ra stderr")
+    known, _ = parser.parse_known_args(argv)
+    timer = StartupTimer(started) if known.profile_startup else None
+    app_class = load(known.mode)
+    if timer is not None:
+        timer.mark(f"import chế độ {known.mode}")
+    parser.add_argument("-h", "--help", action="help", help="hiện trợ giúp rồi thoát")
+    # Mỗi chế độ tự thêm tuỳ chọn riêng (ví dụ --profile của bản có level).
+    app_class.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    if timer is not None:
+        timer.mark("tạo cửa sổ Tk")
+    # Cửa sổ hiện ngay sau khung chính; phần còn lại dựng ở frame kế tiếp.
+    app_class.from_args(root, args, lazy_ui=True, startup=timer)
+    root.mainloop()
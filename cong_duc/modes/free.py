@@ -0,0 +1,168 @@
+"""Chế độ tích đức tự do: Mỏ neon giữa màn hình, tap là cộng "Công Đức +1".
+
+- Mỗi lần click phát tiếng cốc nhẹ, nháy viền Mỏ
+- Hiệu ứng chữ bay + glitch
+- Mục tiêu: nhắc nhở giữ tâm tĩnh lặng
+"""
+
+from __future__ import annotations
+
+import random
+import tkinter as tk
+
+from cong_duc.app import NEON_GLOW, NEON_MAIN, TEXT_COLOR, FishApp
+from cong_duc.hud import LabelText
+from cong_duc.layout import fit_scale
+from cong_duc.particles import GlitchTextPool
+from cong_duc.quality import QualityTier
+from cong_duc.startup import StartupTimer
+
+FISH_TAG = "fish"
+# Mỏ vẽ theo khung chuẩn này; khung khác thì co giãn đều, kẹp trong SCALE_RANGE.
+BASE_SIZE = (900, 400)
+SCALE_RANGE = (0.6, 1.6)
+
+
+class FreeMode(FishApp):
+    def __init__(self, root: tk.Tk, lazy_ui: bool = False, startup: StartupTimer | None = None) -> None:
+        super().__init__(root, "Công Đức Điện Tử • Cyber Wooden Fish", "900x560", (760, 500), lazy_ui, startup)
+
+        self.title_label = self.make_label(
+            root, "🕉️ CÔNG ĐỨC ĐIỆN TỬ", NEON_MAIN, ("Consolas", 24, "bold"), pady=(14, 4)
+        )
+        self.counter_label = self.make_label(
+            root, "Tổng công đức: 0", "#ffe76a", ("Consolas", 15, "bold"), pady=(0, 8)
+        )
+        self.make_canvas(*BASE_SIZE)
+        self.fish_items: list[int] = []
+        self.counter_text = LabelText(self.counter_label, self.scheduler, "counter")
+        self.total_merit = self.ledger.total_merit
+        self.counter_text.set(f"Tổng công đức: {self.total_merit}")
+        self.defer(self.build_ui)
+
+    def build_ui(self) -> None:
+        """Phần dựng sau khi cửa sổ đã hiện: nhãn phụ, hiệu ứng, vẽ Mỏ."""
+        root = self.root
+        self.subtitle_label = self.make_label(
+            root,
+            "Nhấn vào Mỏ Neon để tích đức và thả lỏng tâm trí",
+            TEXT_COLOR,
+            ("Segoe UI", 12),
+            pady=(0, 8),
+            after=self.title_label,
+        )
+        self.status_label = self.make_label(
+            root,
+            "Chuẩn: Tư Tiên 4.0 • Gõ để nghe tiếng 'Cốc... Cốc...' điện tử",
+            "#8ac8ff",
+            ("Segoe UI", 11),
+            pady=(0, 12),
+        )
+
+        self.canvas.bind("<Button-1>", self.on_tap)
+        self.layout.on_change(self.on_resize)
+
+        self.floating_texts = GlitchTextPool(
+            self.canvas, self.scheduler, capacity=32, life=24, font=self.fonts.get(("Consolas", 14, "bold"))
+        )
+        self.status_text = LabelText(self.status_label, self.scheduler, "status")
+        self.setup_effects()
+        self.draw_fish()
+
+    def setup_effects(self) -> None:
+        """Hook cho chế độ con thêm hiệu ứng trước lần vẽ Mỏ đầu tiên."""
+
+    # ------------------------ Rendering ------------------------
+    @staticmethod
+    def fish_center(width: int, height: int) -> tuple[int, int]:
+        return width // 2, height // 2 + 8
+
+    @staticmethod
+    def fish_scale(width: int, height: int) -> float:
+        return fit_scale(width, height, *BASE_SIZE, *SCALE_RANGE)
+
+    def draw_fish(self) -> None:
+        """Vẽ Mỏ neon ở giữa canvas, co giãn theo khung hiện tại."""
+        self.canvas.delete(FISH_TAG)
+        self.fish_items.clear()
+
+        width, height = self.layout.width, self.layout.height
+        cx, cy = self.fish_center(width, height)
+
+        self.fish_items.extend(self.draw_glow(cx, cy))
+        self.fish_items.extend(self.draw_fish_body(cx, cy, 170, 86, tags=FISH_TAG))
+        self.fish_items.append(
+            self.canvas.create_text(
+                cx,
+                cy + 118,
+                text="Tap để tích đức • Cốc... Cốc...",
+                fill="#6fdfff",
+                font=self.fonts.get(("Segoe UI", 11)),
+                tags=FISH_TAG,
+            )
+        )
+        scale = self.fish_scale(width, height)
+        if scale != 1.0:
+            self.canvas.scale(FISH_TAG, cx, cy, scale, scale)
+
+    def on_resize(self, old_width: int, old_height: int, width: int, height: int) -> None:
+        """Đặt lại Mỏ theo khung mới bằng một ``scale`` và một ``move`` theo tag, không tạo item."""
+        if not self.fish_items:
+            return
+        old_cx, old_cy = self.fish_center(old_width, old_height)
+        cx, cy = self.fish_center(width, height)
+        ratio = self.fish_scale(width, height) / self.fish_scale(old_width, old_height)
+        if ratio != 1.0:
+            self.canvas.scale(FISH_TAG, old_cx, old_cy, ratio, ratio)
+        if (cx, cy) != (old_cx, old_cy):
+            self.canvas.move(FISH_TAG, cx - old_cx, cy - old_cy)
+
+    def draw_glow(self, cx: int, cy: int) -> list[int]:
+        """Hiệu ứng glow ngoài: ba vòng tĩnh một màu."""
+        return [
+            self.canvas.create_oval(
+                cx - 185 - i * 7,
+                cy - 95 - i * 7,
+                cx + 185 + i * 7,
+                cy + 95 + i * 7,
+                outline=NEON_GLOW,
+                width=alpha_width / 18,
+                tags=FISH_TAG,
+            )
+            for i, alpha_width in enumerate((58, 48, 38))
+        ]
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        pool = self.floating_texts
+        pool.set_capacity(tier.particle_capacity(pool.max_capacity))
+        pool.jitter = tier.jitter
+        pool.fade_every = tier.fade_every
+        pool.set_shadow(tier.shadow)
+
+    # ------------------------ Interaction ------------------------
+    def on_tap(self, event: tk.Event) -> None:
+        """Xử lý mỗi lần người dùng click vào canvas."""
+        self.total_merit += 1
+        self.ledger.add(1)
+        self.counter_text.set(f"Tổng công đức: {self.total_merit}")
+
+        self.play_tap_sound()
+        self.flash_haptic_feedback()
+        self.spawn_floating_text(event.x, event.y)
+
+        if self.total_merit % 30 == 0:
+            self.status_text.set("🎁 Drop duyên lành! Bạn vừa cầu được điều bình an.")
+        elif self.total_merit % 9 == 0:
+            self.status_text.set("Tâm tĩnh hơn một chút... tiếp tục nhé ✨")
+        else:
+            self.status_text.set("Cốc... Cốc... công đức +1")
+
+    def flash_haptic_feedback(self) -> None:
+        """Giả lập haptic feedback bằng nháy viền neon."""
+        self.flash_core(65)
+
+    def spawn_floating_text(self, x: int, y: int) -> None:
+        """Tạo text bay + glitch 'Công Đức +1'."""
+        dx = random.randint(-18, 18)
+        dy = random.randint(-8, 8)
+        self.floating_texts.spawn(x + dx, y + dy, "Công Đức +1", "#ffee8a")
@@ -0,0 +1,30 @@
+"""Chế độ tích đức tự do có vòng glow đổi màu theo palette và bùng sáng khi tap."""
+
+from __future__ import annotations
+
+from cong_duc.app import GLOW_PALETTE
+from cong_duc.glow import GlowRings
+from cong_duc.modes.free import FISH_TAG, FreeMode
+from cong_duc.quality import QualityTier
+
+GLOW_INTERVAL_MS = 180
+
+
+class GlowMode(FreeMode):
+    def setup_effects(self) -> None:
+        # Vòng glow dựng sẵn mọi pha màu, tự dừng khi cửa sổ bị ẩn/mất focus.
+        self.glow = GlowRings(self.canvas, self.scheduler, GLOW_PALETTE, interval_ms=GLOW_INTERVAL_MS)
+        self.glow.start()
+        self.glow.bind_visibility(self.root)
+
+    def draw_glow(self, cx: int, cy: int) -> list[int]:
+        return self.glow.build(cx, cy, 185, 95, widths=(58 / 18, 48 / 18, 38 / 18), tags=FISH_TAG)
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        super().apply_quality(tier)
+        self.glow.set_interval(tier.glow_interval(GLOW_INTERVAL_MS))
+
+    def flash_haptic_feedback(self) -> None:
+        super().flash_haptic_feedback()
+        # Bùng sáng đa màu cho các vòng glow.
+        self.glow.flash()
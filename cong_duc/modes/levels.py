@@ -0,0 +1,522 @@
+"""Chế độ thử thách có level: click trúng Mỏ Neon để đạt điểm trước khi hết giờ.
+
+Cách chơi:
+- Bấm "Bắt đầu" để vào level 1.
+- Click trúng Mỏ Neon để cộng điểm level.
+- Mỗi level có mục tiêu điểm + giới hạn thời gian.
+- Trượt mục tiêu khi hết giờ => thua, cần chơi lại.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+import tkinter as tk
+from typing import TYPE_CHECKING
+
+from cong_duc.app import BG_COLOR, GLOW_PALETTE, NEON_MAIN, FishApp
+from cong_duc.engine import (
+    TAP_GAME_OVER,
+    TAP_IGNORED,
+    TAP_LEVEL_UP,
+    TICK_FISH_MOVED,
+    TICK_GAME_OVER,
+    TICK_LEVEL_UP,
+    MOTION_GLIDE,
+    MOTION_TELEPORT,
+    GameEngine,
+)
+from cong_duc.glow import GlowRings
+from cong_duc.hud import HudModel, LabelText
+from cong_duc.input_queue import Tap, TapQueue
+from cong_duc.items import DEFAULT_CAP
+from cong_duc.particles import FloatingTextPool
+from cong_duc.quality import QualityTier
+from cong_duc.replay import ReplayRecorder, default_replay_dir
+from cong_duc.spatial import TargetField
+from cong_duc.startup import StartupTimer
+
+if TYPE_CHECKING:
+    from cong_duc.community import CommunityClient
+    from cong_duc.difficulty import SkillModel
+    from cong_duc.events import EventStream
+    from cong_duc.leaderboard import Leaderboard
+    from cong_duc.profiler import FrameProfiler
+
+GLOW_INTERVAL_MS = 170
+FISH_TAG = "fish"
+TARGET_TAG = "target"
+DECOY_COLOR = "#ff4f8a"
+HUD_TEMPLATE = (
+    "Level: {level} | Điểm level: {level_score}/{target_score} | "
+    "Tổng công đức: {total_merit} | Thời gian: {time_left}s | Combo: x{combo}"
+)
+
+
+class LevelsMode(FishApp):
+    def __init__(
+        self,
+        root: tk.Tk,
+        retained_render: bool = True,
+        coalesce_input: bool = True,
+        prerendered_glow: bool = True,
+        targets: int = 0,
+        decoys: int = 0,
+        profile: bool = False,
+        player: str = "Ẩn danh",
+        analytics: bool = True,
+        adaptive: bool = False,
+        pass_rate: float = 0.7,
+        glide: bool = False,
+        lazy_ui: bool = False,
+        startup: StartupTimer | None = None,
+    ) -> None:
+        super().__init__(root, "Công Đức Điện Tử • Game", "980x620", (820, 540), lazy_ui, startup)
+
+        # Toàn bộ luật chơi nằm trong engine; app chỉ vẽ và chuyển sự kiện.
+        # targets/decoys > 0: chế độ nhiều Mỏ, hit-test qua chỉ mục lưới.
+        field = TargetField(targets, decoys) if targets or decoys else None
+        # --adaptive: luật từng level tính từ kỹ năng ước lượng qua từng tap,
+        # nhắm tỉ lệ qua màn ``pass_rate``; kỹ năng được giữ giữa các lần chơi.
+        self.skill: SkillModel | None = None
+        rules = None
+        if adaptive:
+            from cong_duc.difficulty import AdaptiveRules, SkillModel
+
+            self.skill = SkillModel.load()
+            rules = AdaptiveRules(self.skill, pass_rate=pass_rate)
+        # --glide: Mỏ lướt tới chỗ mới trong suốt nhịp thay vì nhảy; mỗi frame
+        # chỉ một canvas.move tới vị trí nội suy, tap được chấm theo đúng vị trí đó.
+        motion = MOTION_GLIDE if glide else MOTION_TELEPORT
+        self.engine = GameEngine(rules=rules, width=980, height=440, field=field, motion=motion)
+        self.target_items: dict[int, int] = {}
+        # --profile: đo handler nóng (phải bọc trước khi chúng được bind).
+        self.profiler: FrameProfiler | None = None
+        if profile:
+            from cong_duc.profiler import FrameProfiler
+
+            self.profiler = FrameProfiler(root, self.scheduler, font=self.fonts.get(("Consolas", 9)))
+            self.profiler.instrument(self, "on_tap", "process_taps", "draw_fish", "animate_glow")
+
+        # UI
+        self.title_label = self.make_label(
+            root,
+            "🕹️ CÔNG ĐỨC ĐIỆN TỬ: THỬ THÁCH TÂM TĨNH",
+            NEON_MAIN,
+            ("Consolas", 20, "bold"),
+            pady=(12, 4),
+        )
+        self.top_info = self.make_label(
+            root,
+            "Level: 1 | Điểm level: 0/0 | Tổng công đức: 0 | Thời gian: 0s | Combo: x0",
+            "#ffe76a",
+            ("Consolas", 13, "bold"),
+            pady=(0, 8),
+        )
+        # Trần item chừa chỗ cho mỗi mục tiêu/mồi nhử một oval.
+        self.make_canvas(self.engine.width, self.engine.height, cap=DEFAULT_CAP + targets + decoys)
+
+        # Nhãn chỉ config khi chữ đổi, tối đa một lần mỗi frame.
+        self.hud = HudModel(
+            self.top_info,
+            self.scheduler,
+            HUD_TEMPLATE,
+            level=1,
+            level_score=0,
+            target_score=0,
+            total_merit=0,
+            time_left=0,
+            combo=0,
+        )
+        # Mỗi ván có seed riêng và được ghi replay để tái lập/kiểm tra điểm.
+        self.recorder = ReplayRecorder(self.engine)
+
+        # Canvas item references
+        self.fish_items: list[int] = []
+        self.glow_ring_ids: list[int] = []
+        self.glow_phase = 0
+        # Glow dựng sẵn mọi pha màu, đổi frame bằng một tag_raise và tự dừng
+        # khi cửa sổ bị ẩn/mất focus (tắt để dùng itemconfig từng vòng).
+        self.prerendered_glow = prerendered_glow
+        self.glow = GlowRings(self.canvas, self.scheduler, GLOW_PALETTE, interval_ms=GLOW_INTERVAL_MS)
+        if self.profiler is not None:
+            self.profiler.instrument(self.glow, "advance", label="animate_glow")
+
+        # Retained mode: Mỏ được dựng một lần rồi chỉ dời theo tag, chỉ dựng
+        # lại khi kích thước thân Mỏ thay đổi.
+        self.retained_render = retained_render
+        self._fish_pos: tuple[int, int] = (0, 0)
+        self._fish_geometry: tuple[int, int] | None = None
+
+        self.particles = FloatingTextPool(
+            self.canvas, self.scheduler, capacity=32, life=20, font=self.fonts.get(("Consolas", 13, "bold"))
+        )
+
+        # Tap được gom lại và xử lý theo lô mỗi frame (tắt để xử lý ngay).
+        self.coalesce_input = coalesce_input
+        self.tap_queue = TapQueue(self.scheduler, self.process_taps)
+        # Client cộng đồng (nếu có) được tạo cùng thanh dưới trong build_ui.
+        self.community: CommunityClient | None = None
+        # Mỗi ván kết thúc được ghi vào bảng xếp hạng (mở cùng thanh dưới).
+        self.player = player
+        self.leaderboard: Leaderboard | None = None
+        # Sự kiện phân tích (vào level, hit, trượt, qua/thua) ghi ở luồng nền.
+        self.analytics = analytics
+        self.events: EventStream | None = None
+        self.defer(self.build_ui)
+
+    def build_ui(self) -> None:
+        """Phần dựng sau khi cửa sổ đã hiện: thanh dưới, cộng đồng, vẽ Mỏ, glow."""
+        self.bottom_bar = tk.Frame(self.root, bg=BG_COLOR)
+        self.bottom_bar.pack(fill="x", pady=(6, 12))
+
+        self.status_label = self.make_label(
+            self.bottom_bar, "Nhấn 'Bắt đầu' để chơi.", "#8ac8ff", ("Segoe UI", 11), side="left", padx=12
+        )
+
+        self.start_button = tk.Button(
+            self.bottom_bar,
+            text="Bắt đầu / Chơi lại",
+            command=self.start_game,
+            bg="#10264d",
+            fg="#d5f4ff",
+            activebackground="#1a3d7a",
+            activeforeground="#ffffff",
+            relief="flat",
+            padx=16,
+            pady=6,
+            font=self.fonts.get(("Segoe UI", 10, "bold")),
+        )
+        self.start_button.pack(side="right", padx=12)
+
+        self.canvas.bind("<Button-1>", self.on_tap)
+        self.layout.on_change(self.on_resize)
+
+        self.status = LabelText(self.status_label, self.scheduler, "status")
+        # Công đức cộng đồng (CONG_DUC_SERVER=host:port): gửi theo lô ở luồng nền.
+        # Không đặt biến môi trường thì không import asyncio/socket.
+        if os.environ.get("CONG_DUC_SERVER"):
+            from cong_duc.community import CommunityClient
+
+            self.community = CommunityClient.from_env()
+        if self.community is not None:
+            self.community_label = self.make_label(
+                self.bottom_bar, "Cộng đồng: ...", "#c9a6ff", ("Segoe UI", 10), side="right", padx=12
+            )
+            self.community_text = LabelText(self.community_label, self.scheduler, "community_label")
+            self.scheduler.every("community", 500, self.update_community)
+        from cong_duc.leaderboard import Leaderboard
+
+        self.leaderboard = Leaderboard()
+        if self.analytics:
+            from cong_duc.events import EventStream
+
+            self.events = self.engine.events = EventStream()
+
+        # <Configure> có thể đã tới khi phần này còn chờ dựng (lazy_ui).
+        self.engine.set_field_size(self.layout.width, self.layout.height)
+        self.engine.center_fish()
+        self.draw_fish()
+        if self.prerendered_glow:
+            self.glow.start()
+            self.glow.bind_visibility(self.root)
+        else:
+            self.scheduler.every("glow", GLOW_INTERVAL_MS, self.animate_glow, delay_ms=0)
+        if self.profiler is not None:
+            self.profiler.add_gauge("quality_tier", lambda: self.quality.level)
+            self.profiler.attach(self.canvas)
+
+    @classmethod
+    def add_arguments(cls, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--profile", action="store_true", help="overlay đo frame/lag (F3 ẩn/hiện, F4 xuất CSV/JSON)")
+        parser.add_argument(
+            "--player", default=os.environ.get("CONG_DUC_PLAYER", "Ẩn danh"), help="tên trên bảng xếp hạng"
+        )
+        parser.add_argument(
+            "--no-analytics", dest="analytics", action="store_false", help="không ghi sự kiện phân tích"
+        )
+        parser.add_argument("--adaptive", action="store_true", help="độ khó tự chỉnh theo kỹ năng người chơi")
+        parser.add_argument("--pass-rate", type=float, default=0.7, help="tỉ lệ qua màn nhắm tới khi --adaptive")
+        parser.add_argument("--glide", action="store_true", help="Mỏ lướt mượt tới chỗ mới thay vì nhảy")
+        parser.add_argument("--targets", type=int, default=0, help="số Mỏ phụ (chế độ nhiều mục tiêu)")
+        parser.add_argument("--decoys", type=int, default=0, help="số mồi nhử; trúng mồi tính là trượt")
+
+    @classmethod
+    def from_args(cls, root: tk.Tk, args: argparse.Namespace, **options: object) -> LevelsMode:
+        return cls(
+            root,
+            profile=args.profile,
+            player=args.player,
+            analytics=args.analytics,
+            adaptive=args.adaptive,
+            pass_rate=args.pass_rate,
+            glide=args.glide,
+            targets=args.targets,
+            decoys=args.decoys,
+            **options,
+        )
+
+    # ------------------------ Game flow ------------------------
+    def now_ms(self) -> int:
+        return self.scheduler.now()
+
+    def start_game(self) -> None:
+        self.save_replay()
+        self.recorder.start(self.now_ms(), random.randrange(1 << 64))
+        self.status.set("Bắt đầu! Click trúng Mỏ Neon để vượt thử thách.")
+        self.on_engine_tick()
+        if self.engine.motion:
+            self.scheduler.every("motion", self.scheduler.frame_ms, self.place_fish)
+
+    def schedule_engine(self) -> None:
+        # Chỉ giữ một task "engine", hẹn đúng mốc kế tiếp (countdown hoặc di
+        # chuyển Mỏ); đăng ký lại sẽ thay task cũ nên chơi lại không bị chồng.
+        deadline = self.engine.next_deadline()
+        if deadline is None:
+            self.scheduler.cancel("engine")
+            return
+        self.scheduler.once("engine", deadline - self.now_ms(), self.on_engine_tick)
+
+    def on_engine_tick(self) -> None:
+        self.apply_engine_flags(self.engine.advance(self.now_ms()))
+        self.schedule_engine()
+
+    def apply_engine_flags(self, flags: int) -> None:
+        if flags & TICK_LEVEL_UP:
+            self.status.set(f"🎉 Qua màn! Lên level {self.engine.level}.")
+        if flags & TICK_GAME_OVER:
+            self.show_game_over()
+        if flags & (TICK_FISH_MOVED | TICK_LEVEL_UP):
+            self.place_fish()
+        if flags:
+            self.update_hud()
+
+    def show_game_over(self) -> None:
+        self.scheduler.cancel("motion")
+        self.save_replay()
+        engine = self.engine
+        ranking = ""
+        # Điểm của ván độ khó thích ứng không so được với đường cong chung.
+        if self.leaderboard is not None and self.skill is None:
+            rank = self.leaderboard.submit(self.player, engine.total_merit, engine.level)
+            ranking = f" Hạng #{rank}/{self.leaderboard.count()}."
+        self.status.set(
+            f"Hết giờ! Bạn đạt {engine.level_score}/{engine.target_score}.{ranking} "
+            "Nhấn 'Bắt đầu / Chơi lại' để thử lại."
+        )
+
+    # ------------------------ Rendering ------------------------
+    def on_resize(self, _old_width: int, _old_height: int, width: int, height: int) -> None:
+        # Gọi tối đa một lần mỗi frame (CanvasLayout). Tap đã nhận trong frame
+        # được chấm trước, rồi timer đến hạn chạy với khung cũ, đúng thứ tự mà
+        # replay phát lại. Mỏ giữ kích thước (là vùng hit) nên chỉ cần move.
+        self.tap_queue.flush()
+        self.apply_engine_flags(self.engine.advance(self.now_ms()))
+        self.engine.set_field_size(width, height)
+        self.recorder.resize(self.engine.width, self.engine.height)
+        if not self.engine.game_running:
+            self.engine.center_fish()
+            self.place_fish()
+
+    def fish_position(self) -> tuple[float, float]:
+        engine = self.engine
+        if engine.motion and engine.game_running:
+            return engine.position_at(self.now_ms())
+        return engine.cx, engine.cy
+
+    def place_fish(self) -> None:
+        engine = self.engine
+        geometry = (engine.body_rx, engine.body_ry)
+        if not self.retained_render or not self.fish_items or geometry != self._fish_geometry:
+            self.draw_fish()
+        else:
+            old_x, old_y = self._fish_pos
+            cx, cy = self.fish_position()
+            if (cx, cy) != (old_x, old_y):
+                self.canvas.move(FISH_TAG, cx - old_x, cy - old_y)
+                self._fish_pos = (cx, cy)
+        self.place_targets()
+
+    def place_targets(self) -> None:
+        # Mục tiêu phụ và mồi nhử: mỗi cái một oval, tạo một lần rồi chỉ đổi coords.
+        field = self.engine.field
+        if field is None:
+            return
+        for target in field.targets[1:]:
+            bbox = (
+                target.cx - target.rx,
+                target.cy - target.ry,
+                target.cx + target.rx,
+                target.cy + target.ry,
+            )
+            item = self.target_items.get(target.id)
+            if item is None:
+                self.target_items[target.id] = self.canvas.create_oval(
+                    *bbox,
+                    fill="#0f1731",
+                    outline=DECOY_COLOR if target.decoy else NEON_MAIN,
+                    width=3,
+                    tags=TARGET_TAG,
+                )
+            else:
+                self.canvas.coords(item, *bbox)
+
+    def draw_fish(self) -> None:
+        self.canvas.delete(FISH_TAG)
+        self.fish_items.clear()
+        self.glow_ring_ids.clear()
+
+        cx, cy = self.fish_position()
+        body_rx, body_ry = self.engine.body_rx, self.engine.body_ry
+        self._fish_pos = (cx, cy)
+        self._fish_geometry = (body_rx, body_ry)
+
+        if self.prerendered_glow:
+            self.fish_items.extend(self.glow.build(cx, cy, body_rx + 10, body_ry + 10, (3.2, 2.7, 2.2), tags=FISH_TAG))
+        else:
+            for i, width in enumerate((3.2, 2.7, 2.2)):
+                glow = self.canvas.create_oval(
+                    cx - body_rx - 10 - i * 7,
+                    cy - body_ry - 10 - i * 7,
+                    cx + body_rx + 10 + i * 7,
+                    cy + body_ry + 10 + i * 7,
+                    outline=GLOW_PALETTE[(self.glow_phase + i) % len(GLOW_PALETTE)],
+                    width=width,
+                    tags=FISH_TAG,
+                )
+                self.fish_items.append(glow)
+                self.glow_ring_ids.append(glow)
+
+        self.fish_items.extend(self.draw_fish_body(cx, cy, body_rx, body_ry, tags=FISH_TAG))
+        # Mỏ chính nằm dưới cùng, khớp với thứ tự z của hit-test.
+        self.canvas.tag_raise(TARGET_TAG)
+
+    def apply_quality(self, tier: QualityTier) -> None:
+        self.particles.set_capacity(tier.particle_capacity(self.particles.max_capacity))
+        self.particles.jitter = tier.jitter
+        interval = tier.glow_interval(GLOW_INTERVAL_MS)
+        if self.prerendered_glow:
+            self.glow.set_interval(interval)
+        elif interval:
+            self.scheduler.every("glow", interval, self.animate_glow)
+        else:
+            self.scheduler.cancel("glow")
+
+    def animate_glow(self) -> None:
+        if self.glow_ring_ids:
+            self.glow_phase = (self.glow_phase + 1) % len(GLOW_PALETTE)
+            for i, ring_id in enumerate(self.glow_ring_ids):
+                self.canvas.itemconfig(
+                    ring_id,
+                    outline=GLOW_PALETTE[(self.glow_phase + i) % len(GLOW_PALETTE)],
+                )
+
+    # ------------------------ Interaction ------------------------
+    def on_tap(self, event: tk.Event) -> None:
+        if self.coalesce_input:
+            self.tap_queue.push(event.x, event.y, self.now_ms())
+        else:
+            self.process_taps([(event.x, event.y, self.now_ms())])
+
+    def process_taps(self, taps: list[Tap]) -> None:
+        # Chấm điểm từng tap theo đúng mốc thời gian của nó, nhưng nhãn,
+        # HUD, flash và âm thanh chỉ cập nhật một lần cho cả lô.
+        engine = self.engine
+        flags = 0
+        hit = False
+        status = None
+        for x, y, t in taps:
+            # Chạy các timer đã đến hạn trước, để tap được chấm với vị trí Mỏ lúc đó.
+            flags |= engine.advance(t)
+            # Nhịp Mỏ của level mà tap được chấm (tap lên level sẽ đổi nhịp).
+            moved_at = engine.last_move_at
+            move_ms = engine.move_interval_ms
+            result = engine.tap(x, y, t)
+            self.recorder.tap(x, y, result)
+            if result == TAP_IGNORED:
+                status = status or "Game chưa chạy. Bấm 'Bắt đầu / Chơi lại'."
+                continue
+            if self.skill is not None:
+                self.skill.observe(engine.last_gain > 0, engine.now, moved_at, move_ms)
+
+            if engine.last_gain:
+                hit = True
+                self.ledger.add(engine.last_gain)
+                if self.community is not None:
+                    self.community.add(engine.last_gain)
+                self.spawn_floating_text(x, y, f"+{engine.last_gain} Công Đức", "#ffee8a")
+                status = "Cốc... Cốc... Trúng!"
+            else:
+                self.spawn_floating_text(x, y, "Trượt! -2s", "#ff8ab0")
+                status = "Trượt rồi! Cẩn thận, mất 2 giây."
+
+            if result == TAP_LEVEL_UP:
+                flags |= TICK_LEVEL_UP
+            elif result == TAP_GAME_OVER:
+                flags |= TICK_GAME_OVER
+
+        if hit:
+            self.flash_hit_effect()
+            self.play_tap_sound()
+        if status:
+            self.status.set(status)
+        self.apply_engine_flags(flags)
+        self.update_hud()
+        if flags & (TICK_LEVEL_UP | TICK_GAME_OVER):
+            self.schedule_engine()
+
+    def flash_hit_effect(self) -> None:
+        if not self.core_item_id:
+            return
+
+        self.flash_core(75)
+        if self.prerendered_glow:
+            self.glow.flash()
+        else:
+            burst_color = random.choice(GLOW_PALETTE)
+            for ring_id in self.glow_ring_ids:
+                self.canvas.itemconfig(ring_id, outline=burst_color)
+
+    def spawn_floating_text(self, x: int, y: int, text: str, color: str) -> None:
+        self.particles.spawn(
+            x + random.randint(-10, 10),
+            y + random.randint(-8, 8),
+            text,
+            color,
+        )
+
+    # ------------------------ Util ------------------------
+    def save_replay(self) -> None:
+        replay = self.recorder.finish()
+        if replay is not None and replay.events:
+            replay.save(default_replay_dir() / f"{int(time.time())}-{replay.seed:016x}.cdr")
+
+    def on_close(self) -> None:
+        self.save_replay()
+        if self.community is not None:
+            self.community.close()
+        if self.leaderboard is not None:
+            self.leaderboard.close()
+        if self.events is not None:
+            self.events.close()
+        if self.skill is not None:
+            self.skill.save()
+        super().on_close()
+
+    def update_community(self) -> None:
+        total = self.community.total_merit
+        if total is not None:
+            self.community_text.set(f"Cộng đồng: {total} công đức")
+
+    def update_hud(self) -> None:
+        engine = self.engine
+        self.hud.update(
+            level=engine.level,
+            level_score=engine.level_score,
+            target_score=engine.target_score,
+            total_merit=engine.total_merit,
+            time_left=engine.time_left,
+            combo=engine.combo,
+        )
@@ -0,0 +1,205 @@
+"""Chữ bay (floating text) dùng pool item canvas tái sử dụng.
+
+Mỗi pool giữ tối đa ``capacity`` item, tạo dần khi cần rồi ẩn/hiện lại thay
+vì xóa và tạo mới. Tất cả chữ đang bay được đẩy đi trong cùng một nhịp
+``tick()`` (một task của FrameScheduler), nên dù tap nhanh cỡ nào cũng chỉ có
+đúng một timer. Khi pool đầy, chữ cũ nhất bị thu hồi trước.
+
+Bộ điều chỉnh chất lượng (``cong_duc.quality``) có thể thu nhỏ sức chứa
+(``set_capacity``) và tắt rung, bóng, phai màu khi event loop quá tải.
+"""
+
+from __future__ import annotations
+
+import random
+import tkinter as tk
+from collections import deque
+from tkinter import font as tkfont
+
+from cong_duc.scheduler import FrameScheduler
+
+
+class _Particle:
+    __slots__ = ("text_id", "shadow_id", "life")
+
+    def __init__(self, text_id: int, shadow_id: int | None) -> None:
+        self.text_id = text_id
+        self.shadow_id = shadow_id
+        self.life = 0
+
+
+class FloatingTextPool:
+    """Chữ bay một lớp, trôi lên và rung nhẹ theo trục x (bản game có level)."""
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        scheduler: FrameScheduler,
+        capacity: int = 32,
+        life: int = 20,
+        frame_ms: int = 45,
+        font: tuple | tkfont.Font = ("Consolas", 13, "bold"),
+        rng: random.Random | None = None,
+        task_name: str = "floating_text",
+    ) -> None:
+        self.canvas = canvas
+        self.scheduler = scheduler
+        self.task_name = task_name
+        self.capacity = capacity
+        self.max_capacity = capacity
+        self.jitter = True
+        self.life = life
+        self.frame_ms = frame_ms
+        self.font = font
+        self.rng = rng or random.Random()
+
+        self._live: deque[_Particle] = deque()
+        self._free: list[_Particle] = []
+        self._allocated = 0
+        self.evicted = 0
+
+    @property
+    def live_count(self) -> int:
+        return len(self._live)
+
+    @property
+    def allocated(self) -> int:
+        return self._allocated
+
+    def set_capacity(self, capacity: int) -> None:
+        """Đổi số chữ bay tối đa (không vượt sức chứa gốc); chữ dư bị thu hồi ngay."""
+        self.capacity = max(1, min(capacity, self.max_capacity))
+        while len(self._live) > self.capacity:
+            particle = self._live.popleft()
+            self._hide(particle)
+            self._free.append(particle)
+            self.evicted += 1
+
+    def spawn(self, x: float, y: float, text: str, color: str) -> None:
+        if len(self._live) >= self.capacity:
+            # Pool đầy: thu hồi chữ cũ nhất (đứng đầu hàng đợi).
+            particle = self._live.popleft()
+            self.evicted += 1
+        elif self._free:
+            particle = self._free.pop()
+        else:
+            particle = self._create()
+            self._allocated += 1
+
+        particle.life = self.life
+        self._show(particle, x, y, text, color)
+        self._live.append(particle)
+        self._ensure_running()
+
+    def tick(self) -> bool:
+        """Đẩy mọi chữ đang bay thêm một frame; trả về True nếu còn chữ sống."""
+        live = self._live
+        for particle in live:
+            particle.life -= 1
+            if particle.life > 0:
+                self._step(particle)
+
+        # Mọi chữ có cùng tuổi thọ nên chữ hết hạn luôn nằm ở đầu hàng đợi.
+        while live and live[0].life <= 0:
+            particle = live.popleft()
+            self._hide(particle)
+            self._free.append(particle)
+        return bool(live)
+
+    def clear(self) -> None:
+        while self._live:
+            particle = self._live.popleft()
+            self._hide(particle)
+            self._free.append(particle)
+        self.scheduler.cancel(self.task_name)
+
+    # ------------------------ Frame loop ------------------------
+    def _ensure_running(self) -> None:
+        if not self.scheduler.is_scheduled(self.task_name):
+            self.scheduler.every(self.task_name, self.frame_ms, self._on_frame)
+
+    def _on_frame(self) -> None:
+        if not self.tick():
+            self.scheduler.cancel(self.task_name)
+
+    # ------------------------ Canvas items ------------------------
+    def _create(self) -> _Particle:
+        text_id = self.canvas.create_text(0, 0, text="", font=self.font, state="hidden")
+        return _Particle(text_id, None)
+
+    def _show(self, particle: _Particle, x: float, y: float, text: str, color: str) -> None:
+        canvas = self.canvas
+        canvas.coords(particle.text_id, x, y)
+        canvas.itemconfig(particle.text_id, text=text, fill=color, state="normal")
+        canvas.tag_raise(particle.text_id)
+
+    def _step(self, particle: _Particle) -> None:
+        self.canvas.move(particle.text_id, self.rng.randint(-1, 1) if self.jitter else 0, -2)
+
+    def _hide(self, particle: _Particle) -> None:
+        self.canvas.itemconfig(particle.text_id, state="hidden")
+
+
+class GlitchTextPool(FloatingTextPool):
+    """Chữ bay có bóng hồng lệch pha và phai màu dần (bản tích đức tự do)."""
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        scheduler: FrameScheduler,
+        capacity: int = 32,
+        life: int = 24,
+        frame_ms: int = 45,
+        font: tuple | tkfont.Font = ("Consolas", 14, "bold"),
+        shadow_color: str = "#ff2f92",
+        rng: random.Random | None = None,
+        task_name: str = "floating_text",
+    ) -> None:
+        super().__init__(canvas, scheduler, capacity, life, frame_ms, font, rng, task_name)
+        self.shadow_color = shadow_color
+        self.shadow = True
+        # Đổi màu phai mỗi N frame (0 = giữ nguyên màu đến hết đời).
+        self.fade_every = 1
+
+    def set_shadow(self, enabled: bool) -> None:
+        """Bật/tắt bóng; tắt thì ẩn luôn bóng của chữ đang bay (bật lại áp cho chữ mới)."""
+        if self.shadow and not enabled:
+            for particle in self._live:
+                self.canvas.itemconfig(particle.shadow_id, state="hidden")
+        self.shadow = enabled
+
+    def _create(self) -> _Particle:
+        text_id = self.canvas.create_text(0, 0, text="", font=self.font, state="hidden")
+        shadow_id = self.canvas.create_text(0, 0, text="", font=self.font, state="hidden")
+        return _Particle(text_id, shadow_id)
+
+    def _show(self, particle: _Particle, x: float, y: float, text: str, color: str) -> None:
+        canvas = self.canvas
+        canvas.coords(particle.text_id, x, y)
+        canvas.coords(particle.shadow_id, x + 2, y + 2)
+        canvas.itemconfig(particle.text_id, text=text, fill=color, state="normal")
+        if self.shadow:
+            canvas.itemconfig(particle.shadow_id, text=text, fill=self.shadow_color, state="normal")
+            canvas.tag_raise(particle.shadow_id)
+        else:
+            canvas.itemconfig(particle.shadow_id, state="hidden")
+        canvas.tag_raise(particle.text_id)
+
+    def _step(self, particle: _Particle) -> None:
+        canvas = self.canvas
+        jitter_x = self.rng.randint(-1, 1) if self.jitter else 0
+        canvas.move(particle.text_id, jitter_x, -2)
+        if self.shadow:
+            canvas.move(particle.shadow_id, -jitter_x, -2)
+
+        # fade gia lap bang thay doi mau theo thoi gian
+        age = self.life - particle.life
+        if self.fade_every and age % self.fade_every == 0:
+            fade = max(60, 255 - age * 8)
+            canvas.itemconfig(particle.text_id, fill=f"#{fade:02x}{(fade - 25):02x}8a")
+            if self.shadow:
+                canvas.itemconfig(particle.shadow_id, fill=f"#ff2f{max(40, fade - 80):02x}")
+
+    def _hide(self, particle: _Particle) -> None:
+        self.canvas.itemconfig(particle.text_id, state="hidden")
+        self.canvas.itemconfig(particle.shadow_id, state="hidden")
@@ -0,0 +1,198 @@
+"""Đo frame time và độ trễ event loop, hiện overlay trên canvas, xuất CSV/JSON.
+
+Bật bằng ``--profile`` khi chạy game. F3 bật/tắt overlay, F4 ghi toàn bộ
+mẫu đã thu ra ``~/.cong_duc/profiles``. Mỗi ``refresh_ms`` một mẫu gồm:
+
+- độ trễ event loop: callback ``after`` của FrameScheduler chạy muộn bao
+  nhiêu so với mốc đã hẹn (trung bình/lớn nhất trong khoảng);
+- thời gian chạy task của mỗi frame;
+- số item đang sống trên canvas và số callback ``after`` đang chờ của Tk;
+- số lần gọi và thời gian của từng handler được ``instrument``;
+- các chỉ số app tự khai báo qua ``add_gauge`` (ví dụ bậc chất lượng).
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import time
+import tkinter as tk
+from collections import deque
+from pathlib import Path
+from tkinter import font as tkfont
+from typing import Callable
+
+from cong_duc.ledger import default_data_dir
+from cong_duc.scheduler import FrameScheduler
+
+OVERLAY_TAG = "profiler_overlay"
+
+
+class FrameProfiler:
+    def __init__(
+        self,
+        root: tk.Misc,
+        scheduler: FrameScheduler,
+        refresh_ms: int = 250,
+        history: int = 2400,
+        font: tuple | tkfont.Font = ("Consolas", 9),
+    ) -> None:
+        self.root = root
+        self.scheduler = scheduler
+        self.refresh_ms = refresh_ms
+        self.font = font
+        self.samples: deque[dict[str, float]] = deque(maxlen=history)
+        self.canvas: tk.Canvas | None = None
+        self.overlay_visible = False
+
+        # Thời gian (ms) của từng handler kể từ mẫu trước, và tổng từ đầu.
+        self._window: dict[str, list[float]] = {}
+        self.totals: dict[str, list[float]] = {}
+        self.gauges: dict[str, Callable[[], float]] = {}
+        self._started = time.perf_counter()
+
+    # ------------------------ Instrumentation ------------------------
+    def wrap(self, label: str, fn: Callable[..., object]) -> Callable[..., object]:
+        durations = self._window.setdefault(label, [])
+        totals = self.totals.setdefault(label, [0, 0.0, 0.0])  # số lần, tổng ms, max ms
+        perf = time.perf_counter
+
+        @functools.wraps(fn)
+        def timed(*args: object, **kwargs: object) -> object:
+            start = perf()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = (perf() - start) * 1000
+                durations.append(elapsed)
+                totals[0] += 1
+                totals[1] += elapsed
+                if elapsed > totals[2]:
+                    totals[2] = elapsed
+
+        return timed
+
+    def instrument(self, obj: object, *names: str, label: str | None = None) -> None:
+        """Thay method trên *instance* bằng bản có đo giờ.
+
+        Phải gọi trước khi method được bind/đăng ký vào scheduler, vì các chỗ
+        đó giữ bound method cũ.
+        """
+        for name in names:
+            setattr(obj, name, self.wrap(label or name, getattr(obj, name)))
+
+    def add_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Ghi thêm ``read()`` vào mỗi mẫu (và overlay) dưới tên ``name``."""
+        self.gauges[name] = read
+
+    # ------------------------ Sampling ------------------------
+    def attach(self, canvas: tk.Canvas, show: bool = True) -> None:
+        self.canvas = canvas
+        self.root.bind("<F3>", lambda _event: self.toggle(), add="+")
+        self.root.bind("<F4>", lambda _event: self.export(), add="+")
+        self.scheduler.every("profiler", self.refresh_ms, self.sample)
+        if show:
+            self.toggle()
+
+    def _pending_after(self) -> int:
+        try:
+            return len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+        except tk.TclError:
+            return 0
+
+    def sample(self) -> dict[str, float]:
+        # Lấy hết số đo của scheduler kể từ mẫu trước rồi xoá, để mỗi mẫu
+        # chỉ phản ánh khoảng ``refresh_ms`` vừa qua.
+        scheduler = self.scheduler
+        lags = list(scheduler.lag_ms)
+        work = list(scheduler.work_ms)
+        scheduler.lag_ms.clear()
+        scheduler.work_ms.clear()
+        sample: dict[str, float] = {
+            "t_s": round(time.perf_counter() - self._started, 3),
+            "frames": len(lags),
+            "lag_mean_ms": sum(lags) / len(lags) if lags else 0.0,
+            "lag_max_ms": max(lags, default=0),
+            "frame_work_mean_ms": sum(work) / len(work) if work else 0.0,
+            "frame_work_max_ms": max(work, default=0.0),
+            "canvas_items": len(self.canvas.find_all()) if self.canvas is not None else 0,
+            "pending_after": self._pending_after(),
+            "tasks": self.scheduler.task_count,
+        }
+        for name, read in self.gauges.items():
+            sample[name] = read()
+        for label, durations in self._window.items():
+            sample[f"{label}_count"] = len(durations)
+            sample[f"{label}_mean_ms"] = sum(durations) / len(durations) if durations else 0.0
+            sample[f"{label}_max_ms"] = max(durations, default=0.0)
+            durations.clear()
+        self.samples.append(sample)
+        if self.overlay_visible:
+            self._draw_overlay(sample)
+        return sample
+
+    # ------------------------ Overlay ------------------------
+    def toggle(self) -> None:
+        self.overlay_visible = not self.overlay_visible
+        if self.canvas is None:
+            return
+        if not self.overlay_visible:
+            self.canvas.delete(OVERLAY_TAG)
+        elif self.samples:
+            self._draw_overlay(self.samples[-1])
+
+    def _draw_overlay(self, sample: dict[str, float]) -> None:
+        lines = [
+            f"lag {sample['lag_mean_ms']:.1f}/{sample['lag_max_ms']:.0f} ms  "
+            f"frame {sample['frame_work_mean_ms']:.2f}/{sample['frame_work_max_ms']:.2f} ms",
+            f"items {sample['canvas_items']}  after {sample['pending_after']}  tasks {sample['tasks']}",
+        ]
+        if self.gauges:
+            lines.append("  ".join(f"{name} {sample[name]}" for name in self.gauges))
+        for label in self._window:
+            if sample[f"{label}_count"]:
+                lines.append(
+                    f"{label} x{sample[f'{label}_count']:.0f} "
+                    f"{sample[f'{label}_mean_ms']:.2f}/{sample[f'{label}_max_ms']:.2f} ms"
+                )
+        text = "\n".join(lines)
+        canvas = self.canvas
+        if canvas.find_withtag(OVERLAY_TAG):
+            canvas.itemconfig(OVERLAY_TAG, text=text)
+        else:
+            canvas.create_text(
+                8,
+                8,
+                text=text,
+                anchor="nw",
+                fill="#9dff9d",
+                font=self.font,
+                tags=OVERLAY_TAG,
+            )
+        canvas.tag_raise(OVERLAY_TAG)
+
+    # ------------------------ Export ------------------------
+    def export(self, directory: str | Path | None = None) -> tuple[Path, Path]:
+        """Ghi mẫu ra CSV (mỗi dòng một mẫu) và JSON (mẫu + tổng theo handler)."""
+        directory = Path(directory) if directory is not None else default_data_dir() / "profiles"
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = directory / time.strftime("profile-%Y%m%d-%H%M%S")
+        samples = list(self.samples)
+        columns: list[str] = []
+        for sample in samples:
+            columns.extend(key for key in sample if key not in columns)
+
+        csv_path = stem.with_suffix(".csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as out:
+            writer = csv.DictWriter(out, fieldnames=columns, restval=0)
+            writer.writeheader()
+            writer.writerows(samples)
+
+        json_path = stem.with_suffix(".json")
+        handlers = {
+            label: {"count": count, "total_ms": total, "mean_ms": total / count if count else 0.0, "max_ms": peak}
+            for label, (count, total, peak) in self.totals.items()
+        }
+        json_path.write_text(json.dumps({"samples": samples, "handlers": handlers}, indent=1), encoding="utf-8")
+        return csv_path, json_path
@@ -0,0 +1,133 @@
+"""Tự hạ/khôi phục mức hiệu ứng theo tải của event loop.
+
+Khi event loop không theo kịp, thà bớt hiệu ứng trang trí còn hơn ghi nhận
+tap trễ. ``QualityController`` đọc tải trung bình của FrameScheduler (độ trễ
+callback ``after`` và thời gian chạy task mỗi frame) theo chu kỳ; quá tải
+liên tục vài lần đo thì hạ một bậc, rảnh liên tục lâu hơn thì nâng một bậc
+(trễ nâng hơn trễ hạ để không dao động). Mỗi bậc là một ``QualityTier``; app
+tự áp bậc lên pool chữ bay và glow qua callback ``on_change``.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+from cong_duc.scheduler import FrameScheduler
+
+
+@dataclass(frozen=True)
+class QualityTier:
+    name: str
+    # Tỉ lệ số chữ bay tối đa so với sức chứa gốc của pool.
+    particle_scale: float
+    # Nhịp đổi màu glow chậm đi bao nhiêu lần; 0 = đứng yên.
+    glow_slowdown: int
+    # Đổi màu phai của chữ bay mỗi N frame; 0 = không phai.
+    fade_every: int
+    # Chữ bay rung ngang và có bóng lệch pha.
+    jitter: bool
+    shadow: bool
+
+    def glow_interval(self, base_ms: int) -> int:
+        return base_ms * self.glow_slowdown
+
+    def particle_capacity(self, base: int) -> int:
+        return max(1, round(base * self.particle_scale))
+
+
+TIERS = (
+    QualityTier("full", 1.0, 1, 1, jitter=True, shadow=True),
+    QualityTier("reduced", 0.5, 2, 2, jitter=True, shadow=True),
+    QualityTier("low", 0.25, 4, 4, jitter=False, shadow=False),
+    QualityTier("minimal", 0.125, 0, 0, jitter=False, shadow=False),
+)
+
+
+class QualityController:
+    def __init__(
+        self,
+        scheduler: FrameScheduler,
+        on_change: Callable[[QualityTier], None],
+        interval_ms: int = 250,
+        degrade_ms: float = 10.0,
+        restore_ms: float = 4.0,
+        degrade_after: int = 2,
+        restore_after: int = 8,
+        tiers: tuple[QualityTier, ...] = TIERS,
+    ) -> None:
+        self.scheduler = scheduler
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.degrade_ms = degrade_ms
+        self.restore_ms = restore_ms
+        self.degrade_after = degrade_after
+        self.restore_after = restore_after
+        self.tiers = tiers
+
+        self.level = 0
+        self.pinned = False
+        self._over = 0
+        self._under = 0
+        # Telemetry: số lần đổi bậc và các lần đổi gần đây (ms, bậc, tải).
+        self.changes = 0
+        self.history: deque[tuple[int, int, float]] = deque(maxlen=64)
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.level]
+
+    def load_ms(self) -> float:
+        return max(self.scheduler.lag_avg_ms, self.scheduler.work_avg_ms)
+
+    # ------------------------ Lifecycle ------------------------
+    def start(self) -> None:
+        self.on_change(self.tier)
+        self.scheduler.every("quality", self.interval_ms, self.check)
+
+    def stop(self) -> None:
+        self.scheduler.cancel("quality")
+
+    def pin(self, level: int | None) -> None:
+        """Giữ cố định một bậc (``None`` = trở lại tự động)."""
+        self.pinned = level is not None
+        if level is not None:
+            self.set_level(level)
+
+    # ------------------------ Control ------------------------
+    def check(self) -> None:
+        if self.pinned:
+            return
+        load = self.load_ms()
+        if load > self.degrade_ms:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.degrade_after and self.level < len(self.tiers) - 1:
+                self.set_level(self.level + 1, load)
+        elif load < self.restore_ms:
+            self._under += 1
+            self._over = 0
+            if self._under >= self.restore_after and self.level > 0:
+                self.set_level(self.level - 1, load)
+        else:
+            self._over = self._under = 0
+
+    def set_level(self, level: int, load: float | None = None) -> None:
+        level = max(0, min(level, len(self.tiers) - 1))
+        self._over = self._under = 0
+        if level == self.level:
+            return
+        self.level = level
+        self.changes += 1
+        self.history.append((self.scheduler.now(), level, self.load_ms() if load is None else load))
+        self.on_change(self.tier)
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "tier": self.level,
+            "tier_name": self.tier.name,
+            "load_ms": round(self.load_ms(), 2),
+            "changes": self.changes,
+            "pinned": self.pinned,
+        }
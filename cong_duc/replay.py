@@ -0,0 +1,308 @@
+"""Ghi và phát lại một ván game có level, tất định và headless.
+
+Một ván được xác định hoàn toàn bởi seed của GameEngine, kích thước khung và
+chuỗi sự kiện có mốc thời gian (tính từ lúc bắt đầu ván): tap, đổi kích thước
+khung và dấu mốc lên level để phát hiện lệch. Với luật thích ứng (độ khó đổi
+theo người chơi) thì luật của từng level cũng được ghi lại, vì không suy lại
+được từ level. Mỏ lướt (thay vì nhảy chỗ) được đánh dấu bằng một sự kiện ở
+đầu ván. Phát lại chỉ chạy engine trên
+đồng hồ ảo nên nhanh hơn thời gian thực hàng nghìn lần, đủ để kiểm tra điểm
+của cả loạt bài nộp bảng xếp hạng.
+
+Định dạng file (little-endian)::
+
+    header   <4sBQHHHH>  "CDRP", version, seed, width, height, targets, decoys
+    summary  <qHHB>      total_merit, level, level_score, finished
+    payload  <I> độ dài + zlib(các sự kiện <BIhh>: kind, t_ms, a, b)
+    crc32    <I>         của mọi byte phía trước
+
+    python -m cong_duc.replay verify ~/.cong_duc/replays/*.cdr
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cong_duc.engine import MOTION_TELEPORT, TAP_IGNORED, GameEngine, LevelRules
+from cong_duc.ledger import default_data_dir
+from cong_duc.spatial import TargetField
+
+MAGIC = b"CDRP"
+VERSION = 3
+# v1 không có sự kiện luật, v2 không có sự kiện di chuyển; vẫn đọc được.
+READABLE_VERSIONS = (1, 2, 3)
+HEADER = struct.Struct("<4sBQHHHH")
+SUMMARY = struct.Struct("<qHHB")
+LENGTH = struct.Struct("<I")
+EVENT = struct.Struct("<BIhh")
+
+# Loại sự kiện; a/b là (x, y), (width, height), (level, 0), (level, mục tiêu),
+# (số giây, nhịp Mỏ ms) hoặc (kiểu di chuyển, 0). Hai sự kiện luật luôn đi
+# liền nhau.
+EVENT_TAP = 0
+EVENT_RESIZE = 1
+EVENT_LEVEL = 2
+EVENT_RULES = 3
+EVENT_RULES_TIMING = 4
+EVENT_MOTION = 5
+
+Event = tuple[int, int, int, int]
+
+
+class ReplayError(ValueError):
+    """File replay hỏng, hoặc phát lại không khớp với điểm đã ghi."""
+
+
+def default_replay_dir() -> Path:
+    return default_data_dir() / "replays"
+
+
+@dataclass
+class Replay:
+    seed: int
+    width: int
+    height: int
+    targets: int = 0
+    decoys: int = 0
+    events: list[Event] = field(default_factory=list)
+    total_merit: int = 0
+    level: int = 1
+    level_score: int = 0
+    finished: bool = False
+
+    @property
+    def duration_ms(self) -> int:
+        return self.events[-1][1] if self.events else 0
+
+    def level_rules(self) -> dict[int, tuple[int, int, int]]:
+        """Luật đã ghi theo level: level -> (mục tiêu, số giây, nhịp Mỏ ms)."""
+        rules = {}
+        level = target = 0
+        for kind, _, a, b in self.events:
+            if kind == EVENT_RULES:
+                level, target = a, b
+            elif kind == EVENT_RULES_TIMING:
+                rules[level] = (target, a, b)
+        return rules
+
+    def motion(self) -> int:
+        """Kiểu di chuyển của Mỏ trong ván (mặc định nhảy chỗ)."""
+        for kind, _, a, _ in self.events:
+            if kind == EVENT_MOTION:
+                return a
+        return MOTION_TELEPORT
+
+    # ------------------------ Encoding ------------------------
+    def to_bytes(self) -> bytes:
+        pack = EVENT.pack
+        payload = zlib.compress(b"".join(pack(*event) for event in self.events), 6)
+        data = b"".join(
+            (
+                HEADER.pack(MAGIC, VERSION, self.seed, self.width, self.height, self.targets, self.decoys),
+                SUMMARY.pack(self.total_merit, self.level, self.level_score, self.finished),
+                LENGTH.pack(len(payload)),
+                payload,
+            )
+        )
+        return data + LENGTH.pack(zlib.crc32(data))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Replay:
+        fixed = HEADER.size + SUMMARY.size + LENGTH.size
+        if len(data) < fixed + LENGTH.size:
+            raise ReplayError("file replay quá ngắn")
+        (crc,) = LENGTH.unpack_from(data, len(data) - LENGTH.size)
+        if zlib.crc32(data[: -LENGTH.size]) != crc:
+            raise ReplayError("sai CRC, file replay bị hỏng")
+
+        magic, version, seed, width, height, targets, decoys = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version not in READABLE_VERSIONS:
+            raise ReplayError(f"không phải replay v{VERSION}")
+        total_merit, level, level_score, finished = SUMMARY.unpack_from(data, HEADER.size)
+        (length,) = LENGTH.unpack_from(data, HEADER.size + SUMMARY.size)
+        try:
+            raw = zlib.decompress(data[fixed : fixed + length])
+        except zlib.error as exc:
+            raise ReplayError("payload replay bị hỏng") from exc
+        if len(raw) % EVENT.size:
+            raise ReplayError("payload replay bị cắt dở")
+
+        return cls(
+            seed=seed,
+            width=width,
+            height=height,
+            targets=targets,
+            decoys=decoys,
+            events=list(EVENT.iter_unpack(raw)),
+            total_merit=total_merit,
+            level=level,
+            level_score=level_score,
+            finished=bool(finished),
+        )
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.to_bytes())
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> Replay:
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class ReplayRecorder:
+    """Ghi lại những gì một view đưa vào engine trong một ván.
+
+    View gọi start() thay cho ``engine.start_game``, rồi báo tap()/resize()
+    *sau* khi engine đã xử lý, để mốc thời gian là mốc engine thực sự dùng.
+    """
+
+    def __init__(self, engine: GameEngine) -> None:
+        self.engine = engine
+        self.replay: Replay | None = None
+        self._start_ms = 0
+        self._level = 1
+
+    def start(self, now: int, seed: int) -> None:
+        engine = self.engine
+        field = engine.field
+        # Số mục tiêu suy ra từ field: mục tiêu 0 là Mỏ chính.
+        decoys = sum(target.decoy for target in field.targets) if field else 0
+        targets = len(field.targets) - 1 - decoys if field else 0
+        self.replay = Replay(seed, engine.width, engine.height, targets, decoys)
+        self._start_ms = now
+        self._level = 1
+        engine.start_game(now, seed)
+        if engine.motion != MOTION_TELEPORT:
+            self.replay.events.append((EVENT_MOTION, 0, engine.motion, 0))
+        self._record_rules(0)
+
+    def _record_rules(self, t: int) -> None:
+        engine = self.engine
+        if engine.rules.adaptive:
+            self.replay.events.append((EVENT_RULES, t, engine.level, engine.target_score))
+            self.replay.events.append((EVENT_RULES_TIMING, t, engine.level_time, engine.move_interval_ms))
+
+    def tap(self, x: int, y: int, result: int) -> None:
+        """Ghi tap (toạ độ pixel nguyên) mà engine vừa chấm với kết quả ``result``."""
+        replay = self.replay
+        if replay is None or result == TAP_IGNORED:
+            return
+        t = self.engine.now - self._start_ms
+        replay.events.append((EVENT_TAP, t, int(x), int(y)))
+        if self.engine.level != self._level:
+            self._level = self.engine.level
+            replay.events.append((EVENT_LEVEL, t, self._level, 0))
+            self._record_rules(t)
+
+    def resize(self, width: int, height: int) -> None:
+        """Ghi lần đổi kích thước khung.
+
+        View phải advance() engine tới hiện tại trước khi đổi kích thước, để
+        mọi timer đến hạn đều chạy với khung cũ giống như lúc phát lại.
+        """
+        if self.replay is not None and self.engine.game_running:
+            self.replay.events.append((EVENT_RESIZE, self.engine.now - self._start_ms, width, height))
+
+    def finish(self) -> Replay | None:
+        """Chốt điểm cuối ván; trả về replay (None nếu chưa ghi gì)."""
+        replay, self.replay = self.replay, None
+        if replay is None:
+            return None
+        engine = self.engine
+        replay.total_merit = engine.total_merit
+        replay.level = engine.level
+        replay.level_score = engine.level_score
+        replay.finished = not engine.game_running
+        return replay
+
+
+# ------------------------ Playback ------------------------
+class RecordedRules(LevelRules):
+    """Luật lấy từ replay cho các level đã ghi, còn lại theo đường cong gốc."""
+
+    def __init__(self, levels: dict[int, tuple[int, int, int]]) -> None:
+        self.levels = levels
+
+    def get_level_target(self, level: int) -> int:
+        return self.levels[level][0] if level in self.levels else super().get_level_target(level)
+
+    def get_level_time(self, level: int) -> int:
+        return self.levels[level][1] if level in self.levels else super().get_level_time(level)
+
+    def get_move_interval_ms(self, level: int) -> int:
+        return self.levels[level][2] if level in self.levels else super().get_move_interval_ms(level)
+
+
+def play(replay: Replay) -> GameEngine:
+    """Phát lại headless; ném ReplayError nếu level đi lệch so với bản ghi."""
+    field = TargetField(replay.targets, replay.decoys) if replay.targets or replay.decoys else None
+    levels = replay.level_rules()
+    rules = RecordedRules(levels) if levels else None
+    engine = GameEngine(rules=rules, width=replay.width, height=replay.height, field=field, motion=replay.motion())
+    engine.set_field_size(replay.width, replay.height)
+    engine.start_game(0, replay.seed)
+
+    tap = engine.tap
+    for kind, t, a, b in replay.events:
+        if kind == EVENT_TAP:
+            tap(a, b, t)
+        elif kind == EVENT_LEVEL:
+            if engine.level != a:
+                raise ReplayError(f"lệch tại {t} ms: ghi level {a}, phát lại level {engine.level}")
+        elif kind == EVENT_RESIZE:
+            engine.advance(t)
+            engine.set_field_size(a, b)
+
+    if replay.finished:
+        # Không còn tap: chạy timer tới khi hết giờ.
+        while engine.game_running:
+            engine.advance(engine.next_deadline())
+    return engine
+
+
+def verify(replay: Replay) -> GameEngine:
+    """Phát lại và so điểm cuối với điểm đã ghi; ném ReplayError nếu khác."""
+    engine = play(replay)
+    got = (engine.total_merit, engine.level, engine.level_score)
+    want = (replay.total_merit, replay.level, replay.level_score)
+    if got != want:
+        raise ReplayError(f"điểm không khớp: ghi {want}, phát lại {got}")
+    return engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    verify_cmd = sub.add_parser("verify", help="phát lại và kiểm tra điểm")
+    verify_cmd.add_argument("paths", nargs="+", type=Path)
+    args = parser.parse_args()
+
+    bad = 0
+    played_ms = 0
+    start = time.perf_counter()
+    for path in args.paths:
+        try:
+            replay = Replay.load(path)
+            verify(replay)
+        except (OSError, ReplayError) as exc:
+            bad += 1
+            print(f"FAIL {path}: {exc}")
+            continue
+        played_ms += replay.duration_ms
+        print(f"ok   {path}: {replay.total_merit} công đức, level {replay.level}")
+    elapsed = time.perf_counter() - start
+    if elapsed > 0:
+        print(f"{len(args.paths)} replay trong {elapsed * 1000:.1f} ms (~{played_ms / 1000 / elapsed:.0f}x thời gian thực)")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Bộ lập lịch frame dùng chung, thay cho các chuỗi ``root.after`` rời rạc.
+
+Mọi hiệu ứng và timer đăng ký thành task có tên. Đăng ký lại cùng tên sẽ
+thay task cũ, nên bấm "Chơi lại" không còn chồng thêm vòng lặp. Tất cả task
+đến hạn được chạy chung trong một callback ``after`` duy nhất, căn theo lưới
+frame cố định trên đồng hồ monotonic nên không bị trôi theo thời gian.
+"""
+
+from __future__ import annotations
+
+import time
+import tkinter as tk
+from collections import deque
+from typing import Callable
+
+
+class _Task:
+    __slots__ = ("name", "due", "interval", "callback")
+
+    def __init__(self, name: str, due: int, interval: int, callback: Callable[[], object]) -> None:
+        self.name = name
+        self.due = due
+        self.interval = interval
+        self.callback = callback
+
+
+class FrameScheduler:
+    # Đồng hồ mặc định cho mọi scheduler; benchmark headless thay bằng đồng
+    # hồ ảo để chạy app nhanh hơn thời gian thực.
+    default_clock: Callable[[], float] = time.monotonic
+
+    def __init__(
+        self,
+        root: tk.Misc | None,
+        frame_ms: int = 16,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self.root = root
+        self.frame_ms = frame_ms
+        self.clock = clock or FrameScheduler.default_clock
+
+        self._tasks: dict[str, _Task] = {}
+        self._job: str | None = None
+        self._job_due: int | None = None
+        self._origin = self.now()
+
+        # Thống kê: số task chạy trong mỗi frame gần đây.
+        self.frames = 0
+        self.last_frame_tasks = 0
+        self.tasks_per_frame: deque[int] = deque(maxlen=240)
+        # Độ trễ event loop: callback after() chạy muộn bao nhiêu ms so với
+        # mốc đã hẹn, và thời gian chạy các task của frame đó.
+        self.lag_ms: deque[int] = deque(maxlen=240)
+        self.work_ms: deque[float] = deque(maxlen=240)
+        # Trung bình trượt (EWMA) của hai số đo trên; không bị ai xoá như
+        # hai deque nên bộ điều chỉnh chất lượng đọc được bất cứ lúc nào.
+        self.lag_avg_ms = 0.0
+        self.work_avg_ms = 0.0
+
+    def now(self) -> int:
+        return int(self.clock() * 1000)
+
+    # ------------------------ Tasks ------------------------
+    def every(self, name: str, interval_ms: int, callback: Callable[[], object], delay_ms: int | None = None) -> None:
+        """Chạy ``callback`` lặp lại mỗi ``interval_ms``; thay task cùng tên nếu có."""
+        due = self.now() + (interval_ms if delay_ms is None else delay_ms)
+        self._tasks[name] = _Task(name, due, max(1, interval_ms), callback)
+        self._arm()
+
+    def once(self, name: str, delay_ms: int, callback: Callable[[], object]) -> None:
+        """Chạy ``callback`` một lần sau ``delay_ms``; thay task cùng tên nếu có."""
+        self._tasks[name] = _Task(name, self.now() + max(0, delay_ms), 0, callback)
+        self._arm()
+
+    def cancel(self, name: str) -> None:
+        self._tasks.pop(name, None)
+
+    def is_scheduled(self, name: str) -> bool:
+        return name in self._tasks
+
+    @property
+    def task_count(self) -> int:
+        return len(self._tasks)
+
+    # ------------------------ Frame loop ------------------------
+    def run_frame(self, now: int | None = None) -> int:
+        """Chạy mọi task đến hạn tại ``now``; trả về số task đã chạy."""
+        if now is None:
+            now = self.now()
+        due = [task for task in self._tasks.values() if task.due <= now]
+        due.sort(key=lambda task: task.due)
+
+        ran = 0
+        for task in due:
+            # Task trước có thể đã hủy hoặc thay thế task này.
+            if self._tasks.get(task.name) is not task:
+                continue
+            if task.interval:
+                task.due += task.interval
+                if task.due <= now:
+                    # Trễ quá một chu kỳ (máy bận): bỏ nhịp lỡ thay vì chạy dồn.
+                    task.due = now + task.interval
+            else:
+                del self._tasks[task.name]
+            ran += 1
+            task.callback()
+
+        self.frames += 1
+        self.last_frame_tasks = ran
+        self.tasks_per_frame.append(ran)
+        return ran
+
+    def _on_frame(self) -> None:
+        now = self.now()
+        if self._job_due is not None:
+            lag = max(0, now - self._job_due)
+            self.lag_ms.append(lag)
+            self.lag_avg_ms += (lag - self.lag_avg_ms) * 0.2
+        self._job = None
+        self._job_due = None
+        start = time.perf_counter()
+        try:
+            self.run_frame(now)
+        finally:
+            work = (time.perf_counter() - start) * 1000
+            self.work_ms.append(work)
+            self.work_avg_ms += (work - self.work_avg_ms) * 0.2
+            self._arm()
+
+    def _arm(self) -> None:
+        # Hẹn đúng một callback tại mốc frame gần nhất chứa task sớm nhất.
+        if self.root is None or not self._tasks:
+            return
+        earliest = min(task.due for task in self._tasks.values())
+        frame = self.frame_ms
+        slot = self._origin + -(-(earliest - self._origin) // frame) * frame
+        if self._job is not None:
+            if self._job_due is not None and self._job_due <= slot:
+                return
+            self.root.after_cancel(self._job)
+        self._job_due = slot
+        self._job = self.root.after(max(0, slot - self.now()), self._on_frame)
+
+    def stop(self) -> None:
+        self._tasks.clear()
+        if self._job is not None and self.root is not None:
+            self.root.after_cancel(self._job)
+        self._job = None
+        self._job_due = None
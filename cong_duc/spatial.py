@@ -0,0 +1,141 @@
+"""Chỉ mục lưới đều cho hit-test nhiều mục tiêu (Mỏ thật và mồi nhử).
+
+Mỗi mục tiêu là một ellipse, được ghi vào mọi ô lưới mà khung bao của nó
+chạm tới. Tap chỉ cần xét các mục tiêu trong đúng một ô, và khi mục tiêu
+di chuyển thì chỉ các ô thực sự thay đổi mới được cập nhật.
+"""
+
+from __future__ import annotations
+
+import random
+
+
+class Target:
+    __slots__ = ("id", "cx", "cy", "rx", "ry", "z", "decoy", "cells")
+
+    def __init__(self, target_id: int, cx: float, cy: float, rx: float, ry: float, z: int, decoy: bool) -> None:
+        self.id = target_id
+        self.cx = cx
+        self.cy = cy
+        self.rx = rx
+        self.ry = ry
+        self.z = z
+        self.decoy = decoy
+        self.cells: tuple[int, ...] = ()
+
+    def contains(self, x: float, y: float) -> bool:
+        dx = (x - self.cx) / self.rx
+        dy = (y - self.cy) / self.ry
+        return dx * dx + dy * dy <= 1.0
+
+
+class UniformGrid:
+    # Khóa ô được gói thành một số nguyên: ix * _STRIDE + iy + _OFFSET.
+    _STRIDE = 1 << 16
+    _OFFSET = 1 << 15
+
+    def __init__(self, cell_size: int = 128) -> None:
+        self.cell_size = cell_size
+        self._cells: dict[int, set[Target]] = {}
+        self.cell_updates = 0
+
+    def _cells_for(self, target: Target) -> tuple[int, ...]:
+        size = self.cell_size
+        x0 = int((target.cx - target.rx) // size)
+        x1 = int((target.cx + target.rx) // size)
+        y0 = int((target.cy - target.ry) // size)
+        y1 = int((target.cy + target.ry) // size)
+        stride = self._STRIDE
+        offset = self._OFFSET
+        return tuple(ix * stride + iy + offset for ix in range(x0, x1 + 1) for iy in range(y0, y1 + 1))
+
+    def insert(self, target: Target) -> None:
+        target.cells = self._cells_for(target)
+        for key in target.cells:
+            self._cells.setdefault(key, set()).add(target)
+
+    def remove(self, target: Target) -> None:
+        for key in target.cells:
+            bucket = self._cells.get(key)
+            if bucket is not None:
+                bucket.discard(target)
+                if not bucket:
+                    del self._cells[key]
+        target.cells = ()
+
+    def move(self, target: Target, cx: float, cy: float) -> None:
+        target.cx = cx
+        target.cy = cy
+        new_cells = self._cells_for(target)
+        old_cells = target.cells
+        if new_cells == old_cells:
+            return
+        # Chỉ sửa các ô bị rời đi / mới chạm tới.
+        for key in set(old_cells).difference(new_cells):
+            bucket = self._cells[key]
+            bucket.discard(target)
+            if not bucket:
+                del self._cells[key]
+        for key in set(new_cells).difference(old_cells):
+            self._cells.setdefault(key, set()).add(target)
+        target.cells = new_cells
+        self.cell_updates += 1
+
+    def query(self, x: float, y: float) -> Target | None:
+        """Mục tiêu trên cùng (z lớn nhất) chứa điểm (x, y), hoặc None."""
+        size = self.cell_size
+        bucket = self._cells.get(int(x // size) * self._STRIDE + int(y // size) + self._OFFSET)
+        if not bucket:
+            return None
+        best = None
+        for target in bucket:
+            if (best is None or target.z > best.z) and target.contains(x, y):
+                best = target
+        return best
+
+
+class TargetField:
+    """Tập mục tiêu của chế độ nhiều Mỏ; mục tiêu 0 luôn là Mỏ chính."""
+
+    def __init__(
+        self,
+        targets: int = 12,
+        decoys: int = 4,
+        main_radius: tuple[int, int] = (170, 86),
+        target_radius: tuple[int, int] = (60, 30),
+        cell_size: int = 128,
+    ) -> None:
+        self.grid = UniformGrid(cell_size)
+        self.targets: list[Target] = []
+        for i in range(1 + targets + decoys):
+            rx, ry = main_radius if i == 0 else target_radius
+            # Mục tiêu thêm sau nằm trên; mồi nhử được vẽ trên cùng.
+            target = Target(i, 0.0, 0.0, rx, ry, z=i, decoy=i > targets)
+            self.targets.append(target)
+            self.grid.insert(target)
+
+    @property
+    def main(self) -> Target:
+        return self.targets[0]
+
+    def scatter(self, rng: random.Random, width: int, height: int) -> None:
+        """Dời mọi mục tiêu tới vị trí ngẫu nhiên nằm trọn trong khung."""
+        rand = rng.random
+        move = self.grid.move
+        for target in self.targets:
+            min_x = target.rx + 30
+            min_y = target.ry + 30
+            span_x = max(0, width - 2 * min_x) + 1
+            span_y = max(0, height - 2 * min_y) + 1
+            move(target, min_x + int(rand() * span_x), min_y + int(rand() * span_y))
+
+    def hit_test(self, x: float, y: float) -> Target | None:
+        return self.grid.query(x, y)
+
+    def hit_test_linear(self, x: float, y: float) -> Target | None:
+        """Quét tuyến tính, chỉ để đối chiếu/benchmark với lưới."""
+        best = None
+        for target in self.targets:
+            if (best is None or target.z > best.z) and target.contains(x, y):
+                best = target
+        return best
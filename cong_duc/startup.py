@@ -0,0 +1,24 @@
+"""Đo các mốc khởi động (``--profile-startup``) và in bảng thời gian từng pha."""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TextIO
+
+
+class StartupTimer:
+    def __init__(self, origin: float | None = None) -> None:
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks: list[tuple[str, float]] = []
+
+    def mark(self, phase: str) -> None:
+        self.marks.append((phase, time.perf_counter()))
+
+    def report(self, out: TextIO | None = None) -> None:
+        out = out or sys.stderr
+        print(f"{'pha khởi động':<34}{'ms':>8}{'cộng dồn':>10}", file=out)
+        previous = self.origin
+        for phase, at in sorted(self.marks, key=lambda mark: mark[1]):
+            print(f"{phase:<34}{(at - previous) * 1000:>8.1f}{(at - self.origin) * 1000:>10.1f}", file=out)
+            previous = at
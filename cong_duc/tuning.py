@@ -0,0 +1,234 @@
+"""Mô phỏng Monte Carlo dạng vector để chỉnh đường cong độ khó.
+
+Hàng triệu hồ sơ người chơi (tỉ lệ trúng, tap/giây, thời gian phản xạ) được
+cho chơi qua luật của LevelRules cùng lúc bằng các phép toán mảng NumPy:
+mỗi bước lặp là một tap của *mọi* người chơi còn đang ở trong level. Kết quả
+là bảng tỉ lệ qua màn theo level, có thể tách theo nhóm tỉ lệ trúng.
+
+Mô hình bám theo GameEngine và ``simulated_player``: countdown trừ 1 giây
+ngay khi vào level rồi cứ mỗi giây, trượt trừ 2 giây, mỗi hit thứ 5 liên tiếp
+được thêm 1 điểm, và người chơi chỉ nhìn lại vị trí Mỏ sau mỗi
+``reaction_ms`` nên tap ngay sau khi Mỏ nhảy chỗ (hoặc sang level) nhắm vào
+chỗ cũ, chỉ trúng nếu chỗ mới tình cờ còn phủ lên đó.
+
+    python -m cong_duc.tuning --players 1000000 --levels 20 --tiers 4
+
+Độ khớp với GameEngine thật được kiểm bằng ``python -m benchmarks.bench_tuning``.
+
+Cần NumPy (không bắt buộc để chơi game).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+
+from cong_duc.engine import COMBO_BONUS_EVERY, COUNTDOWN_MS, MISS_PENALTY_S, GameEngine, LevelRules
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - chỉ khi thiếu NumPy
+    np = None  # type: ignore[assignment]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise SystemExit("cong_duc.tuning cần NumPy: pip install numpy")
+
+
+@dataclass
+class Profiles:
+    hit_rate: np.ndarray
+    taps_per_second: np.ndarray
+    reaction_ms: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.hit_rate)
+
+
+def sample_profiles(count: int, seed: int = 0) -> Profiles:
+    """Sinh hồ sơ người chơi ngẫu nhiên theo phân phối ước lượng."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    return Profiles(
+        hit_rate=np.clip(rng.beta(8.0, 2.0, count), 0.05, 0.99).astype(np.float32),
+        taps_per_second=np.clip(rng.lognormal(np.log(5.0), 0.35, count), 1.0, 15.0).astype(np.float32),
+        reaction_ms=np.clip(rng.normal(250.0, 60.0, count), 120.0, 600.0).astype(np.float32),
+    )
+
+
+def stale_hit_chance(width: int = 980, height: int = 440, samples: int = 1_000_000, seed: int = 0) -> tuple[float, float]:
+    """Xác suất tap nhắm vào vị trí cũ vẫn trúng sau khi Mỏ nhảy chỗ.
+
+    Trả về (nhắm đúng chỗ cũ, nhắm lệch như ``simulated_player`` khi trượt),
+    ước lượng bằng vùng sinh Mỏ của GameEngine với khung ``width`` x ``height``.
+    """
+    _require_numpy()
+    engine = GameEngine(width=width, height=height)
+    rng = np.random.default_rng(seed)
+
+    def positions() -> tuple[np.ndarray, np.ndarray]:
+        x = engine._min_x + np.floor(rng.random(samples) * engine._span_x)
+        y = engine._min_y + np.floor(rng.random(samples) * engine._span_y)
+        return x, y
+
+    old_x, old_y = positions()
+    new_x, new_y = positions()
+    dy = ((old_y - new_y) / engine.body_ry) ** 2
+    aimed = ((old_x - new_x) / engine.body_rx) ** 2 + dy <= 1.0
+    offset = ((old_x + 2 * engine.body_rx - new_x) / engine.body_rx) ** 2 + dy <= 1.0
+    return float(aimed.mean()), float(offset.mean())
+
+
+def simulate_levels(
+    profiles: Profiles,
+    rules: LevelRules | None = None,
+    max_level: int = 20,
+    seed: int = 0,
+    field_size: tuple[int, int] = (980, 440),
+) -> np.ndarray:
+    """Trả về số level mỗi người chơi vượt qua (0..max_level)."""
+    _require_numpy()
+    rules = rules or LevelRules()
+    rng = np.random.default_rng(seed)
+    stale_aimed, stale_offset = stale_hit_chance(*field_size, seed=seed)
+    cleared = np.zeros(len(profiles), dtype=np.int16)
+    interval = (1000.0 / profiles.taps_per_second).astype(np.float32)
+    # Thời điểm người chơi nhìn lại Mỏ gần nhất, và mốc trạng thái Mỏ mà lần
+    # nhìn đó thấy (tap trước), tính tương đối so với đầu level hiện tại.
+    # Mốc 0 là chỗ start_level vừa đặt, mốc âm là chỗ của level trước.
+    seen_at = np.zeros(len(profiles), dtype=np.float32)
+    seen_state = np.zeros(len(profiles), dtype=np.float32)
+
+    alive = np.arange(len(profiles))
+    for level in range(1, max_level + 1):
+        if alive.size == 0:
+            break
+        target = rules.get_level_target(level)
+        seconds = rules.get_level_time(level)
+        move_ms = rules.get_move_interval_ms(level)
+
+        # Cột trạng thái của những người còn trong level; nén lại mỗi khi
+        # có người thắng/thua để các bước sau chỉ tính trên phần còn lại.
+        idx = alive
+        p = profiles.hit_rate[idx]
+        step = interval[idx]
+        react = profiles.reaction_ms[idx]
+        looked = seen_at[idx]
+        state = seen_state[idx]
+        score = np.zeros(idx.size, dtype=np.int32)
+        combo = np.zeros(idx.size, dtype=np.int32)
+        misses = np.zeros(idx.size, dtype=np.int32)
+        # Chỗ đang nhìn và chỗ Mỏ đang ở (theo nhịp nhảy) lúc rút ``overlap``.
+        last_view = np.full(idx.size, -3, dtype=np.int32)
+        last_epoch = np.full(idx.size, -3, dtype=np.int32)
+        overlap = np.zeros(idx.size, dtype=np.float32)
+        winners = []
+        tap = 0
+
+        while idx.size:
+            tap += 1
+            t = step * tap
+            # Tick thứ k (t = k giây) thấy time_left = seconds - k - 2*misses;
+            # còn <= 0 thì hết giờ trước khi tap này kịp tới.
+            ticks = (t // COUNTDOWN_MS).astype(np.int32)
+            timed_out = seconds - ticks - MISS_PENALTY_S * misses <= 0
+            playing = ~timed_out
+
+            refresh = t - looked >= react
+            looked = np.where(refresh, t, looked)
+            state = np.where(refresh, t - step, state)
+            # Nhịp k: Mỏ ở chỗ của lần nhảy lúc k * move_ms. Lần nhảy đầu tiên
+            # (mốc 0) chỉ chạy ở advance() của tap đầu tiên trong level, sau
+            # khi start_level đã đặt Mỏ, nên lần nhìn ở mốc 0 thấy chỗ -1 (cũ).
+            epoch = (t // move_ms).astype(np.int32)
+            view = np.where(state > 0, state // move_ms, np.where(state == 0, -1, -2)).astype(np.int32)
+            fresh = view == epoch
+
+            # Tap nhắm chỗ cũ trúng hay không chỉ phụ thuộc cặp (chỗ đang nhìn,
+            # chỗ Mỏ đang ở): các tap cùng cặp cùng kết quả, nên chỉ rút lại
+            # khi một trong hai đổi. Trúng khi nhắm đúng và khi nhắm lệch là
+            # hai vùng rời nhau nên dùng chung một số ngẫu nhiên.
+            changed = (view != last_view) | (epoch != last_epoch)
+            overlap = np.where(changed, rng.random(idx.size, dtype=np.float32), overlap)
+            last_view, last_epoch = view, epoch
+
+            aim = rng.random(idx.size, dtype=np.float32) < p
+            luck = np.where(aim, overlap < stale_aimed, overlap >= 1.0 - stale_offset)
+            hit = playing & np.where(fresh, aim, luck)
+            missed = playing & ~hit
+            combo = np.where(hit, combo + 1, 0)
+            # Ép sang int trước khi cộng: bool + bool của NumPy là phép OR.
+            score += hit.astype(np.int32) + (hit & (combo % COMBO_BONUS_EVERY == 0))
+            misses += missed
+            # Trượt đẩy time_left (đã trừ tick hiện tại) về 0 là thua ngay.
+            missed &= seconds - 1 - ticks - MISS_PENALTY_S * misses <= 0
+
+            won = score >= target
+            done = won | timed_out | missed
+            if done.any():
+                winners.append(idx[won])
+                # Level mới bắt đầu tại tap thắng: dời mốc về đầu level đó.
+                seen_at[idx[won]] = looked[won] - t[won]
+                seen_state[idx[won]] = state[won] - t[won]
+                keep = ~done
+                idx, p, step, react = idx[keep], p[keep], step[keep], react[keep]
+                looked, state = looked[keep], state[keep]
+                last_view, last_epoch, overlap = last_view[keep], last_epoch[keep], overlap[keep]
+                score, combo, misses = score[keep], combo[keep], misses[keep]
+
+        alive = np.concatenate(winners)
+        cleared[alive] = level
+
+    return cleared
+
+
+def pass_rate_table(cleared: np.ndarray, max_level: int) -> list[tuple[int, int, int, float]]:
+    """(level, số người vào, số người qua, tỉ lệ qua) cho từng level."""
+    counts = np.bincount(cleared, minlength=max_level + 1)
+    # reached[L] = số người vượt được ít nhất L - 1 level.
+    at_least = counts[::-1].cumsum()[::-1]
+    rows = []
+    for level in range(1, max_level + 1):
+        reached = int(at_least[level - 1])
+        passed = int(at_least[level])
+        rows.append((level, reached, passed, passed / reached if reached else 0.0))
+    return rows
+
+
+def format_table(rows: list[tuple[int, int, int, float]]) -> str:
+    lines = [f"{'level':>5}{'reached':>11}{'passed':>11}{'pass %':>9}"]
+    for level, reached, passed, rate in rows:
+        if reached:
+            lines.append(f"{level:>5}{reached:>11}{passed:>11}{rate * 100:>8.1f}%")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=1_000_000)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--tiers", type=int, default=0, help="tách bảng theo N nhóm tỉ lệ trúng")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    _require_numpy()
+
+    profiles = sample_profiles(args.players, seed=args.seed)
+    start = time.perf_counter()
+    cleared = simulate_levels(profiles, max_level=args.levels, seed=args.seed + 1)
+    elapsed = time.perf_counter() - start
+    print(f"{args.players} người chơi, {args.levels} level: {elapsed:.2f} s")
+    print(format_table(pass_rate_table(cleared, args.levels)))
+
+    if args.tiers > 1:
+        edges = np.quantile(profiles.hit_rate, np.linspace(0, 1, args.tiers + 1))
+        tier = np.clip(np.searchsorted(edges, profiles.hit_rate, side="right") - 1, 0, args.tiers - 1)
+        for i in range(args.tiers):
+            mask = tier == i
+            print(f"\nhit rate {edges[i]:.2f}-{edges[i + 1]:.2f} ({int(mask.sum())} người)")
+            print(format_table(pass_rate_table(cleared[mask], args.levels)))
+
+
+if __name__ == "__main__":
+    main()
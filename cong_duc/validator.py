@@ -0,0 +1,215 @@
+"""Kiểm tra luồng tap phía server theo đúng luật của GameEngine.
+
+Client gửi luồng sự kiện theo phiên ``(session, t_ms, kind, value)``:
+START, HIT (value = công đức client tự tính), MISS và END (value = tổng công
+đức client khai). Validator không cần vị trí Mỏ: nó chỉ kiểm tra những gì
+luật chơi bắt buộc phải đúng, mỗi sự kiện O(1) và mỗi phiên chỉ giữ vài số
+nguyên, nên chạy được hàng triệu phiên trong bộ nhớ cố định:
+
+- thời gian không chạy lùi và tốc độ tap không vượt giới hạn người
+  (GCRA: một mốc "thời điểm đến lý thuyết" thay cho cả cửa sổ tap);
+- công đức mỗi hit khớp combo (hit thứ 5 liên tiếp được 2), trượt reset combo
+  và trừ 2 giây;
+- không có tap sau khi level hết giờ, đủ điểm thì lên level đúng lúc;
+- tổng khai báo ở END bằng tổng đã cộng.
+
+Phiên không bao giờ gửi END (đóng tab, rớt mạng) không được giữ mãi: số
+phiên đang mở bị chặn ở ``max_sessions``, vượt thì một lượt quét bỏ một phần
+tư số phiên im lâu nhất (xấp xỉ LRU, mỗi sự kiện chỉ ghi thêm một số nguyên);
+sự kiện đến sau của phiên đã bị bỏ được coi là phiên chưa START.
+
+Phiên bị từ chối giữ mã lý do; muốn chắc chắn tuyệt đối thì phát lại replay
+(``cong_duc.replay.verify``) cho các phiên lọt qua bước lọc rẻ này.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from cong_duc.engine import COMBO_BONUS_EVERY, COUNTDOWN_MS, MISS_PENALTY_S, LevelRules
+
+# Loại sự kiện
+EVENT_START = 0
+EVENT_HIT = 1
+EVENT_MISS = 2
+EVENT_END = 3
+
+# Kết quả; khác OK nghĩa là phiên bị từ chối với lý do tương ứng.
+OK = 0
+REJECT_UNKNOWN_SESSION = 1
+REJECT_TIME_BACKWARDS = 2
+REJECT_TAP_RATE = 3
+REJECT_TIME_UP = 4
+REJECT_GAIN = 5
+REJECT_TOTAL = 6
+
+REASONS = {
+    REJECT_UNKNOWN_SESSION: "phiên chưa START",
+    REJECT_TIME_BACKWARDS: "thời gian chạy lùi",
+    REJECT_TAP_RATE: "tap nhanh hơn người",
+    REJECT_TIME_UP: "tap sau khi hết giờ",
+    REJECT_GAIN: "công đức không khớp combo",
+    REJECT_TOTAL: "tổng khai báo sai",
+}
+
+Event = tuple[int, int, int, int]
+
+
+class _Session:
+    __slots__ = (
+        "seen",
+        "last_t",
+        "tat",
+        "level",
+        "level_start",
+        "level_score",
+        "target",
+        "seconds",
+        "misses",
+        "combo",
+        "total",
+        "verdict",
+    )
+
+    def __init__(self, t: int) -> None:
+        self.last_t = t
+        self.tat = t
+        self.level = 0
+        self.total = 0
+        self.verdict = OK
+
+
+class TapValidator:
+    def __init__(
+        self,
+        rules: LevelRules | None = None,
+        max_taps_per_second: float = 20.0,
+        burst: int = 8,
+        max_sessions: int = 1_000_000,
+    ) -> None:
+        self.rules = rules or LevelRules()
+        self.emission_ms = 1000.0 / max_taps_per_second
+        # Cho phép dồn tối đa ``burst`` tap sát nhau trước khi tính là quá nhanh.
+        self.tolerance_ms = self.emission_ms * burst
+        self.max_sessions = max_sessions
+        self.sessions: dict[int, _Session] = {}
+
+        self.events = 0
+        self.accepted = 0
+        self.evicted = 0
+        self.rejected: dict[int, int] = dict.fromkeys(REASONS, 0)
+
+    def _start_level(self, state: _Session, level: int, now: int) -> None:
+        rules = self.rules
+        state.level = level
+        state.level_start = now
+        state.level_score = 0
+        state.target = rules.get_level_target(level)
+        state.seconds = rules.get_level_time(level)
+        state.misses = 0
+        state.combo = 0
+
+    def _evict_idle(self) -> None:
+        """Bỏ một phần tư số phiên có sự kiện cuối (``seen``) cũ nhất."""
+        sessions = self.sessions
+        keep = self.max_sessions * 3 // 4
+        cutoff = sorted(state.seen for state in sessions.values())[len(sessions) - keep - 1]
+        idle = [session for session, state in sessions.items() if state.seen <= cutoff]
+        for session in idle:
+            del sessions[session]
+        self.evicted += len(idle)
+
+    def _reject(self, session: int, state: _Session | None, reason: int) -> int:
+        if state is None:
+            self.rejected[reason] += 1
+            return reason
+        if state.verdict == OK:
+            state.verdict = reason
+            self.rejected[reason] += 1
+        return state.verdict
+
+    def feed(self, session: int, t: int, kind: int, value: int = 0) -> int:
+        """Xử lý một sự kiện; trả về OK hoặc mã lý do phiên bị từ chối."""
+        self.events += 1
+        sessions = self.sessions
+        if kind == EVENT_START:
+            state = sessions[session] = _Session(t)
+            state.seen = self.events
+            self._start_level(state, 1, t)
+            if len(sessions) > self.max_sessions:
+                self._evict_idle()
+            return OK
+
+        state = sessions.get(session)
+        if state is None:
+            return self._reject(session, None, REJECT_UNKNOWN_SESSION)
+        if kind == EVENT_END:
+            del sessions[session]
+            if state.verdict == OK and value != state.total:
+                return self._reject(session, state, REJECT_TOTAL)
+            if state.verdict == OK:
+                self.accepted += 1
+            return state.verdict
+        state.seen = self.events
+        if state.verdict != OK:
+            return state.verdict
+
+        if t < state.last_t:
+            return self._reject(session, state, REJECT_TIME_BACKWARDS)
+        state.last_t = t
+        # GCRA: mỗi tap đẩy mốc tat thêm một khoảng tối thiểu; tat vượt quá
+        # hiện tại hơn mức cho phép nghĩa là tap dồn dập hơn tay người.
+        tat = max(state.tat, t) + self.emission_ms
+        if tat - t > self.tolerance_ms:
+            return self._reject(session, state, REJECT_TAP_RATE)
+        state.tat = tat
+
+        # Giống countdown của engine: ở giây thứ k của level còn
+        # seconds - k - 2*misses; về 0 thì level đã kết thúc trước tap này.
+        elapsed_s = (t - state.level_start) // COUNTDOWN_MS
+        if state.seconds - elapsed_s - MISS_PENALTY_S * state.misses <= 0:
+            return self._reject(session, state, REJECT_TIME_UP)
+
+        if kind == EVENT_HIT:
+            combo = state.combo + 1
+            gain = 2 if combo % COMBO_BONUS_EVERY == 0 else 1
+            if value != gain:
+                return self._reject(session, state, REJECT_GAIN)
+            state.combo = combo
+            state.total += gain
+            state.level_score += gain
+            if state.level_score >= state.target:
+                self._start_level(state, state.level + 1, t)
+        else:
+            state.combo = 0
+            state.misses += 1
+            # Trượt đẩy time_left (đã trừ giây hiện tại) về 0: engine kết
+            # thúc level ngay, mọi tap sau đó đều không hợp lệ.
+            if state.seconds - 1 - elapsed_s - MISS_PENALTY_S * state.misses <= 0:
+                state.seconds = 0
+        return OK
+
+    def feed_many(self, events: Iterable[Event]) -> int:
+        """Đưa cả luồng sự kiện (nhiều phiên xen kẽ); trả về số sự kiện."""
+        feed = self.feed
+        count = 0
+        for session, t, kind, value in events:
+            feed(session, t, kind, value)
+            count += 1
+        return count
+
+
+def session_events(engine_taps: Iterable[tuple[int, int]], start_ms: int = 0) -> list[tuple[int, int, int]]:
+    """Chuyển luồng ``(t_ms, gain)`` của GameEngine (gain 0 = trượt) thành
+    các sự kiện ``(t_ms, kind, value)`` của một phiên, kèm START/END."""
+    events = [(start_ms, EVENT_START, 0)]
+    total = 0
+    t = start_ms
+    for t, gain in engine_taps:
+        if gain:
+            events.append((t, EVENT_HIT, gain))
+            total += gain
+        else:
+            events.append((t, EVENT_MISS, 0))
+    events.append((t, EVENT_END, total))
+    return events